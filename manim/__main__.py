@@ -4,6 +4,7 @@ import click
 from click_default_group import DefaultGroup
 
 from . import __version__, console
+from .cli.cache.group import cache
 from .cli.cfg.group import cfg
 from .cli.init.commands import init
 from .cli.new.group import new
@@ -41,6 +42,7 @@ def main(ctx):
     pass
 
 
+main.add_command(cache)
 main.add_command(cfg)
 main.add_command(plugins)
 main.add_command(init)
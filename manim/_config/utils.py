@@ -241,6 +241,7 @@ class ManimConfig(MutableMapping):
         "assets_dir",
         "background_color",
         "background_opacity",
+        "copy_on_write",
         "custom_folders",
         "disable_caching",
         "ffmpeg_loglevel",
@@ -252,16 +253,22 @@ class ManimConfig(MutableMapping):
         "frame_x_radius",
         "frame_y_radius",
         "from_animation_number",
+        "hashing_backend",
         "images_dir",
         "input_file",
         "media_width",
         "webgl_renderer_path",
         "log_dir",
         "log_to_file",
+        "max_cache_bytes",
         "max_files_cached",
+        "max_svg_cache_bytes",
+        "max_texture_cache_bytes",
         "media_dir",
         "movie_file_extension",
         "notify_outdated_version",
+        "opengl_backend",
+        "opengl_samples",
         "output_file",
         "partial_movie_dir",
         "pixel_height",
@@ -270,6 +277,7 @@ class ManimConfig(MutableMapping):
         "png_mode",
         "preview",
         "progress_bar",
+        "remote_cache",
         "save_as_gif",
         "save_last_frame",
         "save_pngs",
@@ -278,18 +286,22 @@ class ManimConfig(MutableMapping):
         "tex_dir",
         "tex_template_file",
         "text_dir",
+        "texture_mipmaps",
         "upto_animation_number",
         "renderer",
         "use_opengl_renderer",
         "use_webgl_renderer",
         "verbosity",
         "video_dir",
+        "workers",
         "write_all",
         "write_to_movie",
     }
 
     def __init__(self) -> None:
-        self._d = {k: None for k in self._OPTS}
+        # Sorted so that the options are always in the same order, which keeps
+        # the hashes of the objects referring to the config stable across runs.
+        self._d = {k: None for k in sorted(self._OPTS)}
 
     # behave like a dict
     def __iter__(self) -> typing.Iterator[str]:
@@ -509,6 +521,8 @@ class ManimConfig(MutableMapping):
             "custom_folders",
             "use_opengl_renderer",
             "use_webgl_renderer",
+            "texture_mipmaps",
+            "copy_on_write",
         ]:
             setattr(self, key, parser["CLI"].getboolean(key, fallback=False))
 
@@ -517,6 +531,11 @@ class ManimConfig(MutableMapping):
             "from_animation_number",
             "upto_animation_number",
             "max_files_cached",
+            "max_cache_bytes",
+            "max_svg_cache_bytes",
+            "max_texture_cache_bytes",
+            "opengl_samples",
+            "workers",
             # the next two must be set BEFORE digesting frame_width and frame_height
             "pixel_height",
             "pixel_width",
@@ -541,9 +560,18 @@ class ManimConfig(MutableMapping):
             "background_color",
             "renderer",
             "webgl_renderer_path",
+            "remote_cache",
         ]:
             setattr(self, key, parser["CLI"].get(key, fallback="", raw=True))
 
+        val = parser["CLI"].get("hashing_backend")
+        if val:
+            self.hashing_backend = val
+
+        val = parser["CLI"].get("opengl_backend")
+        if val:
+            self.opengl_backend = val
+
         # float keys
         for key in [
             "background_opacity",
@@ -638,6 +666,10 @@ class ManimConfig(MutableMapping):
             "background_color",
             "use_opengl_renderer",
             "use_webgl_renderer",
+            "opengl_backend",
+            "opengl_samples",
+            "workers",
+            "remote_cache",
         ]:
             if hasattr(args, key):
                 attr = getattr(args, key)
@@ -969,6 +1001,63 @@ class ManimConfig(MutableMapping):
         doc="Maximum number of files cached.  Use -1 for infinity (no flag).",
     )
 
+    workers = property(
+        lambda self: self._d["workers"],
+        lambda self, val: self._set_pos_number("workers", val, False),
+        doc="Number of processes rendering the scenes of a file, or the animations of a single scene (--workers).",
+    )
+
+    remote_cache = property(
+        lambda self: self._d["remote_cache"],
+        lambda self, val: self._d.__setitem__("remote_cache", val),
+        doc="Path or URL of a cache of partial movie files shared between "
+        "machines (empty to disable).",
+    )
+
+    max_cache_bytes = property(
+        lambda self: self._d["max_cache_bytes"],
+        lambda self, val: self._set_pos_number("max_cache_bytes", val, True),
+        doc="Maximum total size in bytes of the partial movie files cached in the media directory.  Use -1 for infinity (no flag).",
+    )
+
+    max_svg_cache_bytes = property(
+        lambda self: self._d["max_svg_cache_bytes"],
+        lambda self, val: self._set_pos_number("max_svg_cache_bytes", val, True),
+        doc="Maximum total size of the SVG files kept parsed in memory.  Use -1 for infinity (no flag).",
+    )
+
+    max_texture_cache_bytes = property(
+        lambda self: self._d["max_texture_cache_bytes"],
+        lambda self, val: self._set_pos_number("max_texture_cache_bytes", val, True),
+        doc="Maximum total size of the textures the OpenGL renderer keeps in GPU memory.  Use -1 for infinity (no flag).",
+    )
+
+    opengl_backend = property(
+        lambda self: self._d["opengl_backend"],
+        lambda self, val: self._set_from_list(
+            "opengl_backend", val, ["auto", "default", "egl", "software"]
+        ),
+        doc="Backend of the OpenGL context when there is no preview window (--opengl_backend).",
+    )
+
+    opengl_samples = property(
+        lambda self: self._d["opengl_samples"],
+        lambda self, val: self._set_pos_number("opengl_samples", val, False),
+        doc="Number of samples per pixel of the OpenGL renderer without a preview window, 0 to disable multisampling (--opengl_samples).",
+    )
+
+    texture_mipmaps = property(
+        lambda self: self._d["texture_mipmaps"],
+        lambda self, val: self._set_boolean("texture_mipmaps", val),
+        doc="Whether the OpenGL renderer builds mipmaps of textures (no flag).",
+    )
+
+    copy_on_write = property(
+        lambda self: self._d["copy_on_write"],
+        lambda self, val: self._set_boolean("copy_on_write", val),
+        doc="Whether copies of mobjects share their arrays until they are changed (no flag).",
+    )
+
     flush_cache = property(
         lambda self: self._d["flush_cache"],
         lambda self, val: self._set_boolean("flush_cache", val),
@@ -981,6 +1070,14 @@ class ManimConfig(MutableMapping):
         doc="Whether to use scene caching.",
     )
 
+    hashing_backend = property(
+        lambda self: self._d["hashing_backend"],
+        lambda self, val: self._set_from_list(
+            "hashing_backend", val, ["json", "structural"]
+        ),
+        doc="Method used to hash play calls for scene caching; 'json' or 'structural' (no flag).",
+    )
+
     png_mode = property(
         lambda self: self._d["png_mode"],
         lambda self, val: self._set_from_list("png_mode", val, ["RGB", "RGBA"]),
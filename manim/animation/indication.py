@@ -642,7 +642,7 @@ class Wiggle(Animation):
     def interpolate_submobject(
         self, submobject: "Mobject", starting_submobject: "Mobject", alpha: float
     ) -> None:
-        submobject.points[:, :] = starting_submobject.points
+        submobject.get_writable_array("points")[:, :] = starting_submobject.points
         submobject.scale(
             interpolate(1, self.scale_value, there_and_back(alpha)),
             about_point=self.get_scale_about_point(),
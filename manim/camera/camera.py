@@ -8,6 +8,7 @@ import itertools as it
 import operator as op
 import pathlib
 import time
+import weakref
 from functools import reduce
 from typing import Union
 
@@ -29,6 +30,91 @@ from ..utils.iterables import list_difference_update
 from ..utils.simple_functions import fdiv
 from ..utils.space_ops import angle_of_vector
 
+# The default miter limit of cairo: the ratio between the length of a miter
+# join and the width of the line.
+CAIRO_MITER_LIMIT = 10
+
+
+def merge_rectangles(rectangles, max_rectangles=8):
+    """Merges overlapping rectangles, and all of them if there are too many.
+
+    Parameters
+    ----------
+    rectangles : List[Tuple[:class:`int`, :class:`int`, :class:`int`, :class:`int`]]
+        The left, top, right and bottom bounds of the rectangles.
+    max_rectangles : :class:`int`, optional
+        The maximum number of rectangles to return.
+
+    Returns
+    -------
+    List[Tuple[:class:`int`, :class:`int`, :class:`int`, :class:`int`]]
+        Rectangles covering the same regions.
+    """
+    merged = []
+    for rectangle in sorted(rectangles):
+        x0, y0, x1, y1 = rectangle
+        for i, (mx0, my0, mx1, my1) in enumerate(merged):
+            if x0 <= mx1 and mx0 <= x1 and y0 <= my1 and my0 <= y1:
+                merged[i] = (min(x0, mx0), min(y0, my0), max(x1, mx1), max(y1, my1))
+                break
+        else:
+            merged.append(rectangle)
+        if len(merged) > max_rectangles:
+            return [
+                (
+                    min(r[0] for r in rectangles),
+                    min(r[1] for r in rectangles),
+                    max(r[2] for r in rectangles),
+                    max(r[3] for r in rectangles),
+                )
+            ]
+    return merged
+
+
+def points_are_equal_2d(points0, points1, atol):
+    """Checks which pairs of points are equal in the plane, in the same way as
+    :meth:`~.VMobject.consider_points_equals_2d`.
+
+    Parameters
+    ----------
+    points0, points1 : np.ndarray
+        The points to compare, pairwise.
+    atol : :class:`float`
+        The absolute tolerance.
+
+    Returns
+    -------
+    np.ndarray
+        Whether each pair of points is equal.
+    """
+    rtol = 1.0e-5  # default from np.isclose()
+    difference = np.abs(points0[:, :2] - points1[:, :2])
+    return np.all(difference <= atol + rtol * np.abs(points1[:, :2]), axis=1)
+
+
+def get_subpath_split_indices(points, n_points_per_curve, atol):
+    """Computes where the subpaths of a vmobject start, in the same way as
+    :meth:`~.VMobject.gen_subpaths_from_points_2d`.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        The points of the vmobject.
+    n_points_per_curve : :class:`int`
+        The number of points of each curve.
+    atol : :class:`float`
+        The tolerance for two points to be considered equal.
+
+    Returns
+    -------
+    np.ndarray
+        The index of the first point of each subpath, followed by the number
+        of points.
+    """
+    curve_starts = np.arange(n_points_per_curve, len(points), n_points_per_curve)
+    breaks = ~points_are_equal_2d(points[curve_starts - 1], points[curve_starts], atol)
+    return np.concatenate([[0], curve_starts[breaks], [len(points)]])
+
 
 class Camera:
     """Base camera class.
@@ -45,6 +131,11 @@ class Camera:
     pixel_height : :class:`int`, optional
         The height of the scene in pixels.
 
+    use_dirty_rectangles : :class:`bool`, optional
+        Whether to only restore the regions of the frame where mobjects were
+        drawn when setting the frame back to the background it was set from,
+        instead of copying the whole background.
+
     """
 
     def __init__(
@@ -63,6 +154,7 @@ class Camera:
         frame_height=None,
         frame_width=None,
         frame_rate=None,
+        use_dirty_rectangles=True,
         **kwargs,
     ):
         """Initialises the Camera.
@@ -83,6 +175,7 @@ class Camera:
         self.cairo_line_width_multiple = cairo_line_width_multiple
         self.use_z_index = use_z_index
         self.background = background
+        self.use_dirty_rectangles = use_dirty_rectangles
 
         if pixel_height is None:
             pixel_height = config["pixel_height"]
@@ -113,6 +206,9 @@ class Camera:
 
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        # The cairo paths of the vmobjects, with the points and the
+        # transformation matrix they were built with.
+        self.cairo_paths = weakref.WeakKeyDictionary()
 
         # Contains the correct method to process a list of Mobjects of the
         # corresponding class.  If a Mobject is not an instance of a class in
@@ -319,6 +415,18 @@ class Camera:
         else:
             # Set in place
             self.pixel_array[:, :, :] = converted_array[:, :, :]
+        # Remember where the pixel array comes from, so that it can be set
+        # back to it by only restoring the regions where mobjects are drawn.
+        self.pixel_array_source = None
+        self.dirty_rectangles = None
+        if (
+            self.use_dirty_rectangles
+            and isinstance(pixel_array, np.ndarray)
+            and not convert_from_floats
+        ):
+            self.pixel_array_source = pixel_array
+            self.pixel_array_source_state = self.get_frame_state()
+            self.dirty_rectangles = []
 
     def set_background(self, pixel_array, convert_from_floats=False):
         """Sets the background to the passed pixel_array after converting
@@ -387,11 +495,109 @@ class Camera:
         Camera
             The camera object after setting the pixel array.
         """ ""
-        self.set_pixel_array(self.background)
+        self.set_frame_to_background(self.background)
         return self
 
     def set_frame_to_background(self, background):
-        self.set_pixel_array(background)
+        """Sets the pixel array to a background.
+
+        If the pixel array was last set from the same background, and the
+        frame didn't move since, only the regions where mobjects were drawn
+        are restored.
+
+        Parameters
+        ----------
+        background : np.ndarray
+            The background, for example the static image of a scene.
+        """
+        if (
+            getattr(self, "pixel_array_source", None) is background
+            and self.dirty_rectangles is not None
+            and self.pixel_array_source_state == self.get_frame_state()
+        ):
+            for x0, y0, x1, y1 in self.dirty_rectangles:
+                self.pixel_array[y0:y1, x0:x1] = background[y0:y1, x0:x1]
+            self.dirty_rectangles = []
+        else:
+            self.set_pixel_array(background)
+
+    def get_frame_state(self):
+        """Returns what determines where mobjects are drawn in the pixel array,
+        besides the mobjects themselves.
+
+        Returns
+        -------
+        :class:`tuple`
+            The state of the frame.
+        """
+        return (
+            tuple(self.frame_center),
+            self.frame_width,
+            self.frame_height,
+            self.pixel_array.shape,
+        )
+
+    def get_pixel_bounding_box(self, mobject):
+        """Returns the rectangle of pixels a mobject is drawn in, excluding its
+        submobjects.
+
+        Parameters
+        ----------
+        mobject : :class:`~.Mobject`
+            The mobject.
+
+        Returns
+        -------
+        Optional[Tuple[:class:`int`, :class:`int`, :class:`int`, :class:`int`]]
+            The left, top, right and bottom bounds of the rectangle, clipped
+            to the frame, or None if they can't be computed.
+        """
+        if not isinstance(mobject, VMobject) or mobject.get_background_image():
+            # Other mobjects are drawn by compositing whole frames.
+            return None
+        if len(mobject.points) == 0:
+            return (0, 0, 0, 0)
+        pixel_coords = self.points_to_pixel_coords(mobject, mobject.points)
+        # Bezier curves are contained in the convex hull of their control
+        # points, but strokes extend beyond them, up to the miter limit in
+        # corners.  A few more pixels account for antialiasing and rounding.
+        stroke_width = max(mobject.get_stroke_width(), mobject.get_stroke_width(True))
+        line_width = (
+            stroke_width
+            * self.cairo_line_width_multiple
+            * self.pixel_width
+            / self.frame_width
+        )
+        pad = int(np.ceil(line_width * CAIRO_MITER_LIMIT / 2)) + 2
+        x0, y0 = pixel_coords.min(axis=0) - pad
+        x1, y1 = pixel_coords.max(axis=0) + pad + 1
+        return (
+            max(x0, 0),
+            max(y0, 0),
+            min(x1, self.pixel_width),
+            min(y1, self.pixel_height),
+        )
+
+    def add_dirty_rectangles(self, mobjects):
+        """Records the regions of the pixel array where mobjects are about to
+        be drawn.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.Mobject`]
+            The mobjects, without their submobjects.
+        """
+        if self.dirty_rectangles is None:
+            return
+        rectangles = self.dirty_rectangles
+        for mobject in mobjects:
+            rectangle = self.get_pixel_bounding_box(mobject)
+            if rectangle is None:
+                self.dirty_rectangles = None
+                return
+            if rectangle[0] < rectangle[2] and rectangle[1] < rectangle[3]:
+                rectangles.append(rectangle)
+        self.dirty_rectangles = merge_rectangles(rectangles)
 
     ####
 
@@ -486,7 +692,10 @@ class Camera:
         # partition while at the same time preserving order.
         mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
         for group_type, group in it.groupby(mobjects, self.type_or_raise):
-            self.display_funcs[group_type](list(group), self.pixel_array)
+            group = list(group)
+            if group_type is not Mobject:
+                self.add_dirty_rectangles(group)
+            self.display_funcs[group_type](group, self.pixel_array)
 
     # Methods associated with svg rendering
 
@@ -596,8 +805,21 @@ class Camera:
             The Pixel array to add the VMobjects to.
         """
         ctx = self.get_cairo_context(pixel_array)
+        # Nothing can be drawn outside of the regions which will be restored
+        # when the frame is set back to its background.
+        clip = pixel_array is self.pixel_array and self.dirty_rectangles is not None
+        if clip:
+            matrix = ctx.get_matrix()
+            ctx.identity_matrix()
+            ctx.new_path()
+            for x0, y0, x1, y1 in self.dirty_rectangles:
+                ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+            ctx.clip()
+            ctx.set_matrix(matrix)
         for vmobject in vmobjects:
             self.display_vectorized(vmobject, ctx)
+        if clip:
+            ctx.reset_clip()
 
     def display_vectorized(self, vmobject, ctx):
         """Displays a VMobject in the cairo context
@@ -642,16 +864,37 @@ class Camera:
             return
 
         ctx.new_path()
-        subpaths = vmobject.gen_subpaths_from_points_2d(points)
-        for subpath in subpaths:
-            quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
+        matrix = ctx.get_matrix()
+        cached = self.cairo_paths.get(vmobject)
+        if (
+            cached is not None
+            and cached[1] == matrix
+            and np.array_equal(cached[0], points)
+        ):
+            ctx.append_path(cached[2])
+            return self
+
+        nppcc = vmobject.n_points_per_cubic_curve
+        split_indices = get_subpath_split_indices(
+            points, nppcc, vmobject.tolerance_for_point_equality
+        )
+        closed = points_are_equal_2d(
+            points[split_indices[:-1]],
+            points[split_indices[1:] - 1],
+            vmobject.tolerance_for_point_equality,
+        )
+        # Indexing lists of floats is much faster than indexing numpy arrays.
+        coords = points[:, :2].tolist()
+        for i1, i2, is_closed in zip(split_indices, split_indices[1:], closed):
+            if i2 - i1 < nppcc:
+                continue
             ctx.new_sub_path()
-            start = subpath[0]
-            ctx.move_to(*start[:2])
-            for p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
-            if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.move_to(*coords[i1])
+            for i in range(i1, i2 - nppcc + 1, nppcc):
+                ctx.curve_to(*coords[i + 1], *coords[i + 2], *coords[i + 3])
+            if is_closed:
                 ctx.close_path()
+        self.cairo_paths[vmobject] = (np.array(points), matrix, ctx.copy_path())
         return self
 
     def set_cairo_context_color(self, ctx, rgbas, vmobject):
@@ -993,6 +1236,8 @@ class Camera:
             violator_norms.reshape((len(violator_norms), 1)), points.shape[1], 1
         )
         rescaled = self.max_allowable_norm * violators / reshaped_norms
+        # The points may be those of a mobject, which aren't changed.
+        points = points.copy()
         points[violator_indices] = rescaled
         return points
 
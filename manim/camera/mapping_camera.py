@@ -28,6 +28,8 @@ class MappingCamera(Camera):
         self.mapping_func = mapping_func
         self.min_num_curves = min_num_curves
         self.allow_object_intrusion = allow_object_intrusion
+        # Mobjects are drawn through the mapping function.
+        kwargs.setdefault("use_dirty_rectangles", False)
         Camera.__init__(self, **kwargs)
 
     def points_to_pixel_coords(self, points):
@@ -78,6 +80,8 @@ class OldMultiCamera(Camera):
             )
             for camera_with_start_positions in cameras_with_start_positions
         ]
+        # The pixel array is copied from the other cameras.
+        kwargs.setdefault("use_dirty_rectangles", False)
         Camera.__init__(self, **kwargs)
 
     def capture_mobjects(self, mobjects, **kwargs):
@@ -45,6 +45,8 @@ class ThreeDCamera(Camera):
             Any keyword argument of Camera.
         """
         self._frame_center = Point(kwargs.get("frame_center", ORIGIN))
+        # The projection depends on the orientation of the camera.
+        kwargs.setdefault("use_dirty_rectangles", False)
         super().__init__(**kwargs)
         self.distance = distance
         self.phi = phi
@@ -0,0 +1,74 @@
+"""Manim's cache subcommand.
+
+Manim's cache subcommand is accessed in the command-line interface via ``manim
+cache``. Here you can inspect and clean up the partial movie files cached by the
+scenes rendered in a media directory.
+
+"""
+import datetime
+
+import click
+
+from ... import config, console
+from ...constants import CONTEXT_SETTINGS, EPILOG
+from ...utils.partial_movie_cache import PartialMovieCache
+
+
+@click.group(
+    context_settings=CONTEXT_SETTINGS,
+    invoke_without_command=True,
+    no_args_is_help=True,
+    epilog=EPILOG,
+    help="Manages the cache of partial movie files.",
+)
+@click.option(
+    "--media_dir",
+    type=click.Path(),
+    help="The media directory of the cache.",
+)
+@click.pass_context
+def cache(ctx, media_dir):
+    """Responsible for the cache subcommand."""
+    if media_dir is not None:
+        config.media_dir = media_dir
+
+
+@cache.command(context_settings=CONTEXT_SETTINGS)
+def stats():
+    """Show the number and size of the cached files of each scene."""
+    scenes = PartialMovieCache().stats()
+    for scene, n_files, size, last_used in scenes:
+        last_used = datetime.datetime.fromtimestamp(last_used)
+        console.print(
+            f"{scene} : {n_files} file(s), {size / 2 ** 20:.1f} MiB, "
+            f"last used {last_used:%Y-%m-%d %H:%M}"
+        )
+    total_size = sum(size for _, _, size, _ in scenes)
+    console.print(
+        f"Total : {sum(n_files for _, n_files, _, _ in scenes)} file(s), "
+        f"{total_size / 2 ** 20:.1f} MiB",
+        style="bold",
+    )
+
+
+@cache.command(context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "--max_cache_bytes",
+    type=int,
+    help="Maximum total size of the cache, instead of the max_cache_bytes of the config. Use -1 for infinity.",
+)
+def gc(max_cache_bytes):
+    """Evict the least recently used files exceeding the cache budget."""
+    if max_cache_bytes is not None:
+        config.max_cache_bytes = max_cache_bytes
+    partial_movie_cache = PartialMovieCache()
+    partial_movie_cache.scan()
+    n_missing = partial_movie_cache.prune()
+    removed_files = partial_movie_cache.evict(
+        max_bytes=config["max_cache_bytes"],
+        max_files_per_directory=config["max_files_cached"],
+    )
+    console.print(
+        f"Removed {len(removed_files)} cached file(s), "
+        f"and {n_missing} missing file(s) from the index."
+    )
@@ -17,6 +17,7 @@ import requests
 from ... import __version__, config, console, logger
 from ...constants import CONTEXT_SETTINGS, EPILOG
 from ...utils.module_ops import scene_classes_from_file
+from ...utils.scheduler import render_scenes_in_parallel
 from .ease_of_access_options import ease_of_access_options
 from .global_options import global_options
 from .output_options import output_options
@@ -149,12 +150,16 @@ def render(
             )
             console.print_exception()
     else:
-        for SceneClass in scene_classes_from_file(file):
-            try:
-                scene = SceneClass()
-                scene.render()
-            except Exception:
-                console.print_exception()
+        scene_classes = scene_classes_from_file(file)
+        if config.workers > 1 and len(scene_classes) > 1:
+            render_scenes_in_parallel(scene_classes)
+        else:
+            for SceneClass in scene_classes:
+                try:
+                    scene = SceneClass()
+                    scene.render()
+                except Exception:
+                    console.print_exception()
 
     if config.notify_outdated_version:
         manim_info_url = "https://pypi.org/pypi/manim/json"
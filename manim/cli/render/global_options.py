@@ -20,6 +20,11 @@ global_options = option_group(
         help="Disable the use of the cache (still generates cache files).",
     ),
     option("--flush_cache", is_flag=True, help="Remove cached partial movie files."),
+    option(
+        "--remote_cache",
+        help="Path or URL (file://, s3://) of a cache of partial movie files "
+        "shared between machines.",
+    ),
     option("--tex_template", help="Specify a custom TeX template file."),
     option(
         "-v",
@@ -82,11 +82,28 @@ render_options = option_group(
         type=float,
         help="Render at this frame rate.",
     ),
+    option(
+        "--workers",
+        type=int,
+        help="Render the scenes, or the animations of a single scene, in parallel "
+        "using this many processes.",
+    ),
     option(
         "--renderer",
         type=click.Choice(["cairo", "opengl", "webgl"], case_sensitive=False),
         help="Select a renderer for your Scene.",
     ),
+    option(
+        "--opengl_backend",
+        type=click.Choice(["auto", "default", "egl", "software"], case_sensitive=False),
+        help="Backend of the OpenGL context when there is no preview window.",
+    ),
+    option(
+        "--opengl_samples",
+        type=int,
+        help="Number of samples per pixel of the OpenGL renderer without a preview "
+        "window.",
+    ),
     option(
         "--use_opengl_renderer",
         is_flag=True,
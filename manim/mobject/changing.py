@@ -128,7 +128,8 @@ class TracedPath(VMobject):
             self.add_line_to(new_point)
         else:
             # Set the end to be the new point
-            self.points[-1] = new_point
+            self.get_writable_array("points")[-1] = new_point
+            self.bump_version()
 
             # Second to last point
             nppcc = self.n_points_per_cubic_curve
@@ -61,6 +61,229 @@ T = TypeVar("T", bound="Mobject")
 if TYPE_CHECKING:
     from ..animation.animation import Animation
 
+# Source of the versions of all the mobjects, see :meth:`Mobject.bump_version`.
+# Versions are unique among mobjects, so that a version can't be mistaken for
+# the one of another mobject that used to live at the same address.
+_version_counter = it.count(1)
+
+
+class _MobjectList(list):
+    """A list attribute of a mobject which tells the mobject whenever it
+    changes in place, see :class:`_SubmobjectList` and :class:`_UpdaterList`.
+    Copies of the list are plain lists.
+    """
+
+    __slots__ = ["owner"]
+
+    def __init__(self, owner, items=()):
+        super().__init__(items)
+        self.owner = owner
+
+    def changed(self, removed=(), added=()):
+        """Called with the items removed from the list and added to it, after
+        every change.  Does nothing by default."""
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def append(self, item):
+        super().append(item)
+        self.changed(added=[item])
+
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        self.changed(added=items)
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self.changed(added=[item])
+
+    def remove(self, item):
+        super().remove(item)
+        self.changed(removed=[item])
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self.changed(removed=[item])
+        return item
+
+    def clear(self):
+        removed = list(self)
+        super().clear()
+        self.changed(removed=removed)
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.changed()
+
+    def reverse(self):
+        super().reverse()
+        self.changed()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            removed, added = self[index], list(value)
+        else:
+            removed, added = [self[index]], [value]
+        super().__setitem__(index, added if isinstance(index, slice) else value)
+        self.changed(removed, added)
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self.changed(removed=removed)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, count):
+        removed = list(self)
+        super().__imul__(count)
+        self.changed(removed, list(self))
+        return self
+
+
+class _SubmobjectList(_MobjectList):
+    """The :attr:`~.Mobject.submobjects` of a mobject.
+
+    The list tells the mobject whenever it changes in place, so that the
+    mobject can update the :attr:`~.Mobject.parents` of its submobjects and
+    drop its cached family, see :meth:`~.Mobject.submobjects_changed`.
+    """
+
+    __slots__ = ["family", "has_updaters"]
+
+    def __init__(self, owner, submobjects=()):
+        super().__init__(owner, submobjects)
+        self.family = None
+        self.has_updaters = None
+
+    def changed(self, removed=(), added=()):
+        # The owner isn't set yet while a list is unpickled.
+        owner = getattr(self, "owner", None)
+        if owner is not None:
+            owner.submobjects_changed(removed, added)
+
+
+def _takes_dt(updater):
+    return "dt" in get_parameters(updater)
+
+
+class _UpdaterList(_MobjectList):
+    """The :attr:`~.Mobject.updaters` of a mobject.
+
+    Whether each updater takes the ``dt`` parameter is found once, when it's
+    added, and kept in :attr:`calls` with the updater.  The list tells the
+    mobject whenever it changes in place, see :meth:`~.Mobject.updaters_changed`.
+    """
+
+    __slots__ = ["calls"]
+
+    def __init__(self, owner, updaters=(), takes_dt=None):
+        super().__init__(owner, updaters)
+        if takes_dt is None:
+            takes_dt = map(_takes_dt, self)
+        self.calls = list(zip(self, takes_dt))
+
+    def changed(self, removed=(), added=()):
+        # Only the added updaters are inspected. The ids of the other ones
+        # can't belong to new objects, since they stayed in the list.
+        takes_dt = {id(updater): flag for updater, flag in getattr(self, "calls", [])}
+        for updater in added:
+            takes_dt[id(updater)] = _takes_dt(updater)
+        self.calls = [(updater, takes_dt[id(updater)]) for updater in self]
+        owner = getattr(self, "owner", None)
+        if owner is not None:
+            owner.updaters_changed()
+
+
+# The types of the attributes of mobjects whose values can't change, and are
+# shared by the mobjects and their copies.
+_IMMUTABLE_ATTRIBUTE_TYPES = frozenset(
+    [
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        type,
+        types.FunctionType,
+        types.BuiltinFunctionType,
+    ]
+)
+
+
+def _copy_attribute(value, memo, share_arrays=False):
+    """Copies the value of an attribute of a mobject for
+    :meth:`Mobject.__deepcopy__`, like :func:`copy.deepcopy` does.
+
+    With ``share_arrays``, numpy arrays are made read-only and shared by the
+    mobject and its copy instead, see :meth:`Mobject.get_writable_array`.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_ATTRIBUTE_TYPES:
+        return value
+    if value_type is np.ndarray and value.dtype != object:
+        copied = memo.get(id(value))
+        if copied is None:
+            # Views can still be changed through the arrays they are views of.
+            if share_arrays and value.flags.owndata:
+                value.flags.writeable = False
+                copied = value
+            else:
+                copied = value.copy(order="K")
+            memo[id(value)] = copied
+        return copied
+    if value_type is Color:
+        # Colors look up any missing attribute, like __deepcopy__, as a color
+        # property, which is slow.
+        copied = memo.get(id(value))
+        if copied is None:
+            copied = memo[id(value)] = Color.__new__(Color)
+            copied.__dict__.update(copy.deepcopy(value.__dict__, memo))
+        return copied
+    return copy.deepcopy(value, memo)
+
+
+class _PackedPoints:
+    """The points of the family of a mobject stored in a single array, see
+    :meth:`~.Mobject.pack_points`."""
+
+    __slots__ = ["family", "views", "array", "is_tree"]
+
+    def __init__(self, family, array, is_tree):
+        self.family = family
+        self.array = array
+        # Whether no mobject appears twice in the tree, so that the array holds
+        # the points of the tree in the same order as get_merged_array.
+        self.is_tree = is_tree
+        self.views = []
+        start = 0
+        for mob in family:
+            stop = start + len(mob.points)
+            self.views.append((mob, array[start:stop]))
+            start = stop
+
+    def is_valid(self, family):
+        return family is self.family and all(
+            mob.__dict__.get("points") is view for mob, view in self.views
+        )
+
+    def bump_versions(self):
+        for mob, _ in self.views:
+            mob.bump_version()
+
+    def __deepcopy__(self, memo):
+        # The points of copies aren't views of a copy of the array.
+        return None
+
 
 class Mobject(Container):
     """Mathematical Object: base class for objects that can be displayed on screen.
@@ -83,6 +306,7 @@ class Mobject(Container):
     """
 
     animation_overrides = {}
+    _version = 0
 
     @classmethod
     def __init_subclass__(cls, **kwargs):
@@ -100,7 +324,9 @@ class Mobject(Container):
         self.target = target
         self.z_index = z_index
         self.point_hash = None
+        self.parents = []
         self.submobjects = []
+        self.packed_points = None
         self.updaters = []
         self.updating_suspended = False
         self.reset_points()
@@ -114,7 +340,6 @@ class Mobject(Container):
         self.gloss = 0.0
         self.shadow = 0.0
         self.needs_new_bounding_box = True
-        self.parents = []
         self.family = [self]
 
         self.init_gl_data()
@@ -318,8 +543,26 @@ class Mobject(Container):
         cls = self.__class__
         result = cls.__new__(cls)
         clone_from_id[id(self)] = result
+        # The attributes are written directly to the copy, except the
+        # submobjects, whose setter links their copies to the copy, and the
+        # updaters, which are owned by the copy.  The copy is only linked to
+        # the copies of its parents, by their submobjects.
+        result_dict = result.__dict__
+        share_arrays = config["copy_on_write"]
         for k, v in self.__dict__.items():
-            setattr(result, k, copy.deepcopy(v, clone_from_id))
+            if k == "parents":
+                result_dict[k] = []
+            elif k == "submobjects":
+                result.submobjects = copy.deepcopy(v, clone_from_id)
+            elif k == "updaters":
+                # The copies of the updaters take the same parameters.
+                result_dict[k] = _UpdaterList(
+                    result,
+                    copy.deepcopy(v, clone_from_id),
+                    [takes_dt for _, takes_dt in v.calls],
+                )
+            else:
+                result_dict[k] = _copy_attribute(v, clone_from_id, share_arrays)
         result.original_id = str(id(self))
         return result
 
@@ -329,6 +572,201 @@ class Mobject(Container):
         else:
             return str(self.name)
 
+    @property
+    def submobjects(self) -> List["Mobject"]:
+        """The contained mobjects.
+
+        Changing the list, in place or by assigning a new one, updates the
+        :attr:`parents` of the mobjects added or removed, and drops the cached
+        family of the mobject and of its ancestors.
+        """
+        try:
+            return self.__dict__["submobjects"]
+        except KeyError:
+            raise AttributeError("submobjects") from None
+
+    @submobjects.setter
+    def submobjects(self, submobjects):
+        old_submobjects = self.__dict__.get("submobjects", [])
+        if isinstance(old_submobjects, _SubmobjectList):
+            self.drop_cached_family()
+            old_submobjects.owner = None
+        self.__dict__["submobjects"] = _SubmobjectList(self, submobjects)
+        self.submobjects_changed(old_submobjects, submobjects)
+
+    def submobjects_changed(self, removed=(), added=()):
+        """Updates the :attr:`parents` of submobjects, and drops the cached
+        family of the mobject, after :attr:`submobjects` changed.
+
+        This is called by :attr:`submobjects` itself, whether it's assigned or
+        changed in place.
+
+        Parameters
+        ----------
+        removed
+            The mobjects taken out of :attr:`submobjects`, which may still be
+            in it if they were there several times.
+        added
+            The mobjects put in :attr:`submobjects`.
+        """
+        if removed:
+            remaining = set(map(id, self.submobjects))
+            for mobject in removed:
+                if id(mobject) not in remaining and self in mobject.parents:
+                    mobject.parents.remove(self)
+        for mobject in added:
+            if self not in mobject.parents:
+                mobject.parents.append(self)
+        self.drop_cached_family()
+
+    def drop_cached_family(self):
+        """Drops the cached family of the mobject and of its ancestors, see
+        :meth:`get_family`, and whether their families have updaters, see
+        :meth:`has_family_updaters`."""
+        submobjects = self.__dict__.get("submobjects")
+        # The ancestors of a mobject without a cached family don't have one
+        # either, since they are assembled from the families of their
+        # submobjects, and likewise for whether they have updaters.
+        if submobjects is None or (
+            submobjects.family is None and submobjects.has_updaters is None
+        ):
+            return
+        submobjects.family = None
+        submobjects.has_updaters = None
+        for parent in self.parents:
+            parent.drop_cached_family()
+
+    @property
+    def updaters(self) -> List[Updater]:
+        """The update functions of the mobject, see :meth:`add_updater`.
+
+        Changing the list, in place or by assigning a new one, finds whether
+        the new updaters take the ``dt`` parameter, and drops whether the
+        mobject and its ancestors have updaters.
+        """
+        try:
+            return self.__dict__["updaters"]
+        except KeyError:
+            raise AttributeError("updaters") from None
+
+    @updaters.setter
+    def updaters(self, updaters):
+        old_updaters = self.__dict__.get("updaters")
+        if isinstance(old_updaters, _UpdaterList):
+            old_updaters.owner = None
+        self.__dict__["updaters"] = _UpdaterList(self, updaters)
+        self.updaters_changed()
+
+    def updaters_changed(self):
+        """Drops whether the family of the mobject and of its ancestors have
+        updaters, see :meth:`has_family_updaters`, after :attr:`updaters`
+        changed.
+
+        This is called by :attr:`updaters` itself, whether it's assigned or
+        changed in place.
+        """
+        submobjects = self.__dict__.get("submobjects")
+        if submobjects is None or submobjects.has_updaters is None:
+            return
+        submobjects.has_updaters = None
+        for parent in self.parents:
+            parent.updaters_changed()
+
+    def has_family_updaters(self) -> bool:
+        """Test if ``self`` or any of its descendants has updaters.
+
+        The result is cached until :attr:`updaters` or :attr:`submobjects`
+        change, here or in any descendant.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if a mobject of the family has an updater, ``False`` otherwise.
+        """
+        submobjects = self.submobjects
+        if submobjects.has_updaters is None:
+            # All the submobjects are tested, so that they all have a cached
+            # result whenever this mobject has one.
+            submobjects_have_updaters = [
+                Mobject.has_family_updaters(submobject) for submobject in submobjects
+            ]
+            submobjects.has_updaters = bool(self.updaters) or any(
+                submobjects_have_updaters
+            )
+        return submobjects.has_updaters
+
+    @property
+    def version(self) -> int:
+        """An integer identifying the current state of the mobject.
+
+        It changes when :meth:`bump_version` is called, which the methods
+        changing the mobject in place do. It does not account for attributes
+        being assigned, nor for changes in :attr:`submobjects`.
+
+        See Also
+        --------
+        :meth:`bump_version`
+        """
+        return self._version
+
+    def bump_version(self) -> "Mobject":
+        """Give the mobject a new :attr:`version`.
+
+        This has to be called after modifying the data of the mobject in place
+        (e.g. ``mob.points[0] = ...``), so that what is cached for the previous
+        version is not reused, including the digests used for scene caching.
+        It is called for the mobjects whose updaters ran, and by
+        :meth:`get_writable_array`. The digests notice assigned attributes by
+        themselves.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+        """
+        self.__dict__["_version"] = next(_version_counter)
+        return self
+
+    def get_writable_array(self, name: str) -> np.ndarray:
+        """Return an array attribute of the mobject, which can be modified in
+        place.
+
+        With ``config["copy_on_write"]``, copies of mobjects share their
+        arrays with the original instead of copying them, and the shared
+        arrays are read-only. This copies the array first if it is read-only,
+        so that changing it doesn't change the copies. It also bumps the
+        :attr:`version` of the mobject, as the array is about to change.
+
+        Parameters
+        ----------
+        name
+            The name of the attribute, e.g. ``"points"``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The array, which is only used by this mobject if it was copied.
+
+        Examples
+        --------
+        ::
+
+            >>> from manim import *
+            >>> with tempconfig({"copy_on_write": True}):
+            ...     square = Square()
+            ...     copy = square.copy()
+            >>> copy.points is square.points
+            True
+            >>> copy.get_writable_array("points") is square.points
+            False
+        """
+        array = getattr(self, name)
+        if not array.flags.writeable:
+            array = array.copy()
+            setattr(self, name, array)
+        self.bump_version()
+        return array
+
     def reset_points(self):
         """Sets :attr:`points` to be an empty array."""
         self.points = np.zeros((0, self.dim))
@@ -519,6 +957,7 @@ class Mobject(Container):
         for mobject in mobjects:
             if mobject in self.submobjects:
                 self.submobjects.remove(mobject)
+        self.bump_version()
         return self
 
     def __sub__(self, other):
@@ -798,15 +1237,20 @@ class Mobject(Container):
         """
         if self.updating_suspended:
             return self
-        for updater in self.updaters:
-            parameters = get_parameters(updater)
-            if "dt" in parameters:
+        calls = self.updaters.calls
+        for updater, takes_dt in calls:
+            if takes_dt:
                 updater(self, dt)
             else:
                 updater(self)
+        if calls:
+            # The updaters may have changed the family in place.
+            for mob in self.get_family():
+                mob.bump_version()
         if recursive:
             for submob in self.submobjects:
-                submob.update(dt, recursive)
+                if submob.has_family_updaters():
+                    submob.update(dt, recursive)
         return self
 
     def get_time_based_updaters(self) -> List[Updater]:
@@ -825,7 +1269,7 @@ class Mobject(Container):
         :meth:`has_time_based_updater`
 
         """
-        return [updater for updater in self.updaters if "dt" in get_parameters(updater)]
+        return [updater for updater, takes_dt in self.updaters.calls if takes_dt]
 
     def has_time_based_updater(self) -> bool:
         """Test if ``self`` has a time based updater.
@@ -840,10 +1284,7 @@ class Mobject(Container):
         :meth:`get_time_based_updaters`
 
         """
-        for updater in self.updaters:
-            if "dt" in get_parameters(updater):
-                return True
-        return False
+        return any(takes_dt for _, takes_dt in self.updaters.calls)
 
     def get_updaters(self) -> List[Updater]:
         """Return all updaters.
@@ -883,7 +1324,7 @@ class Mobject(Container):
         index
             The index at which the new updater should be added in ``self.updaters``. In case ``index`` is ``None`` the updater will be added at the end.
         call_updater
-            Wheather or not to call the updater initially. If ``True``, the updater will be called using ``dt=0``.
+            Wheather or not to call the updater initially. If ``True``, the updater will be called using ``dt=0`` if it uses this parameter.
 
         Returns
         -------
@@ -929,8 +1370,12 @@ class Mobject(Container):
             self.updaters.append(update_function)
         else:
             self.updaters.insert(index, update_function)
+        self.bump_version()
         if call_updater:
-            update_function(self, 0)
+            if _takes_dt(update_function):
+                update_function(self, 0)
+            else:
+                update_function(self)
         return self
 
     def remove_updater(self, update_function: Updater) -> "Mobject":
@@ -958,6 +1403,7 @@ class Mobject(Container):
         """
         while update_function in self.updaters:
             self.updaters.remove(update_function)
+        self.bump_version()
         return self
 
     def clear_updaters(self, recursive: bool = True) -> "Mobject":
@@ -1118,6 +1564,11 @@ class Mobject(Container):
             return self
         else:
             total_vector = reduce(op.add, vectors)
+            points = self.get_packed_points()
+            if points is not None:
+                points += total_vector
+                self.packed_points.bump_versions()
+                return self
             for mob in self.family_members_with_points():
                 mob.points = mob.points.astype("float")
                 mob.points += total_vector
@@ -1258,6 +1709,7 @@ class Mobject(Container):
             alphas -= min(alphas)
             alphas /= max(alphas)
             alphas = alphas ** wag_factor
+            mob.get_writable_array("points")
             mob.points += np.dot(
                 alphas.reshape((len(alphas), 1)),
                 np.array(direction).reshape((1, mob.dim)),
@@ -1300,6 +1752,7 @@ class Mobject(Container):
                     arr[:] = func(arr)
                 else:
                     arr[:] = func(arr - about_point) + about_point
+            mob.bump_version()
 
         if not works_on_bounding_box:
             self.refresh_bounding_box(recurse_down=True)
@@ -1315,7 +1768,15 @@ class Mobject(Container):
             if about_edge is None:
                 about_edge = ORIGIN
             about_point = self.get_critical_point(about_edge)
+        points = self.get_packed_points()
+        if points is not None:
+            points -= about_point
+            points[:] = func(points)
+            points += about_point
+            self.packed_points.bump_versions()
+            return self
         for mob in self.family_members_with_points():
+            mob.get_writable_array("points")
             mob.points -= about_point
             mob.points = func(mob.points)
             mob.points += about_point
@@ -1812,15 +2273,109 @@ class Mobject(Container):
         ]
 
     def get_merged_array(self, array_attr):
-        result = getattr(self, array_attr)
-        for submob in self.submobjects:
-            result = np.append(result, submob.get_merged_array(array_attr), axis=0)
-            submob.get_merged_array(array_attr)
-        return result
+        arrays = []
+
+        def collect(mob):
+            arrays.append(getattr(mob, array_attr))
+            for submob in mob.submobjects:
+                collect(submob)
+
+        collect(self)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.concatenate(arrays)
 
     def get_all_points(self):
+        points = self.get_packed_points()
+        if points is not None and self.packed_points.is_tree:
+            return points
         return self.get_merged_array("points")
 
+    def pack_points(self) -> "Mobject":
+        """Stores the points of the family of the mobject in a single array.
+
+        The points of each member of the family become a view of this array,
+        so that :meth:`shift` and :meth:`apply_points_function_about_point`,
+        and with it :meth:`scale`, :meth:`rotate` and the like, transform the
+        whole family at once, and :meth:`get_all_points` returns the array
+        itself instead of a copy.
+
+        The mobject stays packed while its family and the point arrays of the
+        members don't change: assigning new points to a member, or changing
+        the :attr:`submobjects` of one, makes the mobject transform its members
+        one by one again, until it is packed again. Changing the points in
+        place, as transformations do, keeps the mobject packed. Copies of the
+        mobject aren't packed.
+
+        This is only supported by the Cairo renderer, for which it does
+        nothing otherwise.
+
+        .. note::
+
+            The functions given to :meth:`apply_points_function_about_point`
+            get the points of the whole family at once, so they must transform
+            each point independently of the others when the mobject is packed.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+
+        See Also
+        --------
+        :meth:`get_packed_points`
+
+        Examples
+        --------
+        ::
+
+            >>> from manim import *
+            >>> group = VGroup(Square(), Circle()).pack_points()
+            >>> group.get_all_points() is group.get_packed_points()
+            True
+            >>> group[0].points.base is group.get_packed_points()
+            True
+        """
+        if config.renderer == "opengl":
+            return self
+
+        def count_tree(mob):
+            return 1 + sum(count_tree(submob) for submob in mob.submobjects)
+
+        family = self.get_cached_family()
+        array = np.concatenate([mob.points for mob in family]).astype(
+            "float", copy=False
+        )
+        self.packed_points = _PackedPoints(
+            family, array, is_tree=count_tree(self) == len(family)
+        )
+        for mob, view in self.packed_points.views:
+            mob.points = view
+        return self
+
+    def get_packed_points(self) -> Optional[np.ndarray]:
+        """Returns the array holding the points of the family of the mobject,
+        if it is packed.
+
+        Returns
+        -------
+        Optional[:class:`numpy.ndarray`]
+            The array, in the order of :meth:`get_family`, or ``None`` if the
+            mobject isn't packed, or not anymore.
+
+        See Also
+        --------
+        :meth:`pack_points`
+        """
+        packed_points = self.packed_points
+        if packed_points is None:
+            return None
+        if not packed_points.is_valid(self.get_cached_family()):
+            # Dropping the packing doesn't change the state of the mobject.
+            self.__dict__["packed_points"] = None
+            return None
+        return packed_points.array
+
     # Getters
 
     def get_points_defining_boundary(self):
@@ -2103,12 +2658,36 @@ class Mobject(Container):
             else:
                 return [self]
         else:
-            sub_families = list(map(Mobject.get_family, self.submobjects))
+            return list(self.get_cached_family())
+
+    def get_cached_family(self):
+        """Returns the family of the mobject, without copying it.
+
+        The family is cached until :attr:`submobjects` changes, here or in
+        any descendant, and must not be modified.
+
+        Returns
+        -------
+        List[:class:`Mobject`]
+            The mobject followed by its descendants, each of them once.
+        """
+        submobjects = self.submobjects
+        if submobjects.family is None:
+            sub_families = [
+                Mobject.get_cached_family(submobject) for submobject in submobjects
+            ]
             all_mobjects = [self] + list(it.chain(*sub_families))
-            return remove_list_redundancies(all_mobjects)
+            submobjects.family = remove_list_redundancies(all_mobjects)
+        return submobjects.family
 
     def family_members_with_points(self):
-        return [m for m in self.get_family() if m.get_num_points() > 0]
+        # The points of mobjects are reassigned everywhere, so this view of the
+        # family can't be cached like the family itself.
+        if config.renderer == "opengl":
+            family = self.get_family()
+        else:
+            family = self.get_cached_family()
+        return [m for m in family if m.get_num_points() > 0]
 
     def arrange(
         self,
@@ -2409,7 +2988,7 @@ class Mobject(Container):
         if recursive:
             for submob in self.submobjects:
                 submob.invert(recursive=True)
-        list.reverse(self.submobjects)
+        self.submobjects.reverse()
 
     # Just here to keep from breaking old scenes.
     def arrange_submobjects(self, *args, **kwargs):
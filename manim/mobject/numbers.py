@@ -6,12 +6,55 @@ import uuid
 
 import numpy as np
 
+from .. import config
 from ..constants import *
+from ..mobject.svg.svg_cache import ParsedSVGCache
 from ..mobject.svg.tex_mobject import MathTex, SingleStringMathTex
 from ..mobject.types.vectorized_mobject import VMobject
 from ..mobject.value_tracker import ValueTracker
 from ..utils.family import extract_mobject_family_members
 
+# The glyphs of the numbers, shared by all of them, see :func:`get_glyph`.
+glyph_cache = ParsedSVGCache()
+
+
+def get_glyph(tex_string, **kwargs):
+    """Returns a copy of the :class:`~.SingleStringMathTex` of a character of a
+    number.
+
+    Numbers are made of the same few glyphs, and updating one rebuilds all of
+    its glyphs, so the least recently used ones are kept in memory, up to
+    ``config["max_svg_cache_bytes"]``, instead of being compiled and parsed
+    again.
+
+    Parameters
+    ----------
+    tex_string : :class:`str`
+        The TeX of the glyph, for example a digit.
+    kwargs : Any
+        Arguments passed to :class:`~.SingleStringMathTex`.
+
+    Returns
+    -------
+    :class:`~.SingleStringMathTex`
+        The glyph.
+    """
+    tex_template = kwargs.get("tex_template") or config["tex_template"]
+    key = (
+        tex_string,
+        tex_template.body,
+        repr(sorted((k, v) for k, v in kwargs.items() if k != "tex_template")),
+    )
+    cached = glyph_cache.get(key)
+    if cached is None:
+        glyph = SingleStringMathTex(tex_string, **kwargs)
+        glyph_cache.put(key, [glyph])
+        return glyph
+    glyph = cached[0]
+    # Copies remember the id of their original, which is not meaningful here.
+    glyph.__dict__.pop("original_id", None)
+    return glyph
+
 
 class DecimalNumber(VMobject):
     """An mobject representing a decimal number.
@@ -94,18 +137,18 @@ class DecimalNumber(VMobject):
             else:
                 num_string = num_string[1:]
 
-        self.add(*[SingleStringMathTex(char, **kwargs) for char in num_string])
+        self.add(*[get_glyph(char, **kwargs) for char in num_string])
 
         # Add non-numerical bits
         if self.show_ellipsis:
-            self.add(SingleStringMathTex("\\dots"))
+            self.add(get_glyph("\\dots"))
 
         if num_string.startswith("-"):
             minus = self.submobjects[0]
             minus.next_to(self.submobjects[1], LEFT, buff=self.digit_to_digit_buff)
 
         if self.unit is not None:
-            self.unit_sign = SingleStringMathTex(self.unit, color=self.color)
+            self.unit_sign = get_glyph(self.unit, color=self.color)
             self.add(self.unit_sign)
 
         self.arrange(buff=self.digit_to_digit_buff, aligned_edge=DOWN)
@@ -195,7 +238,8 @@ class DecimalNumber(VMobject):
         for mob in old_family:
             # Dumb hack...due to how scene handles families
             # of animated mobjects
-            mob.points[:] = 0
+            mob.get_writable_array("points")[:] = 0
+            mob.bump_version()
         self.number = number
         return self
 
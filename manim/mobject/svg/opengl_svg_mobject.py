@@ -20,6 +20,7 @@ class OpenGLSVGMobject(SVGMobject):
         **kwargs,
     ):
         self.def_map = {}
+        self.path_styles = {}
         self.file_name = file_name or self.file_name
         self.ensure_valid_file()
         self.should_center = should_center
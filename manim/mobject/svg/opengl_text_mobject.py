@@ -62,6 +62,7 @@ from ...mobject.opengl_geometry import OpenGLDot
 from ...mobject.svg.opengl_svg_mobject import OpenGLSVGMobject
 from ...mobject.types.opengl_vectorized_mobject import OpenGLVGroup
 from ...utils.color import WHITE, Colors
+from .text_mobject import generate_svg_file
 
 TEXT_MOB_SCALE_FACTOR = 0.05
 
@@ -650,17 +651,20 @@ class OpenGLText(OpenGLSVGMobject):
         width = 600
         height = 400
 
-        return manimpango.text2svg(
-            settings,
-            size,
-            line_spacing,
-            disable_liga,
+        return generate_svg_file(
             file_name,
-            START_X,
-            START_Y,
-            width,
-            height,
-            self.text,
+            lambda path: manimpango.text2svg(
+                settings,
+                size,
+                line_spacing,
+                disable_liga,
+                path,
+                START_X,
+                START_Y,
+                width,
+                height,
+                self.text,
+            ),
         )
 
     def init_colors(self, propagate_colors=True):
@@ -1035,19 +1039,23 @@ class OpenGLMarkupText(OpenGLSVGMobject):
             return file_name
 
         logger.debug(f"Setting Text {self.text}")
-        return MarkupUtils.text2svg(
-            f'<span foreground="{self.color}">{self.text}</span>',
-            self.font,
-            self.slant,
-            self.weight,
-            size,
-            line_spacing,
-            disable_liga,
+        markup = f'<span foreground="{self.color}">{self.text}</span>'
+        return generate_svg_file(
             file_name,
-            START_X,
-            START_Y,
-            600,  # width
-            400,  # height
+            lambda path: MarkupUtils.text2svg(
+                markup,
+                self.font,
+                self.slant,
+                self.weight,
+                size,
+                line_spacing,
+                disable_liga,
+                path,
+                START_X,
+                START_Y,
+                600,  # width
+                400,  # height
+            ),
         )
 
     def _count_real_chars(self, s):
@@ -0,0 +1,264 @@
+"""Caches of the mobjects parsed from SVG files.
+
+The same SVG files are often parsed many times in a process, for example
+the file of a formula which is written again in every scene, or the glyphs
+of a :class:`~.Text` which is built in an updater.  The mobjects parsed from
+a file are kept in memory, and new :class:`~.SVGMobject` instances of the
+file are built by copying them.
+
+The SVG files written by :class:`~.Tex` and :class:`~.Text` are also reused
+by later processes.  Their geometry is saved in a binary file next to them,
+see :func:`save_geometry`, so that it is not parsed again either.
+
+"""
+
+__all__ = [
+    "ParsedSVGCache",
+    "parsed_svg_cache",
+    "get_geometry_file",
+    "save_geometry",
+    "load_geometry",
+]
+
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from ... import config, logger
+from ...utils.cache_backends import temporary_path
+from ..types.opengl_vectorized_mobject import OpenGLVGroup
+from ..types.vectorized_mobject import VGroup
+
+# Changes whenever the layout of the geometry files changes.
+GEOMETRY_FORMAT_VERSION = 1
+
+# Rough size of a mobject in memory, besides its numpy arrays.
+MOBJECT_OVERHEAD_BYTES = 2000
+
+
+def get_mobjects_size(mobjects):
+    """Estimates the memory used by mobjects and their submobjects, in bytes."""
+    size = 0
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            size += MOBJECT_OVERHEAD_BYTES
+            for value in member.__dict__.values():
+                if isinstance(value, np.ndarray):
+                    size += value.nbytes
+    return size
+
+
+class ParsedSVGCache:
+    """A least recently used cache of the mobjects parsed from SVG files.
+
+    Files are identified by their path, modification time and size, so that
+    a file written again is parsed again.  The total size of the cached
+    mobjects is limited by ``config["max_svg_cache_bytes"]``.
+
+    Attributes
+    ----------
+    hits : :class:`int`
+        The number of parsed files found in the cache.
+    misses : :class:`int`
+        The number of files which had to be parsed.
+    """
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, file_path, *options):
+        """Returns the key of a file parsed with some options.
+
+        Parameters
+        ----------
+        file_path : :class:`str`
+            The path of the SVG file.
+        options : Any
+            Everything else the parsed mobjects depend on.
+
+        Returns
+        -------
+        :class:`tuple`
+            The key of the file.
+        """
+        stat = os.stat(file_path)
+        return (
+            os.path.abspath(file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            config["renderer"],
+            *options,
+        )
+
+    def get(self, key):
+        """Returns copies of the mobjects parsed for a key, or None."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return [mobject.copy() for mobject in entry[0]]
+
+    def put(self, key, mobjects):
+        """Stores copies of the mobjects parsed for a key, and evicts the
+        least recently used ones if the cache gets too big."""
+        max_bytes = config["max_svg_cache_bytes"]
+        if max_bytes < 0:
+            max_bytes = float("inf")
+        size = get_mobjects_size(mobjects)
+        if size > max_bytes:
+            return
+        if key in self.entries:
+            self.size -= self.entries.pop(key)[1]
+        self.entries[key] = ([mobject.copy() for mobject in mobjects], size)
+        self.size += size
+        while self.size > max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+
+    def clear(self):
+        """Removes all the parsed files, but keeps the counters."""
+        self.entries.clear()
+        self.size = 0
+
+
+parsed_svg_cache = ParsedSVGCache()
+
+
+def get_geometry_file(key):
+    """Returns the path of the geometry file of an SVG file, or None.
+
+    Only the SVG files written by :class:`~.Tex` and :class:`~.Text` in the
+    ``tex_dir`` and ``text_dir`` directories get a geometry file.
+
+    Parameters
+    ----------
+    key : :class:`tuple`
+        The key of the SVG file in :data:`parsed_svg_cache`, which also
+        identifies its geometry file.
+    """
+    file_path = Path(key[0])
+    if not any(
+        file_path.parent == Path(os.path.abspath(config.get_dir(directory)))
+        for directory in ["tex_dir", "text_dir"]
+    ):
+        return None
+    options = repr((GEOMETRY_FORMAT_VERSION,) + key[3:])
+    digest = hashlib.sha256(options.encode()).hexdigest()[:16]
+    return file_path.with_name(f"{file_path.name}.{digest}.npz")
+
+
+def save_geometry(geometry_file, file_path, mobjects, path_styles):
+    """Saves the geometry of the mobjects parsed from an SVG file.
+
+    The geometry file holds the points of all the paths in a single array,
+    the structure of the groups, and the SVG style of each path.  It is only
+    written when the mobjects are made of paths and groups.
+
+    Parameters
+    ----------
+    geometry_file : :class:`str`
+        The geometry file, see :func:`get_geometry_file`.
+    file_path : :class:`str`
+        The parsed SVG file.
+    mobjects : List[:class:`~.VMobject`]
+        The parsed mobjects.
+    path_styles : :class:`dict`
+        The SVG style of each path, by its mobject.
+    """
+    structure = []
+    points = []
+    paths = []
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            if member in path_styles:
+                if member.submobjects:
+                    return
+                member_points = member.get_points()
+                structure.append((0, len(member_points), len(paths)))
+                points.append(member_points)
+                paths.append((member.path_string, path_styles[member]))
+            elif type(member) in (VGroup, OpenGLVGroup):
+                if member.has_points():
+                    return
+                structure.append((len(member.submobjects), 0, -1))
+            else:
+                return
+    stat = os.stat(file_path)
+    temporary_file = temporary_path(geometry_file)
+    try:
+        with open(temporary_file, "wb") as file:
+            np.savez(
+                file,
+                source=np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64),
+                roots=np.array(len(mobjects)),
+                structure=np.array(structure, dtype=np.int64).reshape(-1, 3),
+                points=np.concatenate(points) if points else np.zeros((0, 3)),
+                paths=np.array(json.dumps(paths)),
+            )
+        os.replace(temporary_file, geometry_file)
+    except OSError as error:
+        logger.debug(f"Couldn't save the geometry file {geometry_file}: {error}")
+
+
+def load_geometry(geometry_file, file_path, path_to_mobject):
+    """Builds the mobjects saved by :func:`save_geometry`.
+
+    Parameters
+    ----------
+    geometry_file : :class:`str`
+        The geometry file.
+    file_path : :class:`str`
+        The SVG file, which must not have changed since the geometry file
+        was saved.
+    path_to_mobject : Callable[[:class:`str`, :class:`dict`], :class:`~.VMobject`]
+        Builds a path mobject from a path string and an SVG style, usually
+        :meth:`~.SVGMobject.path_string_to_mobject`.  It's called with an
+        empty path string, the points are set afterwards.
+
+    Returns
+    -------
+    Optional[List[:class:`~.VMobject`]]
+        The mobjects, or None if there is no valid geometry file.
+    """
+    if not os.path.exists(geometry_file):
+        return None
+    stat = os.stat(file_path)
+    try:
+        with np.load(geometry_file, allow_pickle=False) as data:
+            if list(data["source"]) != [stat.st_mtime_ns, stat.st_size]:
+                return None
+            roots = int(data["roots"])
+            structure = data["structure"].tolist()
+            points = data["points"]
+            paths = json.loads(str(data["paths"]))
+    except (OSError, ValueError, KeyError) as error:
+        logger.debug(f"Ignoring the geometry file {geometry_file}: {error}")
+        return None
+
+    group_class = OpenGLVGroup if config["renderer"] == "opengl" else VGroup
+    rows = iter(structure)
+    start = 0
+
+    def build():
+        nonlocal start
+        n_submobjects, n_points, path_index = next(rows)
+        if path_index < 0:
+            return group_class(*[build() for _ in range(n_submobjects)])
+        path_string, style = paths[path_index]
+        mobject = path_to_mobject("", style)
+        mobject.path_string = path_string
+        mobject.set_points(points[start : start + n_points])
+        start += n_points
+        return mobject
+
+    return [build() for _ in range(roots)]
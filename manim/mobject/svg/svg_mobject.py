@@ -22,6 +22,7 @@ from ...mobject.opengl_geometry import OpenGLRectangle, OpenGLRoundedRectangle
 from ...mobject.types.opengl_vectorized_mobject import OpenGLVGroup
 from ...mobject.types.vectorized_mobject import MetaVMobject, VGroup, VMobject
 from .style_utils import cascade_element_style, parse_style
+from .svg_cache import get_geometry_file, load_geometry, parsed_svg_cache, save_geometry
 from .svg_path import SVGPathMobject, string_to_numbers
 
 
@@ -78,6 +79,7 @@ class SVGMobject(metaclass=MetaVMobject):
         **kwargs,
     ):
         self.def_map = {}
+        self.path_styles = {}
         self.file_name = file_name or self.file_name
         self.ensure_valid_file()
         self.should_center = should_center
@@ -125,16 +127,50 @@ class SVGMobject(metaclass=MetaVMobject):
         the SVGMobject's points from XML tags, populating self.mobjects, and
         any submobjects within self.mobjects.
         """
+        key = parsed_svg_cache.get_key(
+            self.file_path,
+            type(self),
+            self.unpack_groups,
+            tuple(sorted(self.path_string_config.items())),
+        )
+        mobjects = parsed_svg_cache.get(key)
+        if mobjects is None:
+            geometry_file = get_geometry_file(key)
+            if geometry_file is not None:
+                mobjects = load_geometry(
+                    geometry_file, self.file_path, self.path_string_to_mobject
+                )
+            if mobjects is None:
+                mobjects = self.get_mobjects_from_file()
+                if geometry_file is not None:
+                    save_geometry(
+                        geometry_file, self.file_path, mobjects, self.path_styles
+                    )
+                self.path_styles = {}
+            parsed_svg_cache.put(key, mobjects)
+        self.add(*mobjects)
+
+    init_points = generate_points
+
+    def get_mobjects_from_file(self):
+        """Parses the SVG file.
+
+        Returns
+        -------
+        List[VMobject]
+            The mobjects of the file, which become the submobjects of the
+            SVGMobject.
+        """
+        result = []
         doc = minidom_parse(self.file_path)
         for svg in doc.getElementsByTagName("svg"):
             mobjects = self.get_mobjects_from(svg, {})
             if self.unpack_groups:
-                self.add(*mobjects)
+                result += mobjects
             else:
-                self.add(*mobjects[0].submobjects)
+                result += mobjects[0].submobjects
         doc.unlink()
-
-    init_points = generate_points
+        return result
 
     def get_mobjects_from(
         self,
@@ -185,7 +221,7 @@ class SVGMobject(metaclass=MetaVMobject):
         elif element.tagName == "path":
             temp = element.getAttribute("d")
             if temp != "":
-                result.append(self.path_string_to_mobject(temp, style))
+                result.append(self.styled_path_to_mobject(temp, style))
         elif element.tagName == "use":
             # note, style is calcuated in a different way for `use` elements.
             result += self.use_to_mobjects(element, style)
@@ -243,6 +279,16 @@ class SVGMobject(metaclass=MetaVMobject):
             path_string, **self.path_string_config, **parse_style(style)
         )
 
+    def styled_path_to_mobject(self, path_string: str, style: dict):
+        """Converts a path with :meth:`path_string_to_mobject`, and remembers
+        its style to save the geometry of the file."""
+        mobject = self.path_string_to_mobject(path_string, style)
+        # The styles are keyed by the mobjects themselves, which keeps the paths
+        # thrown away, like the ones in <defs>, from being mistaken for the
+        # mobjects built later at the same address.
+        self.path_styles[mobject] = style
+        return mobject
+
     def attribute_to_float(self, attr):
         """A helper method which converts the attribute to float.
 
@@ -464,7 +510,7 @@ class SVGMobject(metaclass=MetaVMobject):
         path_string = "M" + path_string
         if polygon_element.tagName == "polygon":
             path_string = path_string + "Z"
-        return self.path_string_to_mobject(path_string, style)
+        return self.styled_path_to_mobject(path_string, style)
 
     def handle_transforms(self, element, mobject):
         """Applies the SVG transform to the specified mobject. Transforms include:
@@ -64,10 +64,36 @@ from ...mobject.geometry import Dot
 from ...mobject.svg.svg_mobject import SVGMobject
 from ...mobject.types.vectorized_mobject import VGroup
 from ...utils.color import WHITE, Colors
+from ...utils.file_ops import cache_file_lock, temporary_file_path
 
 TEXT_MOB_SCALE_FACTOR = 0.05
 
 
+def generate_svg_file(file_name, write_svg):
+    """Writes the SVG file of a text, unless another process wrote it already.
+
+    Parameters
+    ----------
+    file_name : :class:`str`
+        The path of the SVG file.
+    write_svg : Callable[[:class:`str`], Any]
+        Writes the SVG file to the path it's given, with one of the
+        ``text2svg`` functions of ManimPango.
+
+    Returns
+    -------
+    :class:`str`
+        The path of the SVG file.
+    """
+    if os.path.exists(file_name):
+        return file_name
+    with cache_file_lock(file_name):
+        if not os.path.exists(file_name):
+            write_svg(temporary_file_path(file_name))
+            os.replace(temporary_file_path(file_name), file_name)
+    return file_name
+
+
 def remove_invisible_chars(mobject):
     """Function to remove unwanted invisible characters from some mobject
 
@@ -655,17 +681,20 @@ class Text(SVGMobject):
         width = 600
         height = 400
 
-        return manimpango.text2svg(
-            settings,
-            size,
-            line_spacing,
-            disable_liga,
+        return generate_svg_file(
             file_name,
-            START_X,
-            START_Y,
-            width,
-            height,
-            self.text,
+            lambda path: manimpango.text2svg(
+                settings,
+                size,
+                line_spacing,
+                disable_liga,
+                path,
+                START_X,
+                START_Y,
+                width,
+                height,
+                self.text,
+            ),
         )
 
     def init_colors(self, propagate_colors=True):
@@ -1028,19 +1057,23 @@ class MarkupText(SVGMobject):
             return file_name
 
         logger.debug(f"Setting Text {self.text}")
-        return MarkupUtils.text2svg(
-            f'<span foreground="{self.color}">{self.text}</span>',
-            self.font,
-            self.slant,
-            self.weight,
-            size,
-            line_spacing,
-            disable_liga,
+        markup = f'<span foreground="{self.color}">{self.text}</span>'
+        return generate_svg_file(
             file_name,
-            START_X,
-            START_Y,
-            600,  # width
-            400,  # height
+            lambda path: MarkupUtils.text2svg(
+                markup,
+                self.font,
+                self.slant,
+                self.weight,
+                size,
+                line_spacing,
+                disable_liga,
+                path,
+                START_X,
+                START_Y,
+                600,  # width
+                400,  # height
+            ),
         )
 
     def _count_real_chars(self, s):
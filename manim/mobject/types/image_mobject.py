@@ -194,9 +194,10 @@ class ImageMobject(AbstractImageMobject):
 
     def set_color(self, color, alpha=None, family=True):
         rgb = color_to_int_rgb(color)
-        self.pixel_array[:, :, :3] = rgb
+        pixel_array = self.get_writable_array("pixel_array")
+        pixel_array[:, :, :3] = rgb
         if alpha is not None:
-            self.pixel_array[:, :, 3] = int(255 * alpha)
+            pixel_array[:, :, 3] = int(255 * alpha)
         for submob in self.submobjects:
             submob.set_color(color, alpha, family)
         self.color = color
@@ -211,7 +212,7 @@ class ImageMobject(AbstractImageMobject):
             The alpha value of the object, 1 being opaque and 0 being
             transparent.
         """
-        self.pixel_array[:, :, 3] = int(255 * alpha)
+        self.get_writable_array("pixel_array")[:, :, 3] = int(255 * alpha)
         self.fill_opacity = alpha
         self.stroke_opacity = alpha
         return self
@@ -53,7 +53,8 @@ class PMobject(Mobject):
         rgba = color_to_rgba(color)
         mobs = self.family_members_with_points() if family else [self]
         for mob in mobs:
-            mob.rgbas[:, :] = rgba
+            mob.get_writable_array("rgbas")[:, :] = rgba
+            mob.bump_version()
         self.color = color
         return self
 
@@ -11,7 +11,6 @@ __all__ = [
 ]
 
 
-import itertools as it
 import sys
 import typing
 from abc import ABCMeta
@@ -193,12 +192,14 @@ class VMobject(Mobject):
             setattr(self, array_name, curr_rgbas)
         elif len(rgbas) < len(curr_rgbas):
             rgbas = stretch_array_to_length(rgbas, len(curr_rgbas))
+        curr_rgbas = self.get_writable_array(array_name)
         # Only update rgb if color was not None, and only
         # update alpha channel if opacity was passed in
         if color is not None:
             curr_rgbas[:, :3] = rgbas[:, :3]
         if opacity is not None:
             curr_rgbas[:, 3] = rgbas[:, 3]
+        self.bump_version()
         return self
 
     def set_fill(self, color=None, opacity=None, family=True):
@@ -500,6 +501,7 @@ class VMobject(Mobject):
         arrays = [anchors1, handles1, handles2, anchors2]
         for index, array in enumerate(arrays):
             self.points[index::nppcc] = array
+        self.bump_version()
         return self
 
     def clear_points(self):
@@ -1085,13 +1087,25 @@ class VMobject(Mobject):
         """
         if self.points.shape[0] == 1:
             return self.points
-        return np.array(
-            list(it.chain(*zip(self.get_start_anchors(), self.get_end_anchors())))
-        )
+        start_anchors = self.get_start_anchors()
+        end_anchors = self.get_end_anchors()
+        num_curves = min(len(start_anchors), len(end_anchors))
+        # The start and end anchors of each curve, one after the other.
+        return np.stack(
+            [start_anchors[:num_curves], end_anchors[:num_curves]], axis=1
+        ).reshape(-1, self.points.shape[1])
 
     def get_points_defining_boundary(self):
         # Probably returns all anchors, but this is weird regarding  the name of the method.
-        return np.array(list(it.chain(*[sm.get_anchors() for sm in self.get_family()])))
+        points = self.get_packed_points()
+        nppcc = self.n_points_per_cubic_curve
+        if points is not None and all(
+            len(view) % nppcc == 0 for _, view in self.packed_points.views
+        ):
+            # The curves of all the members follow each other in the array.
+            curves = points.reshape(-1, nppcc, points.shape[1])
+            return curves[:, [0, nppcc - 1]].reshape(-1, points.shape[1])
+        return np.concatenate([sm.get_anchors() for sm in self.get_family()])
 
     def get_arc_length(self, sample_points_per_curve: Optional[int] = None) -> float:
         """Return the approximated length of the whole curve.
@@ -79,7 +79,8 @@ class ValueTracker(Mobject):
 
     def set_value(self, value: float):
         """Sets a new scalar value to the ValueTracker"""
-        self.points[0, 0] = value
+        self.get_writable_array("points")[0, 0] = value
+        self.bump_version()
         return self
 
     def increment_value(self, d_value: float):
@@ -170,5 +171,6 @@ class ComplexValueTracker(ValueTracker):
     def set_value(self, z):
         """Sets a new complex value to the ComplexValueTracker"""
         z = complex(z)
-        self.points[0, :2] = (z.real, z.imag)
+        self.get_writable_array("points")[0, :2] = (z.real, z.imag)
+        self.bump_version()
         return self
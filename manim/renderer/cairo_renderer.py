@@ -1,9 +1,11 @@
+import random
 import time
 import typing
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 
-from manim.utils.hashing import get_hash_from_play_call
+from manim.utils.hashing import StructuralHasher, get_hash_from_play_call
 
 from .. import config, logger
 from ..camera.camera import Camera
@@ -11,6 +13,7 @@ from ..mobject.mobject import Mobject
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils.exceptions import EndSceneEarlyException
 from ..utils.iterables import list_update
+from ..utils.module_ops import get_scene_class
 
 
 def handle_play_like_call(func):
@@ -66,21 +69,43 @@ class CairoRenderer:
         self.camera = camera_cls()
         self._original_skipping_status = skip_animations
         self.skip_animations = skip_animations
+        self.skip_rendering = False
         self.animations_hashes = []
+        self.hasher = StructuralHasher()
         self.num_plays = 0
         self.time = 0
         self.static_image = None
+        # When rendering with several workers, the scene is first played without
+        # rendering any frame, to find out which animations are not cached yet.
+        self.planning = (
+            config["workers"] > 1
+            and config["write_to_movie"]
+            and config["format"] != "png"
+            and not config["dry_run"]
+        )
+        self.pending_segments = []
+        self.cached_plays = set()
+        # In a render worker, maps the indices of the animations to render to their hash.
+        self.segments = None
+        # The workers play the scene again, and must draw the same random
+        # numbers as the planning, which hashed the animations they render.
+        self.random_seed = _worker_random_seed
+        if self.planning:
+            self.random_seed = random.randrange(2 ** 32)
 
     def init_scene(self, scene):
         self.file_writer = SceneFileWriter(
             self,
             scene.__class__.__name__,
         )
+        if scene.random_seed is None:
+            scene.random_seed = self.random_seed
 
     def play(self, scene, *args, **kwargs):
         # Reset skip_animations to the original state.
         # Needed when rendering only some animations, and skipping others.
         self.skip_animations = self._original_skipping_status
+        self.skip_rendering = False
         self.update_skipping_status()
 
         scene.compile_animation_data(*args, **kwargs)
@@ -88,20 +113,45 @@ class CairoRenderer:
         if self.skip_animations:
             logger.debug(f"Skipping animation {self.num_plays}")
             hash_current_animation = None
+        elif self.segments is not None:
+            # The animations rendered by other workers are still played frame by
+            # frame, so that the scene reaches the next animation to render in
+            # the same state as in a serial render.
+            hash_current_animation = self.segments.get(self.num_plays)
+            if self.num_plays in self.cached_plays:
+                self.skip_animations = True
+            elif hash_current_animation is None:
+                self.skip_rendering = True
         else:
             if config["disable_caching"]:
                 logger.info("Caching disabled.")
                 hash_current_animation = f"uncached_{self.num_plays:05}"
             else:
                 hash_current_animation = get_hash_from_play_call(
-                    scene, self.camera, scene.animations, scene.mobjects
+                    scene,
+                    self.camera,
+                    scene.animations,
+                    scene.mobjects,
+                    hasher=self.hasher,
                 )
-                if self.file_writer.is_already_cached(hash_current_animation):
+                # While planning, animations seen earlier in the scene will be
+                # in the cache by the time the movie files are combined.
+                if self.file_writer.is_already_cached(hash_current_animation) or (
+                    self.planning and hash_current_animation in self.animations_hashes
+                ):
                     logger.info(
                         f"Animation {self.num_plays} : Using cached data (hash : %(hash_current_animation)s)",
                         {"hash_current_animation": hash_current_animation},
                     )
                     self.skip_animations = True
+            if self.planning:
+                if self.skip_animations:
+                    self.cached_plays.add(self.num_plays)
+                else:
+                    self.pending_segments.append(
+                        (self.num_plays, hash_current_animation, scene.duration)
+                    )
+                    self.skip_rendering = True
         # adding None as a partial movie file will make file_writer ignore the latter.
         self.file_writer.add_partial_movie_file(hash_current_animation)
         self.animations_hashes.append(hash_current_animation)
@@ -111,21 +161,68 @@ class CairoRenderer:
         )
 
         # Save a static image, to avoid rendering non moving objects.
-        self.static_image = self.save_static_frame_data(scene, scene.static_mobjects)
+        if self.skip_rendering:
+            self.static_image = None
+        else:
+            self.static_image = self.save_static_frame_data(
+                scene, scene.static_mobjects
+            )
 
-        self.file_writer.begin_animation(not self.skip_animations)
+        allow_write = not (self.skip_animations or self.skip_rendering)
+        frozen_frame = scene.is_current_animation_frozen_frame()
+        # The frame of a static wait is only sent once to FFMPEG, which repeats it.
+        static_frames = None
+        if frozen_frame:
+            static_frames = self.get_num_frames(scene.duration) or None
+        self.file_writer.begin_animation(allow_write, static_frames=static_frames)
         scene.begin_animations()
-        if scene.is_current_animation_frozen_frame():
-            self.update_frame(scene)
+        if frozen_frame:
+            if not self.skip_rendering:
+                self.update_frame(scene)
             # self.duration stands for the total run time of all the animations.
             # In this case, as there is only a wait, it will be the length of the wait.
             self.freeze_current_frame(scene.duration)
         else:
-            scene.play_internal()
-        self.file_writer.end_animation(not self.skip_animations)
+            scene.play_internal(skip_rendering=self.skip_rendering)
+        self.file_writer.end_animation(allow_write)
 
         self.num_plays += 1
 
+    def render_pending_segments(self, scene):
+        """Render the animations found during the planning of the scene, using
+        ``config["workers"]`` processes.
+
+        Each worker plays the scene again, with the same random seed, and only
+        renders its share of the animations to their partial movie files.
+
+        Parameters
+        ----------
+        scene : Scene
+            The planned scene.
+        """
+        chunks = _split_segments(self.pending_segments, config["workers"])
+        logger.info(
+            f"Rendering {len(self.pending_segments)} animations with {len(chunks)} workers"
+        )
+        scene_class = type(scene)
+        with ProcessPoolExecutor(
+            max_workers=len(chunks),
+            initializer=_init_render_worker,
+            initargs=(config.copy(), scene.random_seed),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _render_segments,
+                    scene_class.__module__,
+                    scene_class.__name__,
+                    {index: hash_animation for index, hash_animation, _ in chunk},
+                    self.cached_plays,
+                )
+                for chunk in chunks
+            ]
+            for future in futures:
+                future.result()
+
     def update_frame(  # TODO Description in Docstring
         self,
         scene,
@@ -168,7 +265,9 @@ class CairoRenderer:
 
     def render(self, scene, time, moving_mobjects):
         self.update_frame(scene, moving_mobjects)
-        self.add_frame(self.get_frame())
+        # The file writer copies the frames it queues, so the pixel array
+        # doesn't have to be copied by get_frame.
+        self.add_frame(self.camera.pixel_array)
 
     def get_frame(self):
         """
@@ -195,10 +294,9 @@ class CairoRenderer:
         """
         dt = 1 / self.camera.frame_rate
         self.time += num_frames * dt
-        if self.skip_animations:
+        if self.skip_animations or self.skip_rendering:
             return
-        for _ in range(num_frames):
-            self.file_writer.write_frame(frame)
+        self.file_writer.write_frame(frame, num_frames)
 
     def freeze_current_frame(self, duration: float):
         """Adds a static frame to the movie for a given duration. The static frame is the current frame.
@@ -208,12 +306,16 @@ class CairoRenderer:
         duration : float
             [description]
         """
-        dt = 1 / self.camera.frame_rate
         self.add_frame(
             self.get_frame(),
-            num_frames=int(duration / dt),
+            num_frames=self.get_num_frames(duration),
         )
 
+    def get_num_frames(self, duration: float) -> int:
+        """Returns the number of frames shown during ``duration`` seconds."""
+        dt = 1 / self.camera.frame_rate
+        return int(duration / dt)
+
     def show_frame(self):
         """
         Opens the current frame in the Default Image Viewer
@@ -264,10 +366,14 @@ class CairoRenderer:
             if self.num_plays > config["upto_animation_number"]:
                 self.skip_animations = True
                 raise EndSceneEarlyException()
+        if self.segments is not None and self.num_plays > max(self.segments):
+            raise EndSceneEarlyException()
 
     def scene_finished(self, scene):
         # If no animations in scene, render an image instead
         if self.num_plays:
+            if self.pending_segments:
+                self.render_pending_segments(scene)
             self.file_writer.finish()
         elif config.write_to_movie:
             config.save_last_frame = True
@@ -278,3 +384,45 @@ class CairoRenderer:
         if config["save_last_frame"]:
             self.update_frame(scene)
             self.file_writer.save_final_image(self.camera.get_image())
+
+
+def _split_segments(segments, n_chunks):
+    """Split a list of ``(index, hash, duration)`` segments into at most
+    ``n_chunks`` consecutive chunks of similar total duration."""
+    total_duration = sum(duration for _, _, duration in segments)
+    chunks = [[]]
+    elapsed = 0
+    for segment in segments:
+        chunks[-1].append(segment)
+        elapsed += segment[2]
+        if (
+            len(chunks) < n_chunks
+            and elapsed >= total_duration * len(chunks) / n_chunks
+        ):
+            chunks.append([])
+    return [chunk for chunk in chunks if chunk]
+
+
+# The random seed of the scene played by the parent of a render worker.
+_worker_random_seed = None
+
+
+def _init_render_worker(parent_config, random_seed):
+    global _worker_random_seed
+    _worker_random_seed = random_seed
+    config.update(parent_config)
+    config.workers = 1
+    config.progress_bar = "none"
+
+
+def _render_segments(module_name, scene_name, segments, cached_plays):
+    scene = get_scene_class(module_name, scene_name)()
+    scene.renderer.segments = segments
+    scene.renderer.cached_plays = cached_plays
+    scene.setup()
+    try:
+        scene.construct()
+    except EndSceneEarlyException:
+        pass
+    scene.tear_down()
+    scene.renderer.file_writer.wait_for_remote_cache()
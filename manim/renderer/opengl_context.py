@@ -0,0 +1,70 @@
+"""Creation of the OpenGL contexts of the renderer.
+
+Without a preview window, the OpenGL renderer draws in a standalone context
+created by :func:`create_context`, with the backend chosen by
+``config["opengl_backend"]``:
+
+- ``"default"``: the default backend of moderngl for the platform, which
+  needs a display on Linux.
+- ``"egl"``: EGL, which needs no display and uses the GPU driver.
+- ``"software"``: EGL with Mesa's software rasterizer (llvmpipe), for
+  machines without a GPU.
+- ``"auto"``: the default backend, or EGL when it fails, for example when
+  there is no display.
+
+Several contexts can exist in a process, for example the contexts of
+several :class:`~.OpenGLRenderer` instances.  Each renderer makes its context
+current with :func:`make_current` before drawing.
+
+"""
+
+__all__ = ["OPENGL_BACKENDS", "create_context", "make_current"]
+
+
+import os
+
+import moderngl
+
+from .. import config, logger
+
+OPENGL_BACKENDS = ["auto", "default", "egl", "software"]
+
+
+def create_context(backend=None):
+    """Creates a standalone OpenGL context.
+
+    Parameters
+    ----------
+    backend : Optional[:class:`str`]
+        One of :data:`OPENGL_BACKENDS`.  By default, ``config["opengl_backend"]``.
+
+    Returns
+    -------
+    :class:`moderngl.Context`
+        The new context, which is current.
+    """
+    if backend is None:
+        backend = config["opengl_backend"]
+    if backend == "auto":
+        try:
+            return moderngl.create_standalone_context()
+        except Exception as error:
+            logger.debug(f"Using EGL, the default OpenGL backend failed: {error}")
+            return moderngl.create_standalone_context(backend="egl")
+    if backend == "default":
+        return moderngl.create_standalone_context()
+    if backend == "egl":
+        return moderngl.create_standalone_context(backend="egl")
+    if backend == "software":
+        # Mesa reads this when it loads its driver, so it must be set before
+        # the first context of the process is created.
+        os.environ["LIBGL_ALWAYS_SOFTWARE"] = "1"
+        return moderngl.create_standalone_context(backend="egl")
+    raise ValueError(f"Unknown OpenGL backend {backend}; must be in {OPENGL_BACKENDS}")
+
+
+def make_current(context):
+    """Makes a context current in this thread, until another one is."""
+    # Entering a moderngl context makes it current, but exiting it leaves no
+    # context current, which would break the drawing done outside the block.
+    context.__enter__()
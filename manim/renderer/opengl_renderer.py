@@ -1,9 +1,9 @@
 import itertools as it
 import time
+from collections import deque
 
 import moderngl
 import numpy as np
-from PIL import Image
 
 from manim import config
 from manim.renderer.cairo_renderer import handle_play_like_call
@@ -15,6 +15,7 @@ from ..constants import *
 from ..mobject.opengl_mobject import OpenGLMobject, OpenGLPoint
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils import opengl
+from ..utils.iterables import batch_by_property
 from ..utils.simple_functions import clip
 from ..utils.space_ops import (
     angle_of_vector,
@@ -23,8 +24,9 @@ from ..utils.space_ops import (
     rotation_matrix_transpose,
     rotation_matrix_transpose_from_quaternion,
 )
-from .opengl_renderer_window import Window
+from .opengl_context import create_context, make_current
 from .shader import Mesh, Shader
+from .texture_cache import TextureCache
 
 
 class OpenGLCamera(OpenGLMobject):
@@ -202,8 +204,15 @@ class OpenGLRenderer:
         self.camera = OpenGLCamera()
         self.pressed_keys = set()
 
-        # Initialize texture map.
-        self.path_to_texture_id = {}
+        # The meshes drawing the batches of shader wrappers, whose buffers are
+        # reused between frames.
+        self.meshes = []
+
+        # The pixel buffer objects which the frames of the movie are copied
+        # into, so that reading a frame doesn't stall until the GPU draws it.
+        self.max_frame_readbacks = 3
+        self.free_readback_buffers = []
+        self.pending_frame_readbacks = deque()
 
     def init_scene(self, scene):
         self.partial_movie_files = []
@@ -214,15 +223,31 @@ class OpenGLRenderer:
         self.scene = scene
         if not hasattr(self, "window"):
             if config["preview"]:
+                # The window needs a display, which rendering without
+                # preview doesn't.
+                from .opengl_renderer_window import Window
+
                 self.window = Window(self)
                 self.context = self.window.ctx
                 self.frame_buffer_object = self.context.detect_framebuffer()
+                self.resolved_frame_buffer_object = self.frame_buffer_object
             else:
                 self.window = None
-                self.context = moderngl.create_standalone_context()
-                self.frame_buffer_object = self.get_frame_buffer_object(self.context, 0)
+                self.context = create_context()
+                self.frame_buffer_object = self.get_frame_buffer_object(
+                    self.context, config["opengl_samples"]
+                )
                 self.frame_buffer_object.use()
+                # The frames are read from this frame buffer, which the
+                # multisampled frame buffer is resolved into.
+                if config["opengl_samples"]:
+                    self.resolved_frame_buffer_object = self.get_frame_buffer_object(
+                        self.context
+                    )
+                else:
+                    self.resolved_frame_buffer_object = self.frame_buffer_object
             self.context.enable(moderngl.BLEND)
+            self.texture_cache = TextureCache(self.context)
             self.context.blend_func = (
                 moderngl.SRC_ALPHA,
                 moderngl.ONE_MINUS_SRC_ALPHA,
@@ -230,6 +255,12 @@ class OpenGLRenderer:
                 moderngl.ONE,
             )
 
+    def make_context_current(self):
+        """Makes the context of the renderer current, so that several
+        renderers can draw one after the other in the same thread."""
+        if self.window is None:
+            make_current(self.context)
+
     def get_pixel_shape(self):
         return self.frame_buffer_object.viewport[2:4]
 
@@ -253,17 +284,52 @@ class OpenGLRenderer:
             "focal_distance": camera.get_focal_distance(),
         }
 
+    def get_shader_wrapper_batches(self, mobjects):
+        """Merges the consecutive shader wrappers of mobjects which can be
+        drawn with a single draw call.
+
+        Only consecutive wrappers are merged, so that the mobjects are still
+        drawn in order.
+
+        Parameters
+        ----------
+        mobjects : List[:class:`~.OpenGLMobject`]
+            The mobjects, in drawing order.
+
+        Returns
+        -------
+        List[:class:`~.ShaderWrapper`]
+            One shader wrapper per draw call.
+        """
+        shader_wrappers = it.chain(
+            *[mobject.get_shader_wrapper_list() for mobject in mobjects]
+        )
+        result = []
+        for wrapper_group, _ in batch_by_property(
+            shader_wrappers, lambda shader_wrapper: shader_wrapper.get_id()
+        ):
+            shader_wrapper = wrapper_group[0]
+            shader_wrapper.combine_with(*wrapper_group[1:])
+            result.append(shader_wrapper)
+        return result
+
     def render_mobject(self, mobject):
-        shader_wrapper_list = mobject.get_shader_wrapper_list()
+        self.render_mobjects([mobject])
+
+    def render_mobjects(self, mobjects):
+        shader_wrapper_list = self.get_shader_wrapper_batches(mobjects)
+        meshes = self.meshes
 
         # Convert ShaderWrappers to Meshes.
-        for shader_wrapper in shader_wrapper_list:
+        for index, shader_wrapper in enumerate(shader_wrapper_list):
             shader = Shader(self.context, shader_wrapper.shader_folder)
 
             # Set textures.
-            for name, path in shader_wrapper.texture_paths.items():
-                tid = self.get_texture_id(path)
-                shader.shader_program[name].value = tid
+            texture_units = self.texture_cache.bind(
+                shader_wrapper.texture_paths.values()
+            )
+            for name, unit in zip(shader_wrapper.texture_paths, texture_units):
+                shader.shader_program[name].value = unit
 
             # Set uniforms.
             for name, value in it.chain(
@@ -288,27 +354,25 @@ class OpenGLRenderer:
                 self.context.disable(moderngl.DEPTH_TEST)
 
             # Render.
-            mesh = Mesh(
-                shader,
-                shader_wrapper.vert_data,
-                indices=shader_wrapper.vert_indices,
-                use_depth_test=shader_wrapper.depth_test,
-            )
+            if index < len(meshes):
+                mesh = meshes[index]
+                mesh.shader = shader
+                mesh.attributes = shader_wrapper.vert_data
+                mesh.indices = shader_wrapper.vert_indices
+                mesh.use_depth_test = shader_wrapper.depth_test
+            else:
+                mesh = Mesh(
+                    shader,
+                    shader_wrapper.vert_data,
+                    indices=shader_wrapper.vert_indices,
+                    use_depth_test=shader_wrapper.depth_test,
+                )
+                meshes.append(mesh)
             mesh.render()
 
-    def get_texture_id(self, path):
-        if path not in self.path_to_texture_id:
-            # A way to increase tid's sequentially
-            tid = len(self.path_to_texture_id)
-            im = Image.open(path)
-            texture = self.context.texture(
-                size=im.size,
-                components=len(im.getbands()),
-                data=im.tobytes(),
-            )
-            texture.use(location=tid)
-            self.path_to_texture_id[path] = tid
-        return self.path_to_texture_id[path]
+        for mesh in meshes[len(shader_wrapper_list) :]:
+            mesh.release()
+        del meshes[len(shader_wrapper_list) :]
 
     def update_skipping_status(self):
         """
@@ -340,12 +404,13 @@ class OpenGLRenderer:
         self.window.swap_buffers()
 
     def render(self, scene, frame_offset, moving_mobjects):
+        self.make_context_current()
+
         def update_frame():
             self.frame_buffer_object.clear(*window_background_color)
             self.refresh_perspective_uniforms(scene.camera)
 
-            for mobject in scene.mobjects:
-                self.render_mobject(mobject)
+            self.render_mobjects(scene.mobjects)
 
             view_matrix = scene.camera.get_view_matrix()
             for mesh in scene.meshes:
@@ -396,22 +461,77 @@ class OpenGLRenderer:
             ),
         )
 
+    def get_resolved_frame_buffer_object(self):
+        """Returns the frame buffer holding the last frame, after resolving
+        the multisampled frame buffer into it if needed."""
+        self.make_context_current()
+        if self.resolved_frame_buffer_object is not self.frame_buffer_object:
+            self.context.copy_framebuffer(
+                self.resolved_frame_buffer_object, self.frame_buffer_object
+            )
+        return self.resolved_frame_buffer_object
+
     def get_raw_frame_buffer_object_data(self, dtype="f1"):
-        # Copy blocks from the fbo_msaa to the drawn fbo using Blit
-        # pw, ph = self.get_pixel_shape()
-        # gl.glBindFramebuffer(gl.GL_READ_FRAMEBUFFER, self.fbo_msaa.glo)
-        # gl.glBindFramebuffer(gl.GL_DRAW_FRAMEBUFFER, self.fbo.glo)
-        # gl.glBlitFramebuffer(
-        #     0, 0, pw, ph, 0, 0, pw, ph, gl.GL_COLOR_BUFFER_BIT, gl.GL_LINEAR
-        # )
+        frame_buffer_object = self.get_resolved_frame_buffer_object()
         num_channels = 4
-        ret = self.frame_buffer_object.read(
-            viewport=self.frame_buffer_object.viewport,
+        ret = frame_buffer_object.read(
+            viewport=frame_buffer_object.viewport,
             components=num_channels,
             dtype=dtype,
         )
         return ret
 
+    def start_frame_readback(self, num_frames=1):
+        """Starts copying the frame buffer into a pixel buffer object.
+
+        The GPU copies the frame while the next frames are drawn, and the copy
+        is read later by :meth:`finish_frame_readbacks`.
+
+        Parameters
+        ----------
+        num_frames : :class:`int`
+            The number of times the frame is written to the movie.
+        """
+        frame_buffer_object = self.get_resolved_frame_buffer_object()
+        width, height = self.get_pixel_shape()
+        size = width * height * 4
+        if self.free_readback_buffers:
+            buffer = self.free_readback_buffers.pop()
+            if buffer.size != size:
+                buffer.orphan(size)
+        else:
+            buffer = self.context.buffer(reserve=size)
+        frame_buffer_object.read_into(
+            buffer, viewport=frame_buffer_object.viewport, components=4
+        )
+        self.pending_frame_readbacks.append((buffer, num_frames))
+
+    def finish_frame_readbacks(self, keep=None):
+        """Yields the oldest copies started by :meth:`start_frame_readback`.
+
+        Each pixel buffer object must be read before the next one is
+        requested, since it's then reused for another frame.
+
+        Parameters
+        ----------
+        keep : Optional[:class:`int`]
+            The number of the most recent copies which are left to the GPU.
+            By default, ``max_frame_readbacks - 1``.
+
+        Yields
+        ------
+        Tuple[:class:`moderngl.Buffer`, :class:`int`]
+            A pixel buffer object holding a frame, and the number of times
+            the frame is written.
+        """
+        if keep is None:
+            keep = self.max_frame_readbacks - 1
+        while len(self.pending_frame_readbacks) > keep:
+            buffer, num_frames = self.pending_frame_readbacks.popleft()
+            self.make_context_current()
+            yield buffer, num_frames
+            self.free_readback_buffers.append(buffer)
+
     def get_frame(self):
         # get current pixel values as numpy data in order to test output
         raw = self.get_raw_frame_buffer_object_data(dtype="f1")
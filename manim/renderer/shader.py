@@ -11,7 +11,6 @@ from ..utils import opengl
 from ..utils.simple_functions import get_parameters
 
 SHADER_FOLDER = Path(__file__).parent / "shaders"
-shader_program_cache = {}
 file_path_to_code_map = {}
 
 
@@ -33,6 +32,50 @@ def get_shader_code_from_file(file_path):
         return source
 
 
+def get_shader_source_from_folder(name):
+    """Reads the code of the shaders in a folder of :data:`SHADER_FOLDER`."""
+    source_dict = {}
+    source_dict_key = {
+        "vert": "vertex_shader",
+        "frag": "fragment_shader",
+        "geom": "geometry_shader",
+    }
+    shader_folder = SHADER_FOLDER / name
+    for shader_file in shader_folder.iterdir():
+        shader_file_path = shader_folder / shader_file
+        shader_source = get_shader_code_from_file(shader_file_path)
+        source_dict[source_dict_key[shader_file_path.stem]] = shader_source
+    return source_dict
+
+
+def get_shader_program_cache(context):
+    """Returns the programs compiled in a context.
+
+    They are kept in the user data of the context, so that they are released
+    with it.
+    """
+    if context.extra is None:
+        context.extra = {}
+    return context.extra.setdefault("SHADER_PROGRAMS", {})
+
+
+def write_buffer(context, buffer, data):
+    """Writes data to a buffer, which is created if it is None, and orphaned
+    if its size changes.
+
+    Returns
+    -------
+    :class:`moderngl.Buffer`
+        The buffer holding the data.
+    """
+    if buffer is None:
+        return context.buffer(data)
+    if buffer.size != len(data):
+        buffer.orphan(len(data))
+    buffer.write(data)
+    return buffer
+
+
 class Mesh:
     def __init__(self, shader, attributes, indices=None, use_depth_test=True):
         self.shader = shader
@@ -47,6 +90,15 @@ class Mesh:
         self.model_matrix = np.eye(4)
         self.model_matrix_needs_update = False
 
+        # The buffers are kept between renders, and only written when the
+        # attributes or the indices change.
+        self.vertex_buffer_object = None
+        self.index_buffer_object = None
+        self.vertex_array_object = None
+        self.vertex_array_layout = None
+        self.written_attributes = None
+        self.written_indices = None
+
     def render(self):
         # Set matrix uniforms.
         if self.model_matrix_needs_update:
@@ -61,26 +113,79 @@ class Mesh:
         if self.use_depth_test:
             self.shader.context.enable(moderngl.DEPTH_TEST)
 
-        vertex_buffer_object = self.shader.context.buffer(self.attributes.tobytes())
-        if self.indices is None:
-            index_buffer_object = None
-        else:
-            vert_index_data = self.indices.astype("i4").tobytes()
-            if vert_index_data:
-                index_buffer_object = self.shader.context.buffer(vert_index_data)
+        if self.update_buffers():
+            self.vertex_array_object.render(moderngl.TRIANGLES)
+
+    def update_buffers(self):
+        """Writes the attributes and the indices to the buffers of the mesh
+        if they changed since the last render.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether there is anything to render.
+        """
+        context = self.shader.context
+        attributes = self.attributes.tobytes()
+        if not attributes:
+            return False
+        indices = b"" if self.indices is None else self.indices.astype("i4").tobytes()
+
+        if attributes != self.written_attributes:
+            self.vertex_buffer_object = write_buffer(
+                context, self.vertex_buffer_object, attributes
+            )
+            self.written_attributes = attributes
+        if indices != self.written_indices:
+            # The vertex array is bound to its index buffer, if any.
+            if not indices:
+                self.release_buffer("index_buffer_object")
+                self.release_buffer("vertex_array_object")
             else:
-                index_buffer_object = None
-        vertex_array_object = self.shader.context.simple_vertex_array(
-            self.shader.shader_program,
-            vertex_buffer_object,
-            *self.attributes.dtype.names,
-            index_buffer=index_buffer_object,
+                if self.index_buffer_object is None:
+                    self.release_buffer("vertex_array_object")
+                self.index_buffer_object = write_buffer(
+                    context, self.index_buffer_object, indices
+                )
+            self.written_indices = indices
+
+        vertex_array_layout = (self.shader.shader_program, self.attributes.dtype.names)
+        if (
+            self.vertex_array_object is None
+            or self.vertex_array_layout != vertex_array_layout
+        ):
+            self.release_buffer("vertex_array_object")
+            self.vertex_array_object = context.simple_vertex_array(
+                self.shader.shader_program,
+                self.vertex_buffer_object,
+                *self.attributes.dtype.names,
+                index_buffer=self.index_buffer_object,
+            )
+            self.vertex_array_layout = vertex_array_layout
+        # The number of vertices of the vertex array isn't updated when its
+        # buffers are resized.  Without indices, all the vertices are drawn.
+        self.vertex_array_object.vertices = len(
+            self.indices if indices else self.attributes
         )
-        vertex_array_object.render(moderngl.TRIANGLES)
-        vertex_buffer_object.release()
-        vertex_array_object.release()
-        if index_buffer_object is not None:
-            index_buffer_object.release()
+        return True
+
+    def release_buffer(self, name):
+        buffer = getattr(self, name)
+        if buffer is not None:
+            buffer.release()
+            setattr(self, name, None)
+
+    def release(self):
+        """Releases the buffers of the mesh, which are allocated again by the
+        next render."""
+        for name in [
+            "vertex_array_object",
+            "vertex_buffer_object",
+            "index_buffer_object",
+        ]:
+            self.release_buffer(name)
+        self.written_attributes = None
+        self.written_indices = None
 
     def init_updaters(self):
         self.time_based_updaters = []
@@ -166,31 +271,18 @@ class Shader:
         self.context = context
         self.name = name
 
-        # See if the program is cached.
-        if self.name in shader_program_cache:
-            self.shader_program = shader_program_cache[self.name]
-
-        # Generate the shader from inline code if it was passed.
+        # Programs are compiled once per context, and identified by the name
+        # of their folder or by their code.
+        shader_program_cache = get_shader_program_cache(context)
         if source is not None:
-            self.shader_program = context.program(**source)
+            cache_key = tuple(sorted(source.items()))
         else:
-            # Search for a file containing the shader.
-            source_dict = {}
-            source_dict_key = {
-                "vert": "vertex_shader",
-                "frag": "fragment_shader",
-                "geom": "geometry_shader",
-            }
-            shader_folder = SHADER_FOLDER / name
-            for shader_file in shader_folder.iterdir():
-                shader_file_path = shader_folder / shader_file
-                shader_source = get_shader_code_from_file(shader_file_path)
-                source_dict[source_dict_key[shader_file_path.stem]] = shader_source
-            self.shader_program = context.program(**source_dict)
-
-        # Cache the shader.
-        if name is not None:
-            shader_program_cache[self.name] = self.shader_program
+            cache_key = name
+        if cache_key not in shader_program_cache:
+            if source is None:
+                source = get_shader_source_from_folder(name)
+            shader_program_cache[cache_key] = context.program(**source)
+        self.shader_program = shader_program_cache[cache_key]
 
     def set_uniform(self, name, value):
         self.shader_program[name] = value
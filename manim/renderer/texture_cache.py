@@ -0,0 +1,189 @@
+"""Cache of the textures of the OpenGL renderer.
+
+Each image file used as a texture is loaded once and kept in GPU memory,
+for as long as the total size of the textures stays under
+``config["max_texture_cache_bytes"]``.  Images with identical contents
+share a single texture.
+
+Textures are bound to texture units only when they are drawn, so that
+scenes can use many more images than there are texture units.
+
+"""
+
+__all__ = ["TextureCache"]
+
+
+import hashlib
+import io
+import os
+from collections import OrderedDict
+
+import moderngl
+from PIL import Image
+
+from .. import config
+
+# The image modes which are loaded as they are, other modes are converted to RGBA.
+TEXTURE_IMAGE_MODES = {"L": 1, "LA": 2, "RGB": 3, "RGBA": 4}
+
+
+class TextureCache:
+    """A least recently used cache of the textures of image files.
+
+    Files are identified by their path, modification time and size, and
+    textures by the contents of the files.  When ``config["texture_mipmaps"]``
+    is set, the textures get mipmaps, which makes downscaled images smoother.
+
+    Parameters
+    ----------
+    context : :class:`moderngl.Context`
+        The context the textures are created in.
+
+    Attributes
+    ----------
+    hits : :class:`int`
+        The number of textures found in the cache.
+    misses : :class:`int`
+        The number of textures which had to be created.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        # The digests of the files contents, by key of the files.
+        self.file_digests = {}
+        # The textures and their sizes, by digest.
+        self.entries = OrderedDict()
+        # The units of the bound textures, by digest, least recently used first.
+        self.units = OrderedDict()
+        # moderngl binds the textures it creates to its default unit, which
+        # would replace the texture bound there.
+        self.free_units = [
+            unit
+            for unit in reversed(range(context.info["GL_MAX_TEXTURE_IMAGE_UNITS"]))
+            if unit != context.default_texture_unit
+        ]
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, path):
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+    def get_digest(self, path):
+        """Returns the digest of the contents of an image file, and the
+        contents if the file had to be read."""
+        key = self.get_key(path)
+        digest = self.file_digests.get(key)
+        if digest is not None:
+            return digest, None
+        with open(path, "rb") as image_file:
+            data = image_file.read()
+        digest = hashlib.sha256(data).hexdigest()
+        self.file_digests[key] = digest
+        return digest, data
+
+    def get(self, path, keep=()):
+        """Returns the digest of the texture of an image file, creating the
+        texture if it's not in the cache.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The path of the image file.
+        keep : Collection[:class:`str`]
+            The digests of textures which mustn't be evicted to make room for
+            this one.
+
+        Returns
+        -------
+        :class:`str`
+            The digest of the texture.
+        """
+        digest, data = self.get_digest(path)
+        if digest in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(digest)
+            return digest
+        self.misses += 1
+        if data is None:
+            with open(path, "rb") as image_file:
+                data = image_file.read()
+        image = Image.open(io.BytesIO(data))
+        if image.mode not in TEXTURE_IMAGE_MODES:
+            image = image.convert("RGBA")
+        texture = self.context.texture(
+            size=image.size,
+            components=TEXTURE_IMAGE_MODES[image.mode],
+            data=image.tobytes(),
+        )
+        size = image.size[0] * image.size[1] * TEXTURE_IMAGE_MODES[image.mode]
+        if config["texture_mipmaps"]:
+            texture.build_mipmaps()
+            texture.filter = (moderngl.LINEAR_MIPMAP_LINEAR, moderngl.LINEAR)
+            # The mipmaps take a third of the size of the image.
+            size += size // 3
+        self.entries[digest] = (texture, size)
+        self.size += size
+        self.evict(keep={digest, *keep})
+        return digest
+
+    def evict(self, keep=()):
+        """Releases the least recently used textures until the cache fits in
+        ``config["max_texture_cache_bytes"]``, except those in ``keep``."""
+        max_bytes = config["max_texture_cache_bytes"]
+        if max_bytes < 0:
+            return
+        for digest in list(self.entries):
+            if self.size <= max_bytes:
+                return
+            if digest in keep:
+                continue
+            texture, size = self.entries.pop(digest)
+            if digest in self.units:
+                self.free_units.append(self.units.pop(digest))
+            texture.release()
+            self.size -= size
+
+    def bind(self, paths):
+        """Binds the textures of image files to texture units.
+
+        The textures keep their unit while they are drawn, and take the
+        unit of the least recently drawn texture otherwise.
+
+        Parameters
+        ----------
+        paths : Iterable[:class:`str`]
+            The paths of the images files drawn together.
+
+        Returns
+        -------
+        List[:class:`int`]
+            The texture unit of each image file.
+        """
+        digests = []
+        for path in paths:
+            digests.append(self.get(path, keep=digests))
+        units = []
+        for digest in digests:
+            unit = self.units.get(digest)
+            if unit is None:
+                if self.free_units:
+                    unit = self.free_units.pop()
+                else:
+                    # The textures of this draw were just moved to the end.
+                    _, unit = self.units.popitem(last=False)
+                self.entries[digest][0].use(location=unit)
+                self.units[digest] = unit
+            self.units.move_to_end(digest)
+            units.append(unit)
+        return units
+
+    def clear(self):
+        """Releases all the textures, but keeps the counters."""
+        for texture, _ in self.entries.values():
+            texture.release()
+        self.entries.clear()
+        self.free_units.extend(self.units.values())
+        self.units.clear()
+        self.size = 0
@@ -7,7 +7,11 @@ import datetime
 import os
 import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from queue import Queue
 from time import sleep
 
 import numpy as np
@@ -18,12 +22,13 @@ from manim import __version__
 
 from .. import config, logger
 from ..constants import FFMPEG_BIN, GIF_FILE_EXTENSION
+from ..utils.cache_backends import get_cache_backend
 from ..utils.file_ops import (
     add_extension_if_not_present,
     add_version_before_extension,
     guarantee_existence,
-    modify_atime,
 )
+from ..utils.partial_movie_cache import PartialMovieCache
 from ..utils.sounds import get_full_sound_file_path
 
 
@@ -44,11 +49,17 @@ class SceneFileWriter(object):
             The file-type extension of the outputted video.
         "partial_movie_files"
             List of all the partial-movie files.
+        "frame_queue_size" (int=4)
+            The number of frames that can wait to be sent to FFMPEG
+            while the next ones are rendered.
 
     """
 
+    frame_queue_size = 4
+
     def __init__(self, renderer, scene_name, **kwargs):
         self.renderer = renderer
+        self.scene_name = scene_name
         self.stream_lock = False
         self.init_output_directories(scene_name)
         self.init_audio()
@@ -110,6 +121,14 @@ class SceneFileWriter(object):
                     module_name=module_name,
                 )
             )
+            self.partial_movie_cache = PartialMovieCache()
+            self.remote_cache = None
+            if config["remote_cache"]:
+                self.remote_cache = get_cache_backend(config["remote_cache"])
+                # Partial movie files are published in the background, while
+                # the next animations are rendered.
+                self.remote_cache_uploads = []
+                self.remote_cache_executor = ThreadPoolExecutor(max_workers=1)
 
     def add_partial_movie_file(self, hash_animation):
         """Adds a new partial movie file path to scene.partial_movie_files from an hash. This method will compute the path from the hash.
@@ -242,7 +261,7 @@ class SceneFileWriter(object):
         self.add_audio_segment(new_segment, time, **kwargs)
 
     # Writers
-    def begin_animation(self, allow_write=False, file_path=None):
+    def begin_animation(self, allow_write=False, file_path=None, static_frames=None):
         """
         Used internally by manim to stream the animation to FFMPEG for
         displaying or writing to a file.
@@ -251,9 +270,12 @@ class SceneFileWriter(object):
         ----------
         allow_write : bool, optional
             Whether or not to write to a video file.
+        static_frames : int, optional
+            If the animation is a single frame repeated, its number of frames,
+            see :meth:`open_movie_pipe`.
         """
         if config["write_to_movie"] and allow_write:
-            self.open_movie_pipe(file_path=file_path)
+            self.open_movie_pipe(file_path=file_path, static_frames=static_frames)
 
     def end_animation(self, allow_write=False):
         """
@@ -268,7 +290,7 @@ class SceneFileWriter(object):
         if config["write_to_movie"] and allow_write:
             self.close_movie_pipe()
 
-    def write_frame(self, frame_or_renderer):
+    def write_frame(self, frame_or_renderer, num_frames=1):
         """
         Used internally by Manim to write a frame to
         the FFMPEG input buffer.
@@ -277,20 +299,128 @@ class SceneFileWriter(object):
         ----------
         frame : np.array
             Pixel array of the frame.
+        num_frames : int, optional
+            The number of times to write the frame.
         """
         if config.renderer == "opengl":
             renderer = frame_or_renderer
-            self.writing_process.stdin.write(
-                renderer.get_raw_frame_buffer_object_data()
-            )
+            renderer.start_frame_readback(num_frames)
+            self.queue_frame_readbacks(renderer.finish_frame_readbacks())
         else:
             frame = frame_or_renderer
             if config["write_to_movie"]:
-                self.writing_process.stdin.write(frame.tobytes())
+                self.queue_frame(frame, num_frames)
             if config["format"] == "png":
                 path, extension = os.path.splitext(self.image_file_path)
-                Image.fromarray(frame).save(f"{path}{self.frame_count}{extension}")
-                self.frame_count += 1
+                image = Image.fromarray(frame)
+                for _ in range(num_frames):
+                    image.save(f"{path}{self.frame_count}{extension}")
+                    self.frame_count += 1
+
+    def queue_frame(self, frame, num_frames=1):
+        """
+        Hands a frame over to the thread writing to FFMPEG's input buffer.
+
+        Pixel arrays are copied into one of the ``frame_queue_size`` buffers
+        of the writer, so the caller can draw the next frame right away.
+        Consecutive identical frames share the same buffer, and are only
+        sent once to FFMPEG when the pipe was opened for a static frame.
+        When ``frame_queue_size`` frames are waiting to be written, this
+        blocks until FFMPEG catches up.
+
+        Parameters
+        ----------
+        frame : Union[np.array, bytes]
+            Pixel array of the frame, or its raw bytes.
+        num_frames : int, optional
+            The number of times to write the frame.
+        """
+        if self.writer_error is not None:
+            raise self.writer_error
+        if not isinstance(frame, np.ndarray):
+            self.put_in_frame_queue(frame, num_frames)
+            return
+        if self.pending_frame is not None:
+            if self.is_pending_frame(frame):
+                self.pending_frame_count += num_frames
+                return
+            self.put_in_frame_queue(self.pending_frame, self.pending_frame_count)
+        wait_start = time.perf_counter()
+        buffer = self.free_frame_buffers.get()
+        self.writer_wait_time += time.perf_counter() - wait_start
+        np.copyto(buffer, frame)
+        self.pending_frame = buffer
+        self.pending_frame_count = num_frames
+
+    def queue_frame_readbacks(self, readbacks):
+        """
+        Hands the frames read back from the GPU by the OpenGL renderer over
+        to the thread writing to FFMPEG's input buffer.
+
+        The pixel buffer objects are read directly into the buffers of the
+        writer, see :meth:`queue_frame`.
+
+        Parameters
+        ----------
+        readbacks : Iterable[Tuple[:class:`moderngl.Buffer`, :class:`int`]]
+            The pixel buffer objects holding the frames, with the number of
+            times each frame is written.
+        """
+        if self.writer_error is not None:
+            raise self.writer_error
+        for readback_buffer, num_frames in readbacks:
+            wait_start = time.perf_counter()
+            buffer = self.free_frame_buffers.get()
+            self.writer_wait_time += time.perf_counter() - wait_start
+            readback_buffer.read_into(buffer)
+            self.put_in_frame_queue(buffer, num_frames)
+
+    def is_pending_frame(self, frame):
+        """
+        Checks whether a frame is identical to the last one queued.
+
+        The frames are compared by blocks of rows, so that different frames
+        are usually told apart without reading them entirely.
+        """
+        for start in range(0, len(frame), 64):
+            if not np.array_equal(
+                frame[start : start + 64], self.pending_frame[start : start + 64]
+            ):
+                return False
+        return True
+
+    def put_in_frame_queue(self, frame, num_frames):
+        self.repeated_frames += num_frames - 1
+        if self.static_frames is not None:
+            # FFMPEG repeats the frame, see open_movie_pipe.
+            num_frames = 1
+        wait_start = time.perf_counter()
+        self.frame_queue.put((frame, num_frames))
+        self.writer_wait_time += time.perf_counter() - wait_start
+        self.max_queued_frames = max(self.max_queued_frames, self.frame_queue.qsize())
+
+    def write_queued_frames(self):
+        """
+        Writes the queued frames to FFMPEG's input buffer, until ``None`` is
+        queued.  Runs in its own thread, see :meth:`open_movie_pipe`.
+        """
+        while True:
+            item = self.frame_queue.get()
+            if item is None:
+                return
+            frame, num_frames = item
+            try:
+                if self.writer_error is None:
+                    # Pixel arrays are written without being copied to bytes first.
+                    data = frame.data if isinstance(frame, np.ndarray) else frame
+                    for _ in range(num_frames):
+                        self.writing_process.stdin.write(data)
+            except Exception as error:
+                # Raised by the rendering thread, on its next frame.
+                self.writer_error = error
+            finally:
+                if isinstance(frame, np.ndarray):
+                    self.free_frame_buffers.put(frame)
 
     def save_final_image(self, image):
         """
@@ -338,17 +468,27 @@ class SceneFileWriter(object):
         if config["write_to_movie"]:
             if hasattr(self, "writing_process"):
                 self.writing_process.terminate()
+            self.wait_for_remote_cache()
             self.combine_movie_files(partial_movie_files=partial_movie_files)
             if config["flush_cache"]:
                 self.flush_cache_directory()
             else:
                 self.clean_cache()
 
-    def open_movie_pipe(self, file_path=None):
+    def open_movie_pipe(self, file_path=None, static_frames=None):
         """
         Used internally by Manim to initialise
         FFMPEG and begin writing to FFMPEG's input
         buffer.
+
+        Parameters
+        ----------
+        file_path : str, optional
+            The path of the movie file to write.
+        static_frames : int, optional
+            If given, the movie is a single frame shown for this number of
+            frames.  Only that frame goes through the pipe, and FFMPEG
+            repeats it.
         """
         if file_path is None:
             file_path = self.partial_movie_files[self.renderer.num_plays]
@@ -382,8 +522,13 @@ class SceneFileWriter(object):
             "-metadata",
             f"comment=Rendered with Manim Community v{__version__}",
         ]
+        filters = []
         if config.renderer == "opengl":
-            command += ["-vf", "vflip"]
+            filters.append("vflip")
+        if static_frames is not None:
+            filters.append(f"tpad=stop_mode=clone:stop={static_frames - 1}")
+        if filters:
+            command += ["-vf", ",".join(filters)]
         if config["transparent"]:
             command += ["-vcodec", "qtrle"]
         else:
@@ -391,12 +536,69 @@ class SceneFileWriter(object):
         command += [file_path]
         self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
 
+        # Frames are sent to FFMPEG by another thread, so that rendering the
+        # next frame doesn't wait for FFMPEG to read the previous one.
+        self.frame_queue = Queue(maxsize=self.frame_queue_size)
+        self.free_frame_buffers = Queue()
+        for _ in range(self.frame_queue_size):
+            self.free_frame_buffers.put(np.empty((height, width, 4), dtype="uint8"))
+        self.static_frames = static_frames
+        self.pending_frame = None
+        self.pending_frame_count = 0
+        self.writer_error = None
+        self.writer_wait_time = 0
+        self.max_queued_frames = 0
+        self.repeated_frames = 0
+        self.writer_thread = threading.Thread(
+            target=self.write_queued_frames, daemon=True
+        )
+        self.writer_thread.start()
+
     def close_movie_pipe(self):
         """
         Used internally by Manim to gracefully stop writing to FFMPEG's input buffer
+
+        If a frame couldn't be written, FFMPEG is still stopped, and the
+        incomplete partial movie file is deleted before the error is raised.
         """
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
+        all_frames_queued = False
+        try:
+            if config.renderer == "opengl":
+                self.queue_frame_readbacks(self.renderer.finish_frame_readbacks(keep=0))
+            if self.pending_frame is not None:
+                self.put_in_frame_queue(self.pending_frame, self.pending_frame_count)
+            all_frames_queued = True
+        finally:
+            self.frame_queue.put(None)
+            self.writer_thread.join()
+            try:
+                self.writing_process.stdin.close()
+            except OSError as error:
+                # FFMPEG exited without reading everything.
+                if self.writer_error is None:
+                    self.writer_error = error
+            self.writing_process.wait()
+            if not all_frames_queued or self.writer_error is not None:
+                # The file misses frames, it mustn't be found in the cache.
+                if os.path.exists(self.partial_movie_file_path):
+                    os.remove(self.partial_movie_file_path)
+        if self.writer_error is not None:
+            raise self.writer_error
+        self.partial_movie_cache.add(self.partial_movie_file_path, self.scene_name)
+        if self.remote_cache is not None and not config["disable_caching"]:
+            self.remote_cache_uploads.append(
+                self.remote_cache_executor.submit(
+                    self.remote_cache.publish,
+                    os.path.basename(self.partial_movie_file_path),
+                    self.partial_movie_file_path,
+                )
+            )
+
+        logger.debug(
+            f"Animation {self.renderer.num_plays} : Rendering waited {self.writer_wait_time:.2f}s for FFMPEG, "
+            f"with at most {self.max_queued_frames} frames queued, "
+            f"{self.repeated_frames} frames were repeated"
+        )
 
         logger.info(
             f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
@@ -404,7 +606,7 @@ class SceneFileWriter(object):
         )
 
     def is_already_cached(self, hash_invocation):
-        """Will check if a file named with `hash_invocation` exists.
+        """Will check if a file named with `hash_invocation` is in the cache.
 
         Parameters
         ----------
@@ -414,7 +616,7 @@ class SceneFileWriter(object):
         Returns
         -------
         :class:`bool`
-            Whether the file exists.
+            Whether the file is cached.
         """
         if not hasattr(self, "partial_movie_directory"):
             return False
@@ -422,7 +624,35 @@ class SceneFileWriter(object):
             self.partial_movie_directory,
             f"{hash_invocation}{config['movie_file_extension']}",
         )
-        return os.path.exists(path)
+        if self.partial_movie_cache.contains(path, self.scene_name):
+            # Mark the file as used right away, so that other scenes cleaning
+            # the cache don't evict it before this scene combines it.
+            self.partial_movie_cache.touch([path])
+            return True
+        if self.remote_cache is None:
+            return False
+        try:
+            fetched = self.remote_cache.fetch(os.path.basename(path), path)
+        except Exception as error:
+            logger.warning(f"Could not fetch {path} from the remote cache: {error}")
+            return False
+        if fetched:
+            logger.info(f"Fetched {os.path.basename(path)} from the remote cache")
+            self.partial_movie_cache.add(path, self.scene_name)
+        return fetched
+
+    def wait_for_remote_cache(self):
+        """Waits for the partial movie files to be published to the remote
+        cache, and reports the ones which couldn't be."""
+        if getattr(self, "remote_cache", None) is None:
+            return
+        for upload in self.remote_cache_uploads:
+            error = upload.exception()
+            if error is not None:
+                logger.warning(
+                    f"Could not publish a partial movie file to the remote cache: {error}"
+                )
+        self.remote_cache_uploads = []
 
     def combine_movie_files(self, partial_movie_files=None):
         """
@@ -538,31 +768,20 @@ class SceneFileWriter(object):
             self.gif_file_path if config["save_as_gif"] else movie_file_path
         )
         if config["write_to_movie"]:
-            for file_path in partial_movie_files:
-                # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
-                modify_atime(file_path)
+            # Mark the files as used, so that they are the last ones to be evicted from the cache.
+            self.partial_movie_cache.touch(partial_movie_files)
 
     def clean_cache(self):
-        """Will clean the cache by removing the partial_movie_files used by manim the longest ago."""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        if len(cached_partial_movies) > config["max_files_cached"]:
-            number_files_to_delete = (
-                len(cached_partial_movies) - config["max_files_cached"]
-            )
-            oldest_files_to_delete = sorted(
-                cached_partial_movies,
-                key=os.path.getatime,
-            )[:number_files_to_delete]
-            # oldest_file_path = min(cached_partial_movies, key=os.path.getatime)
-            for file_to_delete in oldest_files_to_delete:
-                os.remove(file_to_delete)
+        """Will clean the cache by removing the partial movie files used by manim the longest ago,
+        across all the scenes of the media directory."""
+        removed_files = self.partial_movie_cache.evict(
+            max_bytes=config["max_cache_bytes"],
+            max_files_per_directory=config["max_files_cached"],
+        )
+        if removed_files:
             logger.info(
-                f"The partial movie directory is full (> {config['max_files_cached']} files). Therefore, manim has removed {number_files_to_delete} file(s) used by it the longest ago."
-                + "You can change this behaviour by changing max_files_cached in config."
+                f"The cache is full (> {config['max_files_cached']} files per scene or > {config['max_cache_bytes']} bytes). Therefore, manim has removed {len(removed_files)} file(s) used by it the longest ago."
+                + "You can change this behaviour by changing max_files_cached and max_cache_bytes in config."
             )
 
     def flush_cache_directory(self):
@@ -572,8 +791,7 @@ class SceneFileWriter(object):
             for file_name in os.listdir(self.partial_movie_directory)
             if file_name != "partial_movie_file_list.txt"
         ]
-        for f in cached_partial_movies:
-            os.remove(f)
+        self.partial_movie_cache.remove(cached_partial_movies)
         logger.info(
             f"Cache flushed. {len(cached_partial_movies)} file(s) deleted in %(par_dir)s.",
             {"par_dir": self.partial_movie_directory},
@@ -0,0 +1,229 @@
+"""Storages sharing partial movie files between machines.
+
+When ``config["remote_cache"]`` is set, partial movie files missing from the
+local cache are looked up in a shared storage before being rendered, and the
+newly rendered ones are published to it.  The storage is selected by the
+scheme of ``config["remote_cache"]``:
+
+- a path or a ``file://`` URL uses a directory, for example on a shared file
+  system, see :class:`DirectoryBackend`;
+- a ``s3://bucket/prefix`` URL uses an S3 compatible object store, see
+  :class:`S3Backend`.
+
+Other storages can be added with :func:`register_cache_backend`.
+
+"""
+
+__all__ = [
+    "CacheBackend",
+    "DirectoryBackend",
+    "S3Backend",
+    "register_cache_backend",
+    "get_cache_backend",
+]
+
+
+import hashlib
+import os
+import shutil
+import uuid
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from .. import logger
+from .file_ops import guarantee_existence
+
+
+def file_digest(file_path):
+    """Computes the SHA-256 digest of a file, used to check fetched files."""
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(2 ** 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def temporary_path(file_path):
+    """Returns a unique path next to ``file_path``, to write it before renaming."""
+    file_path = Path(file_path)
+    return file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def move_if_valid(temporary_file, file_path, digest):
+    """Moves a fetched file to ``file_path`` if its digest is ``digest``.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the file was valid.
+    """
+    if file_digest(temporary_file) != digest:
+        os.remove(temporary_file)
+        logger.warning(
+            f"Ignoring {Path(file_path).name} from the remote cache, its content doesn't match its hash."
+        )
+        return False
+    os.replace(temporary_file, file_path)
+    return True
+
+
+class CacheBackend:
+    """A storage where partial movie files are shared.
+
+    Partial movie files are stored under a key, which is the name of the file:
+    the hash of the animation followed by the movie file extension.
+    """
+
+    def fetch(self, key, file_path):
+        """Downloads the file stored under ``key`` to ``file_path``.
+
+        The file only appears at ``file_path`` once it is completely downloaded,
+        and if its content matches the digest it was published with.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the file was found.
+        """
+        raise NotImplementedError
+
+    def publish(self, key, file_path):
+        """Uploads the file at ``file_path`` under ``key``, along with its digest.
+
+        Readers never see a partially published file.
+        """
+        raise NotImplementedError
+
+
+class DirectoryBackend(CacheBackend):
+    """Shares partial movie files in a directory, usually on a shared file system.
+
+    Each file is stored along with a ``.sha256`` file holding its digest,
+    which is written last, so that a file is only fetched once completely
+    published.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The shared directory.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(guarantee_existence(directory))
+
+    def fetch(self, key, file_path):
+        try:
+            digest = (self.directory / f"{key}.sha256").read_text()
+        except FileNotFoundError:
+            return False
+        temporary_file = temporary_path(file_path)
+        shutil.copyfile(self.directory / key, temporary_file)
+        return move_if_valid(temporary_file, file_path, digest)
+
+    def publish(self, key, file_path):
+        for name, write in [
+            (key, lambda path: shutil.copyfile(file_path, path)),
+            (f"{key}.sha256", lambda path: path.write_text(file_digest(file_path))),
+        ]:
+            temporary_file = temporary_path(self.directory / name)
+            write(temporary_file)
+            os.replace(temporary_file, self.directory / name)
+
+
+class S3Backend(CacheBackend):
+    """Shares partial movie files in an S3 compatible object store.
+
+    The digest of each file is stored in the metadata of its object.  Objects
+    are published atomically by the store.  This requires ``boto3``, which is
+    configured the usual way (environment variables, ``~/.aws/config``, ...).
+
+    Parameters
+    ----------
+    url : :class:`str`
+        A ``s3://bucket/prefix`` URL.  The ``endpoint_url`` query parameter
+        selects another store than AWS, for example
+        ``s3://manim/cache?endpoint_url=http://localhost:9000``.
+    """
+
+    def __init__(self, url):
+        try:
+            import boto3
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "The S3 remote cache requires boto3. Run pip install boto3 to install it."
+            )
+        parsed_url = urlparse(url)
+        self.bucket = parsed_url.netloc
+        self.prefix = parsed_url.path.strip("/")
+        endpoint_url = parse_qs(parsed_url.query).get("endpoint_url", [None])[0]
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+
+    def object_key(self, key):
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def fetch(self, key, file_path):
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.client.head_object(
+                Bucket=self.bucket, Key=self.object_key(key)
+            )
+        except ClientError:
+            return False
+        temporary_file = temporary_path(file_path)
+        self.client.download_file(
+            self.bucket, self.object_key(key), str(temporary_file)
+        )
+        return move_if_valid(
+            temporary_file, file_path, response["Metadata"].get("sha256")
+        )
+
+    def publish(self, key, file_path):
+        self.client.upload_file(
+            str(file_path),
+            self.bucket,
+            self.object_key(key),
+            ExtraArgs={"Metadata": {"sha256": file_digest(file_path)}},
+        )
+
+
+_CACHE_BACKENDS = {
+    "": lambda url: DirectoryBackend(url),
+    "file": lambda url: DirectoryBackend(urlparse(url).path),
+    "s3": S3Backend,
+}
+
+
+def register_cache_backend(scheme, factory):
+    """Makes a storage available to ``config["remote_cache"]``.
+
+    Parameters
+    ----------
+    scheme : :class:`str`
+        The scheme of the URLs of the storage.
+    factory : Callable[[:class:`str`], :class:`CacheBackend`]
+        Creates the backend from the URL.
+    """
+    _CACHE_BACKENDS[scheme] = factory
+
+
+def get_cache_backend(url):
+    """Creates the backend of a remote cache URL.
+
+    Parameters
+    ----------
+    url : :class:`str`
+        A path, or a URL with a registered scheme.
+
+    Returns
+    -------
+    :class:`CacheBackend`
+        The backend.
+    """
+    scheme = urlparse(url).scheme
+    # Windows drive letters look like schemes.
+    if len(scheme) == 1:
+        scheme = ""
+    if scheme not in _CACHE_BACKENDS:
+        raise ValueError(f"Unknown remote cache scheme {scheme!r} in {url}")
+    return _CACHE_BACKENDS[scheme](url)
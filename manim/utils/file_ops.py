@@ -5,6 +5,8 @@ __all__ = [
     "guarantee_existence",
     "seek_full_path_from_defaults",
     "modify_atime",
+    "cache_file_lock",
+    "temporary_file_path",
     "open_file",
 ]
 
@@ -13,9 +15,15 @@ import os
 import platform
 import subprocess as sp
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from shutil import copyfile
 
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
 from manim import __version__, config, logger
 
 from .. import console
@@ -63,6 +71,77 @@ def modify_atime(file_path):
     os.utime(file_path, times=(time.time(), os.path.getmtime(file_path)))
 
 
+@contextmanager
+def cache_file_lock(file_path):
+    """Hold an exclusive lock on a cache file, so that scenes rendered in
+    several processes do not generate it at the same time.
+
+    Cache files are written under a :func:`temporary_file_path` and then
+    renamed, so that a cache file which exists is complete and can be used
+    without taking the lock. The lock is only needed to generate the file,
+    after checking again that it doesn't exist.
+
+    The lock is taken on a file of the ``.locks`` directory next to
+    ``file_path``, and is released by the system if the process holding it
+    dies.
+
+    Parameters
+    ----------
+    file_path : :class:`str`
+        The path of the cache file.
+
+    Examples
+    --------
+    ::
+
+        if not os.path.exists(file_path):
+            with cache_file_lock(file_path):
+                if not os.path.exists(file_path):
+                    write_file(temporary_file_path(file_path))
+                    os.replace(temporary_file_path(file_path), file_path)
+    """
+    lock_dir = os.path.join(os.path.dirname(file_path), ".locks")
+    os.makedirs(lock_dir, exist_ok=True)
+    lock_path = os.path.join(lock_dir, f"{os.path.basename(file_path)}.lock")
+    with open(lock_path, "a") as lock_file:
+        if os.name == "nt":
+            while True:
+                try:
+                    # Blocks for at most 10 seconds before raising.
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        else:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def temporary_file_path(file_path):
+    """Return the path a cache file is written to before it's renamed to
+    ``file_path``, see :func:`cache_file_lock`. It keeps the extension of
+    ``file_path``.
+
+    Parameters
+    ----------
+    file_path : :class:`str`
+        The path of the cache file.
+
+    Returns
+    -------
+    :class:`str`
+        The temporary path.
+    """
+    root, extension = os.path.splitext(file_path)
+    return f"{root}.tmp{extension}"
+
+
 def open_file(file_path, in_browser=False):
     current_os = platform.system()
     if current_os == "Windows":
@@ -1,15 +1,28 @@
 """Utilities for scene caching."""
 
 import copy
+import functools
+import hashlib
 import inspect
 import json
+import operator
+import struct
+import weakref
 import zlib
 from time import perf_counter
-from types import FunctionType, MappingProxyType, MethodType, ModuleType
+from types import (
+    BuiltinFunctionType,
+    CodeType,
+    FunctionType,
+    MappingProxyType,
+    MethodType,
+    ModuleType,
+)
 
 import numpy as np
 
-from .. import logger
+from .. import config, logger
+from ..mobject.mobject import Mobject
 
 ALREADY_PROCESSED_ID = {}
 
@@ -65,6 +78,10 @@ class CustomEncoder(json.JSONEncoder):
             # Indeed, there is certainly no case where scene-caching will receive only a non instancied object, as this is never used in the library or encouraged to be used user-side.
             if isinstance(temp, MappingProxyType):
                 return "MappingProxy"
+            if isinstance(obj, Mobject) and "parents" in temp:
+                # The parents of a mobject would bring the whole tree it is
+                # part of into its hash.
+                temp = {k: v for k, v in temp.items() if k != "parents"}
             return self._check_iterable(temp)
         elif isinstance(obj, np.uint8):
             return int(obj)
@@ -208,13 +225,463 @@ def get_camera_dict_for_hashing(camera_object):
     # We have to clean a little bit of camera_dict, as pixel_array and background are two very big numpy arrays. They
     # are not essential to caching process. We also have to remove pixel_array_to_cairo_context as it contains used
     # memory address (set randomly). See l.516 get_cached_cairo_context in camera.py
-    for to_clean in ["background", "pixel_array", "pixel_array_to_cairo_context"]:
+    # The dirty rectangles and the cairo paths only describe what was drawn before.
+    for to_clean in [
+        "background",
+        "pixel_array",
+        "pixel_array_to_cairo_context",
+        "cairo_paths",
+        "pixel_array_source",
+        "pixel_array_source_state",
+        "dirty_rectangles",
+    ]:
         camera_object_dict.pop(to_clean, None)
     return camera_object_dict
 
 
+def _pack_int(value):
+    """Encode an arbitrarily large integer as little-endian bytes."""
+    return value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+
+
+def _pack_len(length):
+    return struct.pack("<Q", length)
+
+
+# Attributes recording the ids of other objects, like the copies of mobjects
+# do, which change from one run to the next.
+_UNSTABLE_ATTRS = frozenset(["original_id", "generated_original_ids"])
+
+
+# Attributes of mobjects that describe the structure of the mobject tree, which
+# is hashed separately from the state of each mobject, and the unstable ones.
+_MOBJECT_STRUCTURE_ATTRS = (
+    frozenset(["submobjects", "parents", "family", "_version"]) | _UNSTABLE_ATTRS
+)
+
+
+def _is_constant_function(func):
+    """Whether the digest of a function can't change: it closes over nothing,
+    and refers to no global value."""
+    return (
+        type(func) is FunctionType
+        and func.__closure__ is None
+        and func.__defaults__ is None
+        and func.__kwdefaults__ is None
+        and not any(name in func.__globals__ for name in func.__code__.co_names)
+    )
+
+
+class _MobjectFrame:
+    """Bookkeeping for a mobject whose digest is being computed."""
+
+    def __init__(self):
+        # Whether functions and mobjects met in the state of the mobject are
+        # being put aside (see StructuralHasher._get_own_digest).
+        self.collecting = False
+        self.volatile_values = []
+        self.dependencies = []
+        # Whether the digest refers to a mobject being hashed higher up in the
+        # stack, in which case it can't be reused elsewhere.
+        self.context_dependent = False
+
+
+class _MobjectDigest:
+    """What is cached about the state of a mobject, along with the values of
+    its attributes when it was hashed."""
+
+    def __init__(self, state, static_digest, volatile_values, dependencies):
+        # The values are kept alive, so that their ids can't be reused by the
+        # values assigned later.
+        self.attributes = tuple(state)
+        self.values = tuple(state.values())
+        self.shapes = [
+            (value, value.shape) for value in self.values if type(value) is np.ndarray
+        ]
+        self.static_digest = static_digest
+        self.volatile_values = volatile_values
+        self.dependencies = dependencies
+
+    def matches(self, state):
+        """Whether no attribute of the mobject was assigned, nor its version or
+        the shape of one of its arrays changed, since it was hashed."""
+        return (
+            len(state) == len(self.values)
+            and all(map(operator.is_, state.values(), self.values))
+            and tuple(state) == self.attributes
+            and all(array.shape == shape for array, shape in self.shapes)
+        )
+
+
+class StructuralHasher:
+    """Hash object graphs by walking them and streaming their raw data into blake2b.
+
+    Contrary to :class:`CustomEncoder`, nothing is converted to JSON or to a
+    ``repr``: numpy arrays are fed to the hash through their buffer, containers
+    and objects are walked directly, and functions are hashed through their
+    code objects and the values they close over.
+
+    The hasher does not rely on any global state, and a single instance can be
+    reused for every ``play`` call of a scene. Between two calls it keeps the
+    digests of code objects, which never change, and the digest of every
+    :class:`~.Mobject` it met and of its submobjects, along with the values of
+    the attributes of the mobject. The state of a mobject is only walked again
+    when one of its attributes was assigned, the shape of one of its arrays
+    changed, or its :attr:`~.Mobject.version` changed: arrays changed in place
+    without :meth:`~.Mobject.bump_version` aren't noticed. The functions found
+    in the state of a mobject, such as updaters, are always hashed again, as
+    they may close over values which have changed, unless they refer to no
+    value at all.
+
+    Hashing a scene still visits every mobject of the scene, to compare the
+    values of its attributes with the cached ones, so its cost grows with the
+    size of the scene, but much more slowly than walking and hashing the
+    whole state again.
+
+    Examples
+    --------
+    ::
+
+        >>> hasher = StructuralHasher()
+        >>> hasher.hash_object([1, 2.0, "three"]) == hasher.hash_object([1, 2.0, "three"])
+        True
+        >>> hasher.hash_object([1, 2.0]) == hasher.hash_object([1, 2])
+        False
+    """
+
+    digest_size = 8
+
+    def __init__(self):
+        self._code_digests = {}
+        self._mobject_digests = weakref.WeakKeyDictionary()
+        self._subtree_digests = weakref.WeakKeyDictionary()
+        self._mobject_stack = []
+        self._mobject_depths = {}
+        self._ignored = ()
+
+    def hash_object(self, obj, ignored=()):
+        """Compute the digest of ``obj``.
+
+        Parameters
+        ----------
+        obj : Any
+            The object to hash.
+        ignored : Iterable[Any]
+            Objects that must not be walked if they are found within ``obj``,
+            typically the scene itself.
+
+        Returns
+        -------
+        :class:`str`
+            The hexadecimal digest of ``obj``.
+        """
+        h = hashlib.blake2b(digest_size=self.digest_size)
+        self._ignored = tuple(ignored)
+        try:
+            self._feed(h, obj, self._new_memo())
+        finally:
+            self._ignored = ()
+        return h.hexdigest()
+
+    def _new_memo(self):
+        # The memo maps the id of every walked container to the order in which
+        # it was first met. Objects are kept alive in it so that ids are not
+        # reused while hashing.
+        return {id(o): (-1, o) for o in self._ignored}
+
+    def _feed_str(self, h, value):
+        data = value.encode("utf-8", "surrogatepass")
+        h.update(_pack_len(len(data)))
+        h.update(data)
+
+    def _feed_type(self, h, cls):
+        self._feed_str(h, f"{cls.__module__}.{cls.__qualname__}")
+
+    def _feed(self, h, obj, memo):
+        # Immutable leaves are dispatched first, as they are the most common.
+        obj_type = type(obj)
+        if obj is None:
+            h.update(b"N")
+            return
+        if obj_type is bool:
+            h.update(b"T" if obj else b"F")
+            return
+        if obj_type is int:
+            data = _pack_int(obj)
+            h.update(b"i")
+            h.update(_pack_len(len(data)))
+            h.update(data)
+            return
+        if obj_type is float:
+            h.update(b"d")
+            h.update(struct.pack("<d", obj))
+            return
+        if obj_type is str:
+            h.update(b"s")
+            self._feed_str(h, obj)
+            return
+        if obj_type is complex:
+            h.update(b"c")
+            h.update(struct.pack("<dd", obj.real, obj.imag))
+            return
+        if obj_type is bytes:
+            h.update(b"b")
+            h.update(_pack_len(len(obj)))
+            h.update(obj)
+            return
+        if isinstance(obj, np.generic):
+            h.update(b"g")
+            self._feed_str(h, obj.dtype.str)
+            h.update(obj.tobytes())
+            return
+        if isinstance(obj, (type, ModuleType, BuiltinFunctionType)):
+            h.update(b"t")
+            self._feed_str(h, getattr(obj, "__module__", None) or "")
+            self._feed_str(h, getattr(obj, "__qualname__", obj.__name__))
+            return
+        if isinstance(obj, CodeType):
+            h.update(b"k")
+            h.update(self._get_code_digest(obj))
+            return
+
+        # Everything else may be shared or self-referencing.
+        obj_id = id(obj)
+        if obj_id in memo:
+            h.update(b"R")
+            h.update(struct.pack("<q", memo[obj_id][0]))
+            return
+        memo[obj_id] = (len(memo), obj)
+
+        if (
+            isinstance(obj, np.ndarray)
+            and not obj.dtype.hasobject
+            and self._mobject_stack
+            and self._mobject_stack[-1].collecting
+        ):
+            h.update(b"V")
+            self._mobject_stack[-1].volatile_values.append(obj)
+        elif isinstance(obj, np.ndarray):
+            h.update(b"a")
+            self._feed_str(h, obj.dtype.str)
+            h.update(_pack_len(obj.ndim))
+            for dim in obj.shape:
+                h.update(_pack_len(dim))
+            if obj.dtype.hasobject:
+                for element in obj.flat:
+                    self._feed(h, element, memo)
+            else:
+                h.update(np.ascontiguousarray(obj).data)
+        elif isinstance(obj, (list, tuple)):
+            h.update(b"l" if isinstance(obj, list) else b"u")
+            h.update(_pack_len(len(obj)))
+            for element in obj:
+                self._feed(h, element, memo)
+        elif isinstance(obj, dict):
+            self._feed_dict(h, obj, memo)
+        elif isinstance(obj, Mobject):
+            digest = self._get_mobject_digest(obj)
+            h.update(b"M")
+            h.update(digest)
+            if self._mobject_stack and self._mobject_stack[-1].collecting:
+                self._mobject_stack[-1].dependencies.append((obj, digest))
+        elif isinstance(obj, (set, frozenset)):
+            # Sets have no stable order: hash their elements independently.
+            digests = []
+            for element in obj:
+                element_h = hashlib.blake2b(digest_size=self.digest_size)
+                self._feed(element_h, element, self._new_memo())
+                digests.append(element_h.digest())
+            h.update(b"S")
+            h.update(_pack_len(len(digests)))
+            for digest in sorted(digests):
+                h.update(digest)
+        elif (
+            isinstance(obj, (MethodType, FunctionType, functools.partial))
+            and self._mobject_stack
+            and self._mobject_stack[-1].collecting
+            and not _is_constant_function(obj)
+        ):
+            h.update(b"V")
+            self._mobject_stack[-1].volatile_values.append(obj)
+        elif isinstance(obj, MethodType):
+            h.update(b"m")
+            self._feed(h, obj.__func__, memo)
+        elif isinstance(obj, FunctionType):
+            self._feed_function(h, obj, memo)
+        elif isinstance(obj, functools.partial):
+            h.update(b"p")
+            self._feed(h, obj.func, memo)
+            self._feed(h, obj.args, memo)
+            self._feed(h, obj.keywords, memo)
+        elif isinstance(obj, MappingProxyType):
+            h.update(b"x")
+        elif hasattr(obj, "__dict__"):
+            h.update(b"o")
+            self._feed_type(h, obj_type)
+            state = obj.__dict__
+            if not _UNSTABLE_ATTRS.isdisjoint(state):
+                state = {
+                    key: value
+                    for key, value in state.items()
+                    if key not in _UNSTABLE_ATTRS
+                }
+            self._feed_dict(h, state, memo)
+        else:
+            # Objects we can't look into are only identified by their type and
+            # name, if any (e.g. numpy ufuncs).
+            h.update(b"?")
+            self._feed_type(h, obj_type)
+            self._feed_str(h, str(getattr(obj, "__name__", "")))
+
+    def _get_mobject_digest(self, mob):
+        """Compute the digest of a mobject and of its submobjects."""
+        depth = self._mobject_depths.get(id(mob))
+        if depth is not None:
+            # The mobject refers to itself, directly or not. Refer to it by its
+            # distance in the stack, and don't cache anything that depends on it.
+            for frame in self._mobject_stack[depth + 1 :]:
+                frame.context_dependent = True
+            return b"B" + struct.pack("<q", len(self._mobject_stack) - depth)
+
+        frame = _MobjectFrame()
+        self._mobject_depths[id(mob)] = len(self._mobject_stack)
+        self._mobject_stack.append(frame)
+        try:
+            digests = [self._get_own_digest(mob, frame)]
+            digests.extend(
+                self._get_mobject_digest(submob) for submob in mob.submobjects
+            )
+        finally:
+            self._mobject_stack.pop()
+            del self._mobject_depths[id(mob)]
+        cached = self._subtree_digests.get(mob)
+        if cached is not None and cached[0] == digests:
+            return cached[1]
+        h = hashlib.blake2b(digest_size=self.digest_size)
+        h.update(digests[0])
+        h.update(_pack_len(len(digests) - 1))
+        for digest in digests[1:]:
+            h.update(digest)
+        digest = h.digest()
+        if not frame.context_dependent:
+            self._subtree_digests[mob] = (digests, digest)
+        return digest
+
+    def _get_own_digest(self, mob, frame):
+        """Compute the digest of the state of a mobject, excluding its submobjects.
+
+        The state is split in two: a static part, which is only hashed again
+        when an attribute of the mobject is assigned, the shape of one of its
+        arrays or its version changes, and volatile values (functions, and
+        arrays found in containers), which are hashed on every call. Other
+        mobjects met in the state are hashed through their own digest, and
+        recorded as dependencies: if one of them changed, the static part is
+        hashed again.
+        """
+        cached = self._mobject_digests.get(mob)
+        if cached is not None and (
+            not cached.matches(mob.__dict__)
+            or any(
+                self._get_mobject_digest(dependency) != digest
+                for dependency, digest in cached.dependencies
+            )
+            or frame.context_dependent
+        ):
+            cached = None
+        if cached is None:
+            frame.context_dependent = False
+            static_h = hashlib.blake2b(digest_size=self.digest_size)
+            memo = self._new_memo()
+            memo[id(mob)] = (0, mob)
+            state = [
+                (key, value)
+                for key, value in mob.__dict__.items()
+                if key not in _MOBJECT_STRUCTURE_ATTRS
+            ]
+            self._feed_type(static_h, type(mob))
+            static_h.update(_pack_len(len(state)))
+            try:
+                for key, value in state:
+                    self._feed(static_h, key, memo)
+                    # The arrays held by the mobject itself are part of the
+                    # static part: they are checked by identity and shape, and
+                    # changing them in place bumps the version of the mobject.
+                    frame.collecting = not (
+                        type(value) is np.ndarray and not value.dtype.hasobject
+                    )
+                    self._feed(static_h, value, memo)
+            finally:
+                frame.collecting = False
+            cached = _MobjectDigest(
+                mob.__dict__,
+                static_h.digest(),
+                frame.volatile_values,
+                frame.dependencies,
+            )
+            if not frame.context_dependent:
+                self._mobject_digests[mob] = cached
+
+        if not cached.volatile_values:
+            return cached.static_digest
+        h = hashlib.blake2b(cached.static_digest, digest_size=self.digest_size)
+        for value in cached.volatile_values:
+            memo = self._new_memo()
+            memo[id(mob)] = (0, mob)
+            self._feed(h, value, memo)
+        return h.digest()
+
+    def _feed_dict(self, h, dct, memo):
+        h.update(b"D")
+        h.update(_pack_len(len(dct)))
+        for key, value in dct.items():
+            self._feed(h, key, memo)
+            self._feed(h, value, memo)
+
+    def _feed_function(self, h, func, memo):
+        code = func.__code__
+        h.update(b"f")
+        h.update(self._get_code_digest(code))
+        self._feed(h, func.__defaults__, memo)
+        self._feed(h, func.__kwdefaults__, memo)
+        # Nonlocal values.
+        for cell in func.__closure__ or ():
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                # The cell is empty.
+                value = None
+            self._feed(h, value, memo)
+        # Global values the function refers to.
+        func_globals = func.__globals__
+        for name in code.co_names:
+            if name in func_globals:
+                value = func_globals[name]
+                if isinstance(value, ModuleType):
+                    continue
+                self._feed_str(h, name)
+                self._feed(h, value, memo)
+
+    def _get_code_digest(self, code):
+        digest = self._code_digests.get(code)
+        if digest is None:
+            h = hashlib.blake2b(digest_size=self.digest_size)
+            h.update(code.co_code)
+            self._feed_str(h, "\0".join(code.co_names))
+            self._feed_str(h, "\0".join(code.co_varnames))
+            h.update(_pack_len(len(code.co_consts)))
+            for const in code.co_consts:
+                # Constants are immutable, so a fresh memo is fine.
+                self._feed(h, const, {})
+            digest = self._code_digests[code] = h.digest()
+        return digest
+
+
 def get_hash_from_play_call(
-    scene_object, camera_object, animations_list, current_mobjects_list
+    scene_object,
+    camera_object,
+    animations_list,
+    current_mobjects_list,
+    hasher=None,
 ):
     """Take the list of animations and a list of mobjects and output their hashes. This is meant to be used for `scene.play` function.
 
@@ -232,28 +699,47 @@ def get_hash_from_play_call(
     current_mobjects_list : Iterable[:class:`~.Mobject`]
         The list of mobjects.
 
+    hasher : Optional[:class:`StructuralHasher`]
+        The hasher to use when ``config["hashing_backend"]`` is ``"structural"``.
+        Passing the same hasher for every call of a scene lets it reuse the
+        digests it already computed. A new one is created if ``None``.
+
     Returns
     -------
     :class:`str`
         A string concatenation of the respective hashes of `camera_object`, `animations_list` and `current_mobjects_list`, separated by `_`.
     """
     logger.debug("Hashing ...")
-    global ALREADY_PROCESSED_ID
-    # We add the scene object within the ALREADY_PROCESSED_ID, as we don't want to process because pretty much all of its attributes will be soon or later processed (in one of the three hashes).
-    ALREADY_PROCESSED_ID = {id(scene_object): scene_object}
     t_start = perf_counter()
-    camera_json = get_json(get_camera_dict_for_hashing(camera_object))
-    animations_list_json = [get_json(x) for x in sorted(animations_list, key=str)]
-    current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
-    hash_camera, hash_animations, hash_current_mobjects = [
-        zlib.crc32(repr(json_val).encode())
-        for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
-    ]
+    camera_dict = get_camera_dict_for_hashing(camera_object)
+    animations_list = sorted(animations_list, key=str)
+    if config["hashing_backend"] == "structural":
+        if hasher is None:
+            hasher = StructuralHasher()
+        hash_camera, hash_animations, hash_current_mobjects = [
+            hasher.hash_object(obj, ignored=[scene_object])
+            for obj in [camera_dict, animations_list, current_mobjects_list]
+        ]
+    else:
+        global ALREADY_PROCESSED_ID
+        # We add the scene object within the ALREADY_PROCESSED_ID, as we don't want to process because pretty much all of its attributes will be soon or later processed (in one of the three hashes).
+        ALREADY_PROCESSED_ID = {id(scene_object): scene_object}
+        camera_json = get_json(camera_dict)
+        animations_list_json = [get_json(x) for x in animations_list]
+        current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
+        hash_camera, hash_animations, hash_current_mobjects = [
+            zlib.crc32(repr(json_val).encode())
+            for json_val in [
+                camera_json,
+                animations_list_json,
+                current_mobjects_list_json,
+            ]
+        ]
+        # This will reset ALREADY_PROCESSED_ID as all the hashing process is finished.
+        ALREADY_PROCESSED_ID = {}
     t_end = perf_counter()
     logger.debug("Hashing done in %(time)s s.", {"time": str(t_end - t_start)[:8]})
     hash_complete = f"{hash_camera}_{hash_animations}_{hash_current_mobjects}"
-    # This will reset ALREADY_PROCESSED_ID as all the hashing process is finished.
-    ALREADY_PROCESSED_ID = {}
     logger.debug("Hash generated :  %(h)s", {"h": hash_complete})
     return hash_complete
 
@@ -264,6 +750,7 @@ def get_hash_from_wait_call(
     wait_time,
     stop_condition_function,
     current_mobjects_list,
+    hasher=None,
 ):
     """Take a wait time, a boolean function as a stop condition and a list of mobjects, and then output their individual hashes. This is meant to be used for `scene.wait` function.
 
@@ -277,6 +764,9 @@ def get_hash_from_wait_call(
         The time to wait
     stop_condition_function : Callable[[...], bool]
         Boolean function used as a stop_condition in `wait`.
+    hasher : Optional[:class:`StructuralHasher`]
+        The hasher to use when ``config["hashing_backend"]`` is ``"structural"``.
+        A new one is created if ``None``.
 
     Returns
     -------
@@ -285,28 +775,38 @@ def get_hash_from_wait_call(
     """
     logger.debug("Hashing ...")
     t_start = perf_counter()
-    global ALREADY_PROCESSED_ID
-    # We add the scene object within the ALREADY_PROCESSED_ID, as we don't want to process because pretty much all of its attributes will be soon or later processed (in one of the three hashes).
-    ALREADY_PROCESSED_ID = {id(scene_object): scene_object}
-    camera_json = get_json(get_camera_dict_for_hashing(camera_object))
-    current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
-    hash_current_mobjects = zlib.crc32(repr(current_mobjects_list_json).encode())
-    hash_camera = zlib.crc32(repr(camera_json).encode())
-    if stop_condition_function is not None:
-        hash_function = zlib.crc32(get_json(stop_condition_function).encode())
+    camera_dict = get_camera_dict_for_hashing(camera_object)
+    hash_function = None
+    if config["hashing_backend"] == "structural":
+        if hasher is None:
+            hasher = StructuralHasher()
+        hash_camera = hasher.hash_object(camera_dict, ignored=[scene_object])
+        hash_current_mobjects = hasher.hash_object(
+            current_mobjects_list, ignored=[scene_object]
+        )
+        if stop_condition_function is not None:
+            hash_function = hasher.hash_object(
+                stop_condition_function, ignored=[scene_object]
+            )
+    else:
+        global ALREADY_PROCESSED_ID
+        # We add the scene object within the ALREADY_PROCESSED_ID, as we don't want to process because pretty much all of its attributes will be soon or later processed (in one of the three hashes).
+        ALREADY_PROCESSED_ID = {id(scene_object): scene_object}
+        camera_json = get_json(camera_dict)
+        current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
+        hash_current_mobjects = zlib.crc32(repr(current_mobjects_list_json).encode())
+        hash_camera = zlib.crc32(repr(camera_json).encode())
+        if stop_condition_function is not None:
+            hash_function = zlib.crc32(get_json(stop_condition_function).encode())
         # This will reset ALREADY_PROCESSED_ID as all the hashing process is finished.
         ALREADY_PROCESSED_ID = {}
-        t_end = perf_counter()
-        logger.debug("Hashing done in %(time)s s.", {"time": str(t_end - t_start)[:8]})
-        hash_complete = f"{hash_camera}_{str(wait_time).replace('.', '-')}{hash_function}_{hash_current_mobjects}"
-        logger.debug("Hash generated :  %(h)s", {"h": hash_complete})
-        return hash_complete
-    ALREADY_PROCESSED_ID = {}
     t_end = perf_counter()
     logger.debug("Hashing done in %(time)s s.", {"time": str(t_end - t_start)[:8]})
-    hash_complete = (
-        f"{hash_camera}_{str(wait_time).replace('.', '-')}_{hash_current_mobjects}"
-    )
-
+    if hash_function is not None:
+        hash_complete = f"{hash_camera}_{str(wait_time).replace('.', '-')}{hash_function}_{hash_current_mobjects}"
+    else:
+        hash_complete = (
+            f"{hash_camera}_{str(wait_time).replace('.', '-')}_{hash_current_mobjects}"
+        )
     logger.debug("Hash generated :  %(h)s", {"h": hash_complete})
     return hash_complete
@@ -122,3 +122,15 @@ def scene_classes_from_file(file_path, require_single_scene=False):
         assert len(scene_classes_to_render) == 1
         return scene_classes_to_render[0]
     return scene_classes_to_render
+
+
+def get_scene_class(module_name, scene_name):
+    """Find a scene class by name in a worker process.
+
+    Forked processes already know the module of the scene, while the other
+    ones have to load ``config["input_file"]`` again.
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = get_module(Path(config["input_file"]))
+    return getattr(module, scene_name)
@@ -0,0 +1,266 @@
+"""An index of the partial movie files cached by the scenes of a media directory.
+
+The index is a small SQLite database recording the hash, size, source scene
+and time of last use of every partial movie file.  It replaces scanning the
+partial movie directories and relying on access times, which many file
+systems don't update, to find the files to evict.  The directories are only
+scanned when the index is created, and by ``manim cache gc``.
+
+"""
+
+__all__ = ["PartialMovieCache"]
+
+
+import glob
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from .. import config
+
+INDEX_FILE_NAME = "partial_movie_cache.db"
+MOVIE_FILE_EXTENSIONS = (".mp4", ".mov")
+
+
+class _Wildcards(dict):
+    """Resolves the directories of the config, and matches any other value."""
+
+    def __missing__(self, key):
+        return config[key] if key.endswith("_dir") else "*"
+
+
+class PartialMovieCache:
+    """The partial movie files of all the scenes rendered in a media directory.
+
+    Parameters
+    ----------
+    index_path : :class:`str`, optional
+        The path of the SQLite index.  Defaults to a file in
+        ``config["media_dir"]``, so that all the scenes rendered there share
+        the same cache budget.  The partial movie files already there are
+        indexed when this file is created.
+    """
+
+    def __init__(self, index_path=None):
+        scan = False
+        if index_path is None:
+            index_path = Path(config.get_dir("media_dir"), INDEX_FILE_NAME)
+            scan = not index_path.exists()
+        self.index_path = str(index_path)
+        with self.transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS partial_movie_files ("
+                "path TEXT PRIMARY KEY, "
+                "hash TEXT NOT NULL, "
+                "scene TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS partial_movie_files_by_last_used "
+                "ON partial_movie_files (last_used)"
+            )
+        if scan:
+            self.scan()
+
+    def scan(self):
+        """Indexes the partial movie files of the media directory.
+
+        The files are found in the partial movie directories of all the
+        modules, qualities and scenes.  The modification time of the files
+        which weren't indexed yet is used as their last use.
+
+        Returns
+        -------
+        :class:`int`
+            The number of files added to the index.
+        """
+        pattern = config.partial_movie_dir
+        while "{" in pattern:
+            pattern = pattern.format_map(_Wildcards())
+        rows = []
+        for extension in MOVIE_FILE_EXTENSIONS:
+            for file_path in glob.glob(os.path.join(pattern, f"*{extension}")):
+                stat = os.stat(file_path)
+                rows.append(
+                    (
+                        os.path.abspath(file_path),
+                        Path(file_path).stem,
+                        os.path.basename(os.path.dirname(file_path)),
+                        stat.st_size,
+                        stat.st_mtime,
+                    )
+                )
+        with self.transaction() as connection:
+            n_indexed = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO partial_movie_files VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            return connection.total_changes - n_indexed
+
+    @contextmanager
+    def transaction(self):
+        """Opens a connection to the index, committed and closed on exit."""
+        # A connection is opened for every transaction, so that the cache can
+        # be used from forked processes, and shared by several processes.
+        connection = sqlite3.connect(self.index_path, timeout=60)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def add(self, file_path, scene_name):
+        """Records a partial movie file that has just been written.
+
+        Parameters
+        ----------
+        file_path : :class:`str`
+            The path of the partial movie file, named after its hash.
+        scene_name : :class:`str`
+            The name of the scene the file belongs to.
+        """
+        with self.transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO partial_movie_files VALUES (?, ?, ?, ?, ?)",
+                (
+                    str(file_path),
+                    Path(file_path).stem,
+                    scene_name,
+                    os.path.getsize(file_path),
+                    time.time(),
+                ),
+            )
+
+    def contains(self, file_path, scene_name):
+        """Checks whether a partial movie file is cached.
+
+        Files written before the index existed are added to it when found.
+
+        Parameters
+        ----------
+        file_path : :class:`str`
+            The path of the partial movie file.
+        scene_name : :class:`str`
+            The name of the scene the file belongs to.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the file is cached.
+        """
+        with self.transaction() as connection:
+            indexed = connection.execute(
+                "SELECT 1 FROM partial_movie_files WHERE path = ?", (str(file_path),)
+            ).fetchone()
+        if not os.path.exists(file_path):
+            if indexed:
+                self.forget([file_path])
+            return False
+        if not indexed:
+            self.add(file_path, scene_name)
+        return True
+
+    def touch(self, file_paths):
+        """Marks partial movie files as just used.
+
+        Parameters
+        ----------
+        file_paths : List[:class:`str`]
+            The paths of the partial movie files.
+        """
+        now = time.time()
+        with self.transaction() as connection:
+            connection.executemany(
+                "UPDATE partial_movie_files SET last_used = ? WHERE path = ?",
+                [(now, str(file_path)) for file_path in file_paths],
+            )
+
+    def forget(self, file_paths):
+        """Removes partial movie files from the index, without deleting them."""
+        with self.transaction() as connection:
+            connection.executemany(
+                "DELETE FROM partial_movie_files WHERE path = ?",
+                [(str(file_path),) for file_path in file_paths],
+            )
+
+    def remove(self, file_paths):
+        """Deletes partial movie files and removes them from the index."""
+        for file_path in file_paths:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        self.forget(file_paths)
+
+    def prune(self):
+        """Removes the files which don't exist anymore from the index.
+
+        Returns
+        -------
+        :class:`int`
+            The number of files removed from the index.
+        """
+        with self.transaction() as connection:
+            paths = [
+                path
+                for (path,) in connection.execute(
+                    "SELECT path FROM partial_movie_files"
+                )
+            ]
+        missing = [path for path in paths if not os.path.exists(path)]
+        self.forget(missing)
+        return len(missing)
+
+    def evict(self, max_bytes=float("inf"), max_files_per_directory=float("inf")):
+        """Deletes the least recently used partial movie files, until the cache
+        fits in the given budget.
+
+        Parameters
+        ----------
+        max_bytes : :class:`float`, optional
+            The maximum total size of the cached files, across all scenes.
+        max_files_per_directory : :class:`float`, optional
+            The maximum number of cached files in each partial movie
+            directory, that is for each scene.
+
+        Returns
+        -------
+        List[:class:`str`]
+            The paths of the deleted files.
+        """
+        with self.transaction() as connection:
+            rows = connection.execute(
+                "SELECT path, size FROM partial_movie_files ORDER BY last_used DESC"
+            ).fetchall()
+        total_size = 0
+        over_budget = False
+        files_per_directory = {}
+        to_delete = []
+        for path, size in rows:
+            total_size += size
+            # Once the budget is exceeded, all the older files are deleted.
+            over_budget = over_budget or total_size > max_bytes
+            directory = os.path.dirname(path)
+            files_per_directory[directory] = files_per_directory.get(directory, 0) + 1
+            if over_budget or files_per_directory[directory] > max_files_per_directory:
+                to_delete.append(path)
+        self.remove(to_delete)
+        return to_delete
+
+    def stats(self):
+        """Summarises the content of the cache.
+
+        Returns
+        -------
+        List[Tuple[:class:`str`, :class:`int`, :class:`int`, :class:`float`]]
+            For each scene, its name, number of cached files, their total size
+            in bytes and when one of them was last used, most recently used
+            scenes first.
+        """
+        with self.transaction() as connection:
+            return connection.execute(
+                "SELECT scene, COUNT(*), SUM(size), MAX(last_used) "
+                "FROM partial_movie_files GROUP BY scene ORDER BY MAX(last_used) DESC"
+            ).fetchall()
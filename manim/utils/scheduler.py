@@ -0,0 +1,122 @@
+"""Render several scenes of a file concurrently, in a pool of processes."""
+
+__all__ = ["render_scenes_in_parallel"]
+
+
+import json
+import logging
+import platform
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from tqdm import tqdm
+
+from .. import config, console, logger
+from .file_ops import guarantee_existence
+from .module_ops import get_scene_class
+
+RENDER_TIMES_FILE_NAME = "render_times.json"
+
+
+class _ScenePrefixFilter(logging.Filter):
+    """Prefix the log messages of a worker with the name of its scene."""
+
+    def __init__(self, scene_name):
+        super().__init__()
+        self.scene_name = scene_name
+
+    def filter(self, record):
+        record.msg = f"[{self.scene_name}] {record.msg}"
+        return True
+
+
+def get_render_times_path():
+    """Get the path of the file storing how long the scenes of the input file
+    took to render the last time, for the current quality."""
+    module_name = config.get_dir("input_file").stem
+    video_dir = guarantee_existence(
+        config.get_dir("video_dir", module_name=module_name)
+    )
+    return Path(video_dir, RENDER_TIMES_FILE_NAME)
+
+
+def load_render_times():
+    """Load the render times recorded by previous runs, in seconds per scene name."""
+    try:
+        with open(get_render_times_path()) as render_times_file:
+            return json.load(render_times_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_render_times(render_times):
+    with open(get_render_times_path(), "w") as render_times_file:
+        json.dump(render_times, render_times_file, indent=4, sort_keys=True)
+
+
+def render_scenes_in_parallel(scene_classes):
+    """Render scenes in ``config["workers"]`` processes.
+
+    The scenes which took the longest to render the last time are started
+    first, and the scenes which were never rendered before are assumed to be
+    the longest.  Each scene is rendered serially in its process.
+
+    Parameters
+    ----------
+    scene_classes : List[Type[:class:`~.Scene`]]
+        The scenes to render.
+    """
+    render_times = {} if config["dry_run"] else load_render_times()
+    scene_classes = sorted(
+        scene_classes,
+        key=lambda scene_class: render_times.get(scene_class.__name__, float("inf")),
+        reverse=True,
+    )
+    n_workers = min(config["workers"], len(scene_classes))
+    logger.info(f"Rendering {len(scene_classes)} scenes with {n_workers} workers")
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_scene_worker,
+        initargs=(config.copy(),),
+    ) as executor:
+        futures = {
+            executor.submit(
+                _render_scene, scene_class.__module__, scene_class.__name__
+            ): scene_class.__name__
+            for scene_class in scene_classes
+        }
+        progress = tqdm(
+            as_completed(futures),
+            total=len(futures),
+            desc="Rendering scenes",
+            leave=config["progress_bar"] == "leave",
+            ascii=True if platform.system() == "Windows" else None,
+            disable=config["progress_bar"] == "none",
+        )
+        for future in progress:
+            render_time = future.result()
+            if render_time is not None:
+                render_times[futures[future]] = render_time
+    if not config["dry_run"]:
+        save_render_times(render_times)
+
+
+def _init_scene_worker(parent_config):
+    config.update(parent_config)
+    # The scenes are already spread over the processes.
+    config.workers = 1
+    config.progress_bar = "none"
+
+
+def _render_scene(module_name, scene_name):
+    prefix_filter = _ScenePrefixFilter(scene_name)
+    logger.addFilter(prefix_filter)
+    try:
+        start_time = time.perf_counter()
+        get_scene_class(module_name, scene_name)().render()
+        return time.perf_counter() - start_time
+    except Exception:
+        console.print_exception()
+    finally:
+        logger.removeFilter(prefix_filter)
@@ -8,9 +8,15 @@
 
 import hashlib
 import os
+import re
 from pathlib import Path
 
 from .. import config, logger
+from .file_ops import cache_file_lock, temporary_file_path
+from .worker_pool import WorkerPool, completed_future
+
+# Runs latex and dvisvgm in the background, see tex_to_svg_file_async.
+tex_pool = WorkerPool()
 
 
 def tex_hash(expression):
@@ -41,12 +47,192 @@ def tex_to_svg_file(expression, environment=None, tex_template=None):
     if tex_template is None:
         tex_template = config["tex_template"]
     tex_file = generate_tex_file(expression, environment, tex_template)
+    # The SVG file may have been typeset along with others by prefetch_tex.
+    svg_file = Path(tex_file.replace(".tex", ".svg")).as_posix()
+    if os.path.exists(svg_file):
+        return svg_file
+    future = tex_pool.get(svg_file)
+    if future is not None:
+        return future.result()
+    return compile_tex_file_to_svg(tex_file, tex_template)
+
+
+def tex_to_svg_file_async(expression, environment=None, tex_template=None):
+    """Like :func:`tex_to_svg_file`, but typesets the expression in the
+    background.
+
+    Many expressions are typeset at the same time by calling this function
+    for each of them before waiting for the results.  An expression which
+    is already being typeset isn't typeset twice, and :func:`tex_to_svg_file`
+    waits for it too.
+
+    Parameters
+    ----------
+    expression : :class:`str`
+        String containing the TeX expression to be rendered, e.g. ``\\sqrt{2}`` or ``foo``
+    environment : Optional[:class:`str`], optional
+        The string containing the environment in which the expression should be typeset, e.g. ``align*``
+    tex_template : Optional[:class:`~.TexTemplate`], optional
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+
+    Returns
+    -------
+    :class:`concurrent.futures.Future`
+        The future of the path to the generated SVG file.
+
+    Examples
+    --------
+    ::
+
+        futures = [tex_to_svg_file_async(f"x^{{{n}}}", "align*") for n in range(10)]
+        svg_files = [future.result() for future in futures]
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    tex_file = generate_tex_file(expression, environment, tex_template)
+    svg_file = Path(tex_file.replace(".tex", ".svg")).as_posix()
+    if os.path.exists(svg_file):
+        return completed_future(svg_file)
+    return tex_pool.submit(svg_file, compile_tex_file_to_svg, tex_file, tex_template)
+
+
+def compile_tex_file_to_svg(tex_file, tex_template):
+    """Compiles a .tex file written by :func:`generate_tex_file`, and converts
+    the result to an svg.
+
+    Returns
+    -------
+    :class:`str`
+        Path to generated SVG file.
+    """
     dvi_file = compile_tex(
         tex_file, tex_template.tex_compiler, tex_template.output_format
     )
     return convert_to_svg(dvi_file, tex_template.output_format)
 
 
+# Each expression of a batch is typeset in its own page of this environment,
+# using the multi-page mode of the standalone class.
+BATCH_DOCUMENTCLASS = r"\documentclass[preview]{standalone}"
+BATCH_PAGE_ENVIRONMENT = "manimpage"
+
+
+def prefetch_tex(expressions, environment="align*", tex_template=None):
+    r"""Typesets many expressions with a single TeX run.
+
+    Starting ``latex`` and ``dvisvgm`` takes much longer than typesetting a
+    short formula.  The expressions which are not cached yet are typeset as
+    the pages of a single document, which is then converted with a single
+    ``dvisvgm`` run.  The SVG file of each page is stored where
+    :func:`tex_to_svg_file` looks for it, so that the mobjects of the
+    expressions are built without running TeX again.
+
+    This requires a template with the ``standalone`` document class, like
+    the default one.  With other templates, or if the document can't be
+    typeset as a whole, the expressions are typeset separately, at the same
+    time with :func:`tex_to_svg_file_async`.
+
+    Parameters
+    ----------
+    expressions : Iterable[Union[:class:`str`, Tuple[:class:`str`, Optional[:class:`str`]]]]
+        The expressions, as passed to :func:`tex_to_svg_file`.  An expression
+        can be given with its own environment as an ``(expression,
+        environment)`` pair.
+    environment : Optional[:class:`str`], optional
+        The environment of the expressions without their own, by default the
+        ``align*`` environment of :class:`~.MathTex`.  :class:`~.Tex` uses
+        ``center``.
+    tex_template : Optional[:class:`~.TexTemplate`], optional
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+
+    Returns
+    -------
+    List[:class:`str`]
+        Paths to the SVG files of the expressions.
+
+    Examples
+    --------
+    ::
+
+        prefetch_tex([r"\sum_{i=1}^n i", r"\frac{n(n+1)}{2}"])
+        prefetch_tex(["Title", "Subtitle"], environment="center")
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    head, tail = tex_template.body.split(tex_template.placeholder_text, 1)
+    results = []
+    pages = {}
+    for item in expressions:
+        if isinstance(item, tuple):
+            expression, expression_environment = item
+        else:
+            expression, expression_environment = item, environment
+        tex_file = generate_tex_file(expression, expression_environment, tex_template)
+        svg_file = Path(tex_file.replace(".tex", ".svg")).as_posix()
+        results.append(svg_file)
+        if not os.path.exists(svg_file) and svg_file not in pages:
+            with open(tex_file, encoding="utf-8") as infile:
+                code = infile.read()
+            pages[svg_file] = (
+                code[len(head) : len(code) - len(tail)],
+                expression,
+                expression_environment,
+            )
+    if not pages:
+        return results
+
+    if len(pages) > 1 and head.startswith(BATCH_DOCUMENTCLASS):
+        batch_head = head.replace(
+            BATCH_DOCUMENTCLASS,
+            r"\documentclass[preview,multi=%s]{standalone}" % BATCH_PAGE_ENVIRONMENT,
+            1,
+        ).replace(
+            r"\begin{document}",
+            r"\newenvironment{%s}{}{}" % BATCH_PAGE_ENVIRONMENT
+            + "\n"
+            + r"\begin{document}",
+            1,
+        )
+        batch = (
+            batch_head
+            + "\n".join(
+                r"\begin{%s}" % BATCH_PAGE_ENVIRONMENT
+                + content
+                + r"\end{%s}" % BATCH_PAGE_ENVIRONMENT
+                for content, _, _ in pages.values()
+            )
+            + tail
+        )
+        tex_dir = config.get_dir("tex_dir")
+        batch_file = os.path.join(tex_dir, tex_hash(batch)) + ".tex"
+        with open(batch_file, "w", encoding="utf-8") as outfile:
+            outfile.write(batch)
+        logger.info(f"Typesetting {len(pages)} expressions in {batch_file}")
+        try:
+            dvi_file = compile_tex(
+                batch_file, tex_template.tex_compiler, tex_template.output_format
+            )
+            page_files = convert_pages_to_svg(
+                dvi_file, tex_template.output_format, len(pages)
+            )
+        except ValueError:
+            logger.warning(
+                "Couldn't typeset the expressions together, typesetting them one by one."
+            )
+        else:
+            for page_file, svg_file in zip(page_files, pages):
+                os.replace(page_file, svg_file)
+
+    futures = [
+        tex_to_svg_file_async(expression, expression_environment, tex_template)
+        for svg_file, (_, expression, expression_environment) in pages.items()
+        if not os.path.exists(svg_file)
+    ]
+    for future in futures:
+        future.result()
+    return results
+
+
 def generate_tex_file(expression, environment=None, tex_template=None):
     """Takes a tex expression (and an optional tex environment),
     and returns a fully formed tex file ready for compilation.
@@ -77,10 +263,14 @@ def generate_tex_file(expression, environment=None, tex_template=None):
         os.makedirs(tex_dir)
 
     result = os.path.join(tex_dir, tex_hash(output)) + ".tex"
-    if not os.path.exists(result):
-        logger.info('Writing "%s" to %s' % ("".join(expression), result))
-        with open(result, "w", encoding="utf-8") as outfile:
-            outfile.write(output)
+    if os.path.exists(result):
+        return result
+    with cache_file_lock(result):
+        if not os.path.exists(result):
+            logger.info('Writing "%s" to %s' % ("".join(expression), result))
+            with open(temporary_file_path(result), "w", encoding="utf-8") as outfile:
+                outfile.write(output)
+            os.replace(temporary_file_path(result), result)
     return result
 
 
@@ -157,42 +347,47 @@ def compile_tex(tex_file, tex_compiler, output_format):
     result = Path(result).as_posix()
     tex_file = Path(tex_file).as_posix()
     tex_dir = Path(config.get_dir("tex_dir")).as_posix()
-    if not os.path.exists(result):
-        command = tex_compilation_command(
-            tex_compiler, output_format, tex_file, tex_dir
-        )
-        exit_code = os.system(command)
-        if exit_code != 0:
-            log_file = tex_file.replace(".tex", ".log")
-            if not Path(log_file).exists():
-                raise RuntimeError(
-                    f"{tex_compiler} failed but did not produce a log file. "
-                    "Check your LaTeX installation."
-                )
-            with open(log_file, "r") as f:
-                log = f.readlines()
-                log_error_pos = [
-                    ind for (ind, line) in enumerate(log) if line.startswith("!")
-                ]
-                if log_error_pos:
-                    logger.error(f"LaTeX compilation error! {tex_compiler} reports:")
-                    for lineno in log_error_pos:
-                        # search for a line starting with "l." in the next
-                        # few lines past the error; otherwise just print some lines.
-                        printed_lines = 1
-                        for _ in range(10):
-                            if log[lineno + printed_lines].startswith("l."):
-                                break
-                            printed_lines += 1
-
-                        for line in log[lineno : lineno + printed_lines + 1]:
-                            logger.error(line)
-
-            raise ValueError(
-                f"{tex_compiler} error converting to"
-                f" {output_format[1:]}. See log output above or"
-                f" the log file: {log_file}"
+    # TeX writes the output file as it goes, so it's only complete once the
+    # lock is released. This is only needed when the SVG file isn't cached.
+    with cache_file_lock(result):
+        if not os.path.exists(result):
+            command = tex_compilation_command(
+                tex_compiler, output_format, tex_file, tex_dir
             )
+            exit_code = os.system(command)
+            if exit_code != 0:
+                log_file = tex_file.replace(".tex", ".log")
+                if not Path(log_file).exists():
+                    raise RuntimeError(
+                        f"{tex_compiler} failed but did not produce a log file. "
+                        "Check your LaTeX installation."
+                    )
+                with open(log_file, "r") as f:
+                    log = f.readlines()
+                    log_error_pos = [
+                        ind for (ind, line) in enumerate(log) if line.startswith("!")
+                    ]
+                    if log_error_pos:
+                        logger.error(
+                            f"LaTeX compilation error! {tex_compiler} reports:"
+                        )
+                        for lineno in log_error_pos:
+                            # search for a line starting with "l." in the next
+                            # few lines past the error; otherwise just print some lines.
+                            printed_lines = 1
+                            for _ in range(10):
+                                if log[lineno + printed_lines].startswith("l."):
+                                    break
+                                printed_lines += 1
+
+                            for line in log[lineno : lineno + printed_lines + 1]:
+                                logger.error(line)
+
+                raise ValueError(
+                    f"{tex_compiler} error converting to"
+                    f" {output_format[1:]}. See log output above or"
+                    f" the log file: {log_file}"
+                )
     return result
 
 
@@ -216,19 +411,24 @@ def convert_to_svg(dvi_file, extension, page=1):
     result = dvi_file.replace(extension, ".svg")
     result = Path(result).as_posix()
     dvi_file = Path(dvi_file).as_posix()
-    if not os.path.exists(result):
-        commands = [
-            "dvisvgm",
-            "--pdf" if extension == ".pdf" else "",
-            "-p " + str(page),
-            f'"{dvi_file}"',
-            "-n",
-            "-v 0",
-            "-o " + f'"{result}"',
-            ">",
-            os.devnull,
-        ]
-        os.system(" ".join(commands))
+    if os.path.exists(result):
+        return result
+    with cache_file_lock(result):
+        if not os.path.exists(result):
+            commands = [
+                "dvisvgm",
+                "--pdf" if extension == ".pdf" else "",
+                "-p " + str(page),
+                f'"{dvi_file}"',
+                "-n",
+                "-v 0",
+                "-o " + f'"{temporary_file_path(result)}"',
+                ">",
+                os.devnull,
+            ]
+            os.system(" ".join(commands))
+            if os.path.exists(temporary_file_path(result)):
+                os.replace(temporary_file_path(result), result)
 
     # if the file does not exist now, this means conversion failed
     if not os.path.exists(result):
@@ -240,3 +440,48 @@ def convert_to_svg(dvi_file, extension, page=1):
         )
 
     return result
+
+
+def convert_pages_to_svg(dvi_file, extension, num_pages):
+    """Converts all the pages of a .dvi, .xdv, or .pdf file into svgs with a
+    single dvisvgm run.
+
+    Parameters
+    ----------
+    dvi_file : :class:`str`
+        File name of the input file to be converted.
+    extension : :class:`str`
+        String containing the file extension and thus indicating the file type, e.g. ``.dvi`` or ``.pdf``
+    num_pages : :class:`int`
+        Number of pages of the input file.
+
+    Returns
+    -------
+    List[:class:`str`]
+        Paths to the generated SVG files, one per page.
+    """
+    dvi_file = Path(dvi_file).as_posix()
+    stem = dvi_file.replace(extension, "")
+    commands = [
+        "dvisvgm",
+        "--pdf" if extension == ".pdf" else "",
+        f"-p 1-{num_pages}",
+        f'"{dvi_file}"',
+        "-n",
+        "-v 0",
+        "-o " + f'"{stem}-%p.svg"',
+        ">",
+        os.devnull,
+    ]
+    os.system(" ".join(commands))
+
+    # dvisvgm may pad the page numbers with zeros.
+    page_files = {}
+    pattern = re.compile(re.escape(Path(stem).name) + r"-(\d+)\.svg")
+    for path in Path(stem).parent.iterdir():
+        match = pattern.fullmatch(path.name)
+        if match:
+            page_files[int(match.group(1))] = path.as_posix()
+    if sorted(page_files) != list(range(1, num_pages + 1)):
+        raise ValueError(f"dvisvgm couldn't convert all the pages of {dvi_file}.")
+    return [page_files[page] for page in range(1, num_pages + 1)]
@@ -0,0 +1,102 @@
+"""Background generation of cache files.
+
+The SVG files of :class:`~.Tex` are generated by external programs, which
+don't hold the GIL.  Generating them in a pool of threads lets many of them
+be generated at the same time, for example with
+:func:`~.tex_file_writing.tex_to_svg_file_async`.
+
+"""
+
+__all__ = ["WorkerPool", "completed_future"]
+
+
+import os
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# All the pools, reset in the children forked by the renderer, see WorkerPool.
+_pools = weakref.WeakSet()
+
+
+def completed_future(result):
+    """Returns a future which is already done, with a result."""
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class WorkerPool:
+    """A pool of threads generating files.
+
+    Each job generates a file, which identifies the job: a job submitted
+    while another job generating the same file is running gets the future
+    of the running job instead of running again.
+
+    The threads of a pool don't survive a fork, so forked processes start
+    with a new empty pool.
+
+    Parameters
+    ----------
+    max_workers : Optional[:class:`int`]
+        The maximum number of jobs running at the same time.  By default,
+        the number of processors.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.reset()
+        _pools.add(self)
+
+    def reset(self):
+        """Forgets the threads and jobs of the pool, without waiting for them."""
+        self.executor = None
+        self.in_flight = {}
+        self.lock = threading.Lock()
+
+    def submit(self, key, function, *args):
+        """Runs ``function(*args)`` in the pool, unless the job ``key`` is
+        already running.
+
+        Parameters
+        ----------
+        key : :class:`str`
+            The path of the generated file.
+        function : Callable
+            Generates the file.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            The future of the job.
+        """
+        with self.lock:
+            future = self.in_flight.get(key)
+            if future is not None:
+                return future
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="manim-worker"
+                )
+            future = self.executor.submit(function, *args)
+            self.in_flight[key] = future
+        future.add_done_callback(lambda _: self.done(key))
+        return future
+
+    def get(self, key):
+        """Returns the future of the job ``key`` if it's running, or None."""
+        with self.lock:
+            return self.in_flight.get(key)
+
+    def done(self, key):
+        with self.lock:
+            self.in_flight.pop(key, None)
+
+
+def _reset_pools():
+    for pool in _pools:
+        pool.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools)
@@ -0,0 +1,65 @@
+"""Compare Mobject.copy with a generic deepcopy of every attribute.
+
+Usage: python scripts/benchmark_copy.py [number_of_submobjects]
+"""
+import copy
+import sys
+from timeit import repeat
+
+from manim import *
+
+
+def generic_deepcopy(self, clone_from_id):
+    # How mobjects used to be copied: every attribute goes through
+    # copy.deepcopy and __setattr__.
+    result = self.__class__.__new__(self.__class__)
+    clone_from_id[id(self)] = result
+    result.__dict__["parents"] = []
+    for k, v in self.__dict__.items():
+        if k != "parents":
+            setattr(result, k, copy.deepcopy(v, clone_from_id))
+    result.original_id = str(id(self))
+    return result
+
+
+def make_vgroup_tree(n_submobjects, depth=3):
+    if depth == 1:
+        return VGroup(*[Square(side_length=0.1) for _ in range(n_submobjects)])
+    return VGroup(
+        *[make_vgroup_tree(n_submobjects // 10, depth - 1) for _ in range(10)]
+    )
+
+
+def make_tex_tree(n_submobjects):
+    try:
+        tex = MathTex(*[rf"x_{{{i}}}^2 +" for i in range(n_submobjects // 100)])
+    except Exception as error:
+        print(f"Skipping the Tex tree, which can't be compiled: {error}")
+        return None
+    return VGroup(*[tex.copy() for _ in range(10)])
+
+
+def benchmark(mobject, number=5):
+    return min(repeat(mobject.copy, number=1, repeat=number))
+
+
+if __name__ == "__main__":
+    n_submobjects = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    trees = {
+        "VGroup": make_vgroup_tree(n_submobjects),
+        "Tex": make_tex_tree(n_submobjects),
+    }
+    for name, tree in trees.items():
+        if tree is None:
+            continue
+        timing = benchmark(tree)
+        fast_deepcopy = Mobject.__deepcopy__
+        Mobject.__deepcopy__ = generic_deepcopy
+        try:
+            generic_timing = benchmark(tree)
+        finally:
+            Mobject.__deepcopy__ = fast_deepcopy
+        print(f"{name:>7} ({len(tree.get_family())} mobjects):")
+        print(f"{'deepcopy':>12}: {generic_timing * 1000:10.2f} ms")
+        print(f"{'copy':>12}: {timing * 1000:10.2f} ms")
+        print(f"{'Speedup':>12}: {generic_timing / timing:.1f}x")
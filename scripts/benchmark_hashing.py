@@ -0,0 +1,42 @@
+"""Compare the hashing backends used for scene caching.
+
+Usage: python scripts/benchmark_hashing.py [number_of_submobjects]
+"""
+import sys
+from timeit import repeat
+
+from manim import *
+from manim.utils.hashing import get_hash_from_play_call
+
+
+def make_scene(n_submobjects):
+    scene = Scene()
+    group = VGroup(*[Square(side_length=0.1) for _ in range(n_submobjects)])
+    group.arrange_in_grid()
+    tex_like = VGroup(*[Circle(radius=0.05) for _ in range(n_submobjects // 10)])
+    scene.add(group, tex_like)
+    scene.compile_animation_data(group.animate.shift(UP), FadeIn(tex_like))
+    return scene
+
+
+def benchmark(scene, backend, number=5):
+    def hash_play_call():
+        get_hash_from_play_call(
+            scene,
+            scene.camera,
+            scene.animations,
+            scene.mobjects,
+            hasher=scene.renderer.hasher,
+        )
+
+    with tempconfig({"hashing_backend": backend}):
+        return min(repeat(hash_play_call, number=1, repeat=number))
+
+
+if __name__ == "__main__":
+    n_submobjects = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    scene = make_scene(n_submobjects)
+    timings = {backend: benchmark(scene, backend) for backend in ["json", "structural"]}
+    for backend, timing in timings.items():
+        print(f"{backend:>10}: {timing * 1000:10.2f} ms")
+    print(f"Speedup: {timings['json'] / timings['structural']:.1f}x")
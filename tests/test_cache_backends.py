@@ -0,0 +1,141 @@
+import shutil
+import sys
+import types
+
+import pytest
+
+from manim.utils import cache_backends
+from manim.utils.cache_backends import (
+    CacheBackend,
+    DirectoryBackend,
+    S3Backend,
+    get_cache_backend,
+    register_cache_backend,
+)
+
+
+class ClientError(Exception):
+    pass
+
+
+class FakeS3Client:
+    """An in-memory stand-in for the boto3 S3 client, holding a single bucket."""
+
+    def __init__(self, bucket, directory):
+        self.bucket = bucket
+        self.directory = directory
+        self.metadata = {}
+
+    def head_object(self, Bucket, Key):
+        if Bucket != self.bucket or Key not in self.metadata:
+            raise ClientError("404")
+        return {"Metadata": self.metadata[Key]}
+
+    def download_file(self, Bucket, Key, Filename):
+        shutil.copyfile(self.directory / Key.replace("/", "_"), Filename)
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None):
+        assert Bucket == self.bucket
+        shutil.copyfile(Filename, self.directory / Key.replace("/", "_"))
+        self.metadata[Key] = ExtraArgs["Metadata"]
+
+
+@pytest.fixture
+def s3_client(tmp_path, monkeypatch):
+    (tmp_path / "bucket").mkdir()
+    client = FakeS3Client("manim", tmp_path / "bucket")
+    endpoints = []
+
+    def create_client(service, endpoint_url=None):
+        assert service == "s3"
+        endpoints.append(endpoint_url)
+        return client
+
+    client.endpoints = endpoints
+    monkeypatch.setitem(
+        sys.modules, "boto3", types.SimpleNamespace(client=create_client)
+    )
+    botocore = types.ModuleType("botocore")
+    botocore.exceptions = types.SimpleNamespace(ClientError=ClientError)
+    monkeypatch.setitem(sys.modules, "botocore", botocore)
+    monkeypatch.setitem(sys.modules, "botocore.exceptions", botocore.exceptions)
+    return client
+
+
+def test_directory_backend_publish_and_fetch(tmp_path):
+    backend = DirectoryBackend(tmp_path / "shared")
+    movie = tmp_path / "1234.mp4"
+    movie.write_bytes(b"movie")
+    backend.publish("1234.mp4", movie)
+
+    fetched = tmp_path / "local" / "1234.mp4"
+    fetched.parent.mkdir()
+    assert not backend.fetch("5678.mp4", fetched)
+    assert backend.fetch("1234.mp4", fetched)
+    assert fetched.read_bytes() == b"movie"
+    # No temporary file is left behind.
+    assert sorted(path.name for path in fetched.parent.iterdir()) == ["1234.mp4"]
+
+
+def test_directory_backend_rejects_corrupted_files(tmp_path):
+    backend = DirectoryBackend(tmp_path / "shared")
+    movie = tmp_path / "1234.mp4"
+    movie.write_bytes(b"movie")
+    backend.publish("1234.mp4", movie)
+    (tmp_path / "shared" / "1234.mp4").write_bytes(b"truncated")
+
+    fetched = tmp_path / "local" / "1234.mp4"
+    fetched.parent.mkdir()
+    assert not backend.fetch("1234.mp4", fetched)
+    assert list(fetched.parent.iterdir()) == []
+
+
+def test_get_cache_backend(tmp_path, monkeypatch):
+    assert isinstance(get_cache_backend(str(tmp_path)), DirectoryBackend)
+    backend = get_cache_backend(tmp_path.as_uri())
+    assert backend.directory == tmp_path
+
+    class MemoryBackend(CacheBackend):
+        def __init__(self, url):
+            self.url = url
+
+    monkeypatch.setitem(cache_backends._CACHE_BACKENDS, "memory", MemoryBackend)
+    assert get_cache_backend("memory://cache").url == "memory://cache"
+    with pytest.raises(ValueError):
+        get_cache_backend("unknown://cache")
+
+
+def test_register_cache_backend(monkeypatch):
+    monkeypatch.setattr(cache_backends, "_CACHE_BACKENDS", {})
+    register_cache_backend("memory", lambda url: url)
+    assert get_cache_backend("memory://cache") == "memory://cache"
+
+
+def test_s3_backend_publish_and_fetch(tmp_path, s3_client):
+    backend = get_cache_backend("s3://manim/cache/?endpoint_url=http://localhost:9000")
+    assert isinstance(backend, S3Backend)
+    assert s3_client.endpoints == ["http://localhost:9000"]
+    movie = tmp_path / "1234.mp4"
+    movie.write_bytes(b"movie")
+    backend.publish("1234.mp4", movie)
+    assert list(s3_client.metadata) == ["cache/1234.mp4"]
+
+    fetched = tmp_path / "local" / "1234.mp4"
+    fetched.parent.mkdir()
+    assert not backend.fetch("5678.mp4", fetched)
+    assert backend.fetch("1234.mp4", fetched)
+    assert fetched.read_bytes() == b"movie"
+    assert sorted(path.name for path in fetched.parent.iterdir()) == ["1234.mp4"]
+
+
+def test_s3_backend_rejects_corrupted_files(tmp_path, s3_client):
+    backend = S3Backend("s3://manim")
+    movie = tmp_path / "1234.mp4"
+    movie.write_bytes(b"movie")
+    backend.publish("1234.mp4", movie)
+    (s3_client.directory / "1234.mp4").write_bytes(b"truncated")
+
+    fetched = tmp_path / "local" / "1234.mp4"
+    fetched.parent.mkdir()
+    assert not backend.fetch("1234.mp4", fetched)
+    assert list(fetched.parent.iterdir()) == []
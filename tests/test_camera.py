@@ -0,0 +1,74 @@
+import numpy as np
+
+from manim import (
+    DOWN,
+    LEFT,
+    RIGHT,
+    UP,
+    Circle,
+    Dot,
+    Square,
+    VGroup,
+    VMobject,
+    tempconfig,
+)
+from manim.camera.camera import Camera, get_subpath_split_indices, merge_rectangles
+
+
+def test_merge_rectangles():
+    assert merge_rectangles([(0, 0, 10, 10), (5, 5, 20, 20), (30, 30, 40, 40)]) == [
+        (0, 0, 20, 20),
+        (30, 30, 40, 40),
+    ]
+    rectangles = [(10 * i, 0, 10 * i + 5, 5) for i in range(10)]
+    assert merge_rectangles(rectangles, max_rectangles=4) == [(0, 0, 95, 5)]
+
+
+def render_frames(use_dirty_rectangles):
+    with tempconfig({"pixel_height": 180, "pixel_width": 320}):
+        camera = Camera(use_dirty_rectangles=use_dirty_rectangles)
+        camera.capture_mobjects([Square().shift(LEFT * 3), Circle().shift(UP * 2)])
+        static_image = np.array(camera.pixel_array)
+        moving = VGroup(Dot(), Dot().shift(RIGHT)).shift(DOWN * 2)
+        frames = []
+        for _ in range(10):
+            moving.shift(RIGHT * 0.2).rotate(0.2)
+            camera.set_frame_to_background(static_image)
+            camera.capture_mobjects([moving])
+            frames.append(np.array(camera.pixel_array))
+        return frames
+
+
+def test_dirty_rectangles_match_full_redraw():
+    for frame, expected in zip(render_frames(True), render_frames(False)):
+        np.testing.assert_array_equal(frame, expected)
+
+
+def test_subpath_split_indices():
+    vmobject = VMobject()
+    vmobject.points = np.concatenate([Square().points, Circle().points[:-2]])
+    split_indices = get_subpath_split_indices(
+        vmobject.points,
+        vmobject.n_points_per_cubic_curve,
+        vmobject.tolerance_for_point_equality,
+    )
+    subpaths = [
+        vmobject.points[i1:i2] for i1, i2 in zip(split_indices, split_indices[1:])
+    ]
+    expected = list(vmobject.gen_subpaths_from_points_2d(vmobject.points))
+    assert len(subpaths) == len(expected)
+    for subpath, expected_subpath in zip(subpaths, expected):
+        np.testing.assert_array_equal(subpath, expected_subpath)
+
+
+def test_cairo_path_is_cached_until_points_change():
+    camera = Camera()
+    ctx = camera.get_cairo_context(camera.pixel_array)
+    square = Square()
+    camera.set_cairo_context_path(ctx, square)
+    path = list(ctx.copy_path())
+    camera.set_cairo_context_path(ctx, square)
+    assert list(ctx.copy_path()) == path
+    square.shift(RIGHT)
+    camera.set_cairo_context_path(ctx, square)
+    assert list(ctx.copy_path()) != path
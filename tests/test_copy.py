@@ -1,6 +1,19 @@
 from pathlib import Path
 
-from manim import BraceLabel, Mobject, config
+import numpy as np
+import pytest
+
+from manim import (
+    RED,
+    UP,
+    BraceLabel,
+    Mobject,
+    Square,
+    ValueTracker,
+    VGroup,
+    config,
+    tempconfig,
+)
 
 
 def test_mobject_copy():
@@ -16,6 +29,54 @@ def test_mobject_copy():
         assert orig.submobjects[i] is not copy.submobjects[i]
 
 
+def test_copy_attributes():
+    """Test that the attributes of a copy are independent of the original."""
+    square = Square()
+    group = VGroup(square)
+    square.shared_points = square.points
+    square.updaters.append(lambda mob: mob)
+    group_copy = group.copy()
+    copy = group_copy[0]
+
+    assert np.array_equal(copy.points, square.points)
+    assert copy.points is not square.points
+    # Arrays referred to several times are copied once.
+    assert copy.shared_points is copy.points
+    assert copy.color == square.color
+    copy.color.set_luminance(0.5)
+    assert copy.color != square.color
+    copy.stroke_color = RED
+    assert square.stroke_color != RED
+    assert copy.updaters == square.updaters
+    assert copy.updaters is not square.updaters
+    assert copy.parents == [group_copy]
+    assert square.parents == [group]
+    assert square.copy().parents == []
+    assert copy.original_id == str(id(square))
+
+
+def test_copy_on_write():
+    """Test that copies share arrays until either mobject changes them."""
+    with tempconfig({"copy_on_write": True}):
+        square = Square()
+        points = square.points.copy()
+        copy = square.copy()
+        assert copy.points is square.points
+        assert copy.fill_rgbas is square.fill_rgbas
+        with pytest.raises(ValueError):
+            square.points[0] = 0
+
+        square.shift(UP).set_fill(RED, 0.5)
+        assert np.array_equal(copy.points, points)
+        assert copy.fill_rgbas[0, 3] == 0
+        assert copy.get_writable_array("points") is not square.points
+
+        tracker = ValueTracker(1)
+        tracker_copy = tracker.copy()
+        tracker.set_value(2)
+        assert tracker_copy.get_value() == 1
+
+
 def test_bracelabel_copy(tmp_path):
     """Test that a copy is a deepcopy."""
     # For this test to work, we need to tweak some folders temporarily
@@ -80,3 +80,46 @@ def test_shift_family():
 
     for m in family:
         assert np.allclose(positions_before[m] + RIGHT, positions_after[m])
+
+
+def test_family_is_updated_with_submobjects():
+    """Check that the cached family follows changes of the submobjects."""
+    mob, child, gchild1, gchild2 = Mobject(), Mobject(), Mobject(), Mobject()
+    mob.add(child)
+    assert mob.get_family() == [mob, child]
+
+    # Changes deep in the tree reach the ancestors.
+    child.add(gchild1)
+    assert mob.get_family() == [mob, child, gchild1]
+    child.submobjects.append(gchild2)
+    assert mob.get_family() == [mob, child, gchild1, gchild2]
+    child.submobjects.reverse()
+    assert mob.get_family() == [mob, child, gchild2, gchild1]
+    child.remove(gchild2)
+    assert mob.get_family() == [mob, child, gchild1]
+    child.submobjects = [gchild2]
+    assert mob.get_family() == [mob, child, gchild2]
+
+    # The returned family can be changed freely.
+    mob.get_family().clear()
+    assert mob.get_family() == [mob, child, gchild2]
+
+
+def test_parents():
+    """Check that submobjects are linked to the mobjects containing them."""
+    mob1, mob2, child = Mobject(), Mobject(), Mobject()
+    mob1.add(child)
+    mob2.submobjects = [child, child]
+    assert child.parents == [mob1, mob2]
+    mob2.submobjects.pop()
+    assert child.parents == [mob1, mob2]
+    del mob2.submobjects[0]
+    assert child.parents == [mob1]
+
+    # Copies are only linked to the copies of their parents.
+    copy = mob1.copy()
+    assert child.parents == [mob1]
+    assert copy.submobjects[0].parents == [copy]
+    copy.submobjects[0].add(Mobject())
+    assert len(mob1.get_family()) == 2
+    assert len(copy.get_family()) == 3
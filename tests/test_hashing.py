@@ -1,6 +1,10 @@
 import json
+import os
+import subprocess
+import sys
 
 import manim.utils.hashing as hashing
+from manim import Square
 
 
 def test_JSON_basic():
@@ -114,3 +118,156 @@ def test_JSON_with_tuple():
     o = [(1, [1])]
     o_ser = hashing.get_json(o)
     assert o_ser == "[[1, [1]]]"
+
+
+def test_structural_hash_is_deterministic():
+    import numpy as np
+
+    hasher = hashing.StructuralHasher()
+    o = {"a": np.arange(10.0), "b": [1, 2.0, "test"], 3: (None, True)}
+    assert hasher.hash_object(o) == hashing.StructuralHasher().hash_object(o)
+
+
+def test_structural_hash_with_changed_array():
+    import numpy as np
+
+    hasher = hashing.StructuralHasher()
+    a = np.zeros((10, 3))
+    hash_before = hasher.hash_object([a])
+    a[5, 1] = 1
+    assert hasher.hash_object([a]) != hash_before
+
+
+def test_structural_hash_with_function_and_external_val():
+    hasher = hashing.StructuralHasher()
+    external = 2
+
+    def test(uhu):
+        return uhu + external
+
+    h1 = hasher.hash_object(test)
+    external = 3
+    h2 = hasher.hash_object(test)
+    assert h1 != h2
+
+
+def test_structural_hash_with_circular_references():
+    class A:
+        def __init__(self):
+            self.itself = self
+            self.b = [self]
+
+    hasher = hashing.StructuralHasher()
+    assert hasher.hash_object(A()) == hasher.hash_object(A())
+
+
+def test_structural_hash_ignored_objects():
+    class A:
+        def __init__(self, c):
+            self.c = c
+
+    hasher = hashing.StructuralHasher()
+    ignored = A(1)
+    o = A(ignored)
+    h1 = hasher.hash_object(o, ignored=[ignored])
+    ignored.c = 2
+    assert hasher.hash_object(o, ignored=[ignored]) == h1
+    assert hasher.hash_object(o) != h1
+
+
+def test_structural_hash_of_copies():
+    # The copies record the ids of their originals.
+    squares = [Square(), Square()]
+    hasher = hashing.StructuralHasher()
+    assert hasher.hash_object(squares[0].copy()) == hasher.hash_object(
+        squares[1].copy()
+    )
+
+
+def test_structural_hash_is_stable_across_runs():
+    # The hash seed changes the order of sets, like the set of config options.
+    code = (
+        "from manim import config\n"
+        "from manim.utils.hashing import StructuralHasher\n"
+        "print(StructuralHasher().hash_object(config))"
+    )
+    digests = set()
+    for seed in ["1", "2"]:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        digests.add(result.stdout.split()[-1])
+    assert len(digests) == 1
+
+
+def test_structural_hash_of_mobjects_follows_modifications():
+    from manim import RED, UP, Square, ValueTracker, VGroup
+
+    hasher = hashing.StructuralHasher()
+    group = VGroup(*[Square() for _ in range(5)])
+    tracker = ValueTracker(0)
+    group[0].add_updater(lambda m: m.set_x(tracker.get_value()))
+    mobjects = [group]
+
+    previous_hash = hasher.hash_object(mobjects)
+    assert hasher.hash_object(mobjects) == previous_hash
+    for modify in [
+        lambda: group[1].shift(UP),
+        lambda: group[2].set_fill(RED),
+        lambda: group.remove(group[3]),
+        lambda: tracker.set_value(2),
+    ]:
+        modify()
+        new_hash = hasher.hash_object(mobjects)
+        assert new_hash != previous_hash
+        previous_hash = new_hash
+
+
+def test_structural_hash_of_mobjects_is_reused():
+    from unittest.mock import patch
+
+    from manim import UP, Square, VGroup
+
+    group = VGroup(*[Square() for _ in range(5)])
+    hasher = hashing.StructuralHasher()
+    hasher.hash_object([group])
+    with patch(
+        "manim.utils.hashing._MobjectDigest", wraps=hashing._MobjectDigest
+    ) as mocked:
+        hasher.hash_object([group])
+        mocked.assert_not_called()
+        group[0].shift(UP)
+        hasher.hash_object([group])
+        mocked.assert_called_once()
+
+
+def test_structural_hash_of_mobjects_changed_in_place():
+    from manim import Square, VGroup
+
+    group = VGroup(*[Square() for _ in range(3)])
+    group[2].add_updater(lambda m: m[0].fill_rgbas.__setitem__((0, 2), 0.25))
+    group[2].add(Square())
+    hasher = hashing.StructuralHasher()
+    previous_hash = hasher.hash_object([group])
+
+    def change_fill_in_place():
+        group[1].fill_rgbas[0, 3] = 0.5
+        # Arrays changed in place directly are noticed with a new version.
+        assert hasher.hash_object([group]) == previous_hash
+        group[1].bump_version()
+
+    for modify in [
+        lambda: group[0].get_writable_array("points").__iadd__(1),
+        change_fill_in_place,
+        # The updaters may change the family of their mobject in place.
+        lambda: group.update(),
+    ]:
+        modify()
+        new_hash = hasher.hash_object([group])
+        assert new_hash == hashing.StructuralHasher().hash_object([group])
+        assert new_hash != previous_hash
+        previous_hash = new_hash
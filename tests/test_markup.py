@@ -1,6 +1,7 @@
 import pytest
 
 from manim import MarkupText
+from manim.mobject.svg import text_mobject
 
 
 def test_good_markup():
@@ -46,3 +47,25 @@ def test_invalid_tag_markup():
         success = True
 
     assert success, "'<invalidtag>foo</invalidtag>' should fail validation"
+
+
+def test_cached_svg_files_are_used_without_lock(tmp_path, monkeypatch):
+    svg_file = str(tmp_path / "text.svg")
+    written = []
+
+    def write_svg(path):
+        written.append(path)
+        with open(path, "w") as file:
+            file.write("<svg/>")
+
+    assert text_mobject.generate_svg_file(svg_file, write_svg) == svg_file
+    # The file appears once completely written.
+    assert written == [str(tmp_path / "text.tmp.svg")]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [".locks", "text.svg"]
+
+    def no_lock(file_path):
+        raise AssertionError(f"{file_path} is locked")
+
+    monkeypatch.setattr(text_mobject, "cache_file_lock", no_lock)
+    assert text_mobject.generate_svg_file(svg_file, write_svg) == svg_file
+    assert len(written) == 1
@@ -0,0 +1,35 @@
+from manim import DecimalNumber, Square, VMobject, tempconfig
+from manim.mobject import numbers
+from manim.mobject.svg.svg_cache import ParsedSVGCache, get_mobjects_size
+
+
+def test_set_value_reuses_glyphs(monkeypatch):
+    compiled = []
+
+    class FakeTex(VMobject):
+        def __init__(self, tex_string, **kwargs):
+            compiled.append(tex_string)
+            super().__init__(**kwargs)
+            self.add(Square(side_length=0.2))
+
+    monkeypatch.setattr(numbers, "SingleStringMathTex", FakeTex)
+    monkeypatch.setattr(numbers, "glyph_cache", ParsedSVGCache())
+    decimal = DecimalNumber(1.23)
+    assert sorted(compiled) == [".", "1", "2", "3"]
+    decimal.set_value(3.21)
+    decimal.set_value(1.11)
+    assert len(compiled) == 4
+    assert len(decimal.submobjects) == 4
+    # Each digit gets its own copy of the glyph.
+    assert decimal[0] is not decimal[2]
+    assert decimal[0].submobjects[0] is not decimal[2].submobjects[0]
+
+    # Only the most recently used glyphs are kept.
+    compiled.clear()
+    glyph_size = get_mobjects_size([decimal[0]])
+    with tempconfig({"max_svg_cache_bytes": 2 * glyph_size}):
+        decimal.set_value(4)
+        decimal.set_value(1.11)
+    # The glyph of 1 was evicted by the glyphs of 4.00.
+    assert "1" in compiled
+    assert len(numbers.glyph_cache.entries) == 2
@@ -0,0 +1,249 @@
+import gc
+import os
+import subprocess
+import sys
+import weakref
+
+import moderngl
+import numpy as np
+import pytest
+from PIL import Image
+
+from manim import tempconfig
+from manim.renderer.opengl_context import create_context, make_current
+from manim.renderer.opengl_renderer import OpenGLRenderer
+from manim.renderer.shader import Mesh, Shader
+from manim.renderer.texture_cache import TextureCache
+
+SOURCE = dict(
+    vertex_shader="""
+    #version 330
+    in vec2 in_vert;
+    void main() {
+        gl_Position = vec4(in_vert, 0.0, 1.0);
+    }
+    """,
+    fragment_shader="""
+    #version 330
+    out vec4 frag_color;
+    void main() {
+        frag_color = vec4(1.0);
+    }
+    """,
+)
+
+
+@pytest.fixture
+def context():
+    for kwargs in [{}, {"backend": "egl"}]:
+        try:
+            context = moderngl.create_standalone_context(**kwargs)
+        except Exception:
+            continue
+        yield context
+        context.release()
+        return
+    pytest.skip("No OpenGL context available.")
+
+
+def test_contexts_coexist(context):
+    make_current(context)
+    frame_buffer_object = context.simple_framebuffer((2, 2))
+    frame_buffer_object.use()
+    frame_buffer_object.clear(1, 0, 0, 1)
+    # Creating a context makes it current.
+    other_context = create_context("egl")
+    other_frame_buffer_object = other_context.simple_framebuffer((2, 2))
+    other_frame_buffer_object.use()
+    other_frame_buffer_object.clear(0, 1, 0, 1)
+
+    make_current(context)
+    assert tuple(frame_buffer_object.read()[:2]) == (255, 0)
+    make_current(other_context)
+    assert tuple(other_frame_buffer_object.read()[:2]) == (0, 255)
+    other_context.release()
+    make_current(context)
+
+
+def triangle(size):
+    attributes = np.zeros(3, dtype=[("in_vert", np.float32, (2,))])
+    attributes["in_vert"] = [[0, 0], [size, 0], [0, size]]
+    return attributes
+
+
+def test_shader_programs_are_compiled_once(context):
+    assert Shader(context, source=SOURCE).shader_program is (
+        Shader(context, source=SOURCE).shader_program
+    )
+    assert Shader(context, "quadratic_bezier_fill").shader_program is (
+        Shader(context, "quadratic_bezier_fill").shader_program
+    )
+
+
+def test_shader_programs_are_released_with_their_context(context):
+    other_context = create_context("egl")
+    shader_program = Shader(other_context, source=SOURCE).shader_program
+    reference = weakref.ref(other_context)
+    # moderngl keeps the last created context, as its default one.
+    next_context = create_context("egl")
+    del other_context, shader_program
+    gc.collect()
+    assert reference() is None
+    next_context.release()
+    make_current(context)
+
+
+def test_mesh_buffers_are_reused(context):
+    mesh = Mesh(Shader(context, source=SOURCE), triangle(1), use_depth_test=False)
+    mesh.render()
+    vertex_buffer_object = mesh.vertex_buffer_object
+    vertex_array_object = mesh.vertex_array_object
+    mesh.attributes = triangle(0.5)
+    mesh.render()
+    mesh.attributes = np.concatenate([triangle(0.5), triangle(-0.5)])
+    mesh.render()
+    assert mesh.vertex_buffer_object is vertex_buffer_object
+    assert mesh.vertex_array_object is vertex_array_object
+    assert vertex_buffer_object.size == mesh.attributes.nbytes
+    assert vertex_buffer_object.read() == mesh.attributes.tobytes()
+    assert vertex_array_object.vertices == 6
+
+    mesh.indices = np.array([0, 1, 2])
+    mesh.render()
+    assert mesh.index_buffer_object is not None
+    assert mesh.vertex_array_object is not vertex_array_object
+    mesh.indices = np.array([0, 1, 2, 3, 4, 5])
+    mesh.render()
+    assert mesh.vertex_array_object.vertices == 6
+    mesh.release()
+    assert mesh.vertex_buffer_object is None
+
+
+def test_mesh_without_indices_draws_all_vertices(context):
+    frame_buffer_object = context.simple_framebuffer((16, 16), components=1)
+    frame_buffer_object.use()
+    for indices in [None, np.zeros(0)]:
+        frame_buffer_object.clear()
+        shader = Shader(context, source=SOURCE)
+        mesh = Mesh(shader, triangle(1), indices=indices, use_depth_test=False)
+        mesh.render()
+        assert mesh.vertex_array_object.vertices == 3
+        assert np.count_nonzero(np.frombuffer(frame_buffer_object.read(), "u1"))
+
+
+def test_renderer_is_imported_without_display():
+    # Only the preview window needs a display.
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if name not in ("DISPLAY", "WAYLAND_DISPLAY")
+    }
+    command = [
+        sys.executable,
+        "-c",
+        "import sys, manim.renderer.opengl_renderer; "
+        "assert 'pyglet' not in sys.modules",
+    ]
+    process = subprocess.run(command, env=env, capture_output=True, text=True)
+    assert process.returncode == 0, process.stderr
+
+
+def test_consecutive_shader_wrappers_are_batched():
+    from manim.mobject.types.opengl_surface import OpenGLSurface
+
+    surfaces = [
+        OpenGLSurface(lambda u, v: np.array([u, v, 0]), resolution=(4, 4))
+        for _ in range(4)
+    ]
+    renderer = OpenGLRenderer()
+    batches = renderer.get_shader_wrapper_batches(surfaces)
+    assert [len(batch.vert_data) for batch in batches] == [64]
+    assert len(batches[0].vert_indices) == 4 * len(surfaces[0].get_triangle_indices())
+
+    # Mobjects with different uniforms are drawn in order.
+    surfaces[1].set_gloss(0.5)
+    batches = renderer.get_shader_wrapper_batches(surfaces)
+    assert [len(batch.vert_data) for batch in batches] == [16, 16, 32]
+
+
+def test_frames_are_read_back_in_order(context):
+    renderer = OpenGLRenderer()
+    renderer.window = None
+    renderer.context = context
+    renderer.frame_buffer_object = renderer.get_frame_buffer_object(context)
+    renderer.resolved_frame_buffer_object = renderer.frame_buffer_object
+    frames = []
+    for value in range(5):
+        renderer.frame_buffer_object.clear(value / 255, 0, 0, 1)
+        renderer.start_frame_readback(num_frames=value + 1)
+        for buffer, num_frames in renderer.finish_frame_readbacks():
+            frames.append((buffer.read()[0], num_frames))
+        assert len(renderer.pending_frame_readbacks) <= 2
+    for buffer, num_frames in renderer.finish_frame_readbacks(keep=0):
+        frames.append((buffer.read()[0], num_frames))
+    assert frames == [(value, value + 1) for value in range(5)]
+    # The pixel buffer objects are reused.
+    assert len(renderer.free_readback_buffers) == 3
+
+
+def test_texture_cache(context, tmp_path):
+    paths = []
+    for index, color in enumerate(["red", "red", "green", "blue"]):
+        paths.append(str(tmp_path / f"{index}.png"))
+        Image.new("RGB", (8, 8), color).save(paths[-1])
+    with tempconfig({"max_texture_cache_bytes": 2 * 8 * 8 * 3}):
+        cache = TextureCache(context)
+        # Identical images share a texture and a unit.
+        assert cache.bind(paths[:2]) == [0, 0]
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.bind([paths[2]]) == [1]
+        # The least recently used texture is released.
+        cache.bind([paths[3]])
+        assert len(cache.entries) == 2
+        assert cache.size == 2 * 8 * 8 * 3
+        cache.bind([paths[0]])
+        assert cache.misses == 4
+
+    cache.clear()
+    # With two units, the least recently drawn texture gives its unit up.
+    cache.free_units = [1, 0]
+    assert cache.bind(paths[1:3]) == [0, 1]
+    assert cache.bind([paths[3]]) == [0]
+    assert cache.bind(paths[2:]) == [1, 0]
+
+    cache.clear()
+    with tempconfig({"texture_mipmaps": True}):
+        cache.bind([paths[0]])
+    assert cache.size == 8 * 8 * 4
+
+
+def test_texture_cache_with_more_images_than_units(context, tmp_path):
+    make_current(context)
+    program = context.program(
+        vertex_shader=SOURCE["vertex_shader"],
+        fragment_shader="""
+        #version 330
+        uniform sampler2D image;
+        out vec4 frag_color;
+        void main() {
+            frag_color = texture(image, vec2(0.5));
+        }
+        """,
+    )
+    vertex_array_object = context.simple_vertex_array(
+        program, context.buffer(triangle(4).tobytes()), "in_vert"
+    )
+    frame_buffer_object = context.simple_framebuffer((1, 1), components=1)
+    frame_buffer_object.use()
+    num_images = context.info["GL_MAX_TEXTURE_IMAGE_UNITS"] + 1
+    with tempconfig({"max_texture_cache_bytes": -1}):
+        cache = TextureCache(context)
+        for index in range(num_images):
+            path = str(tmp_path / f"{index}.png")
+            Image.new("L", (1, 1), index).save(path)
+            cache.bind([path])
+    # Each bound texture is still on its unit.
+    for index, unit in enumerate(cache.units.values(), num_images - len(cache.units)):
+        program["image"] = unit
+        vertex_array_object.render()
+        assert frame_buffer_object.read()[0] == index
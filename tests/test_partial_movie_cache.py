@@ -0,0 +1,100 @@
+import os
+import time
+
+from click.testing import CliRunner
+
+from manim import tempconfig
+from manim.__main__ import main
+from manim.utils.partial_movie_cache import PartialMovieCache
+
+
+def write_partial_movie_file(cache, directory, hash_name, size):
+    directory.mkdir(parents=True, exist_ok=True)
+    file_path = directory / f"{hash_name}.mp4"
+    file_path.write_bytes(b"0" * size)
+    cache.add(file_path, directory.name)
+    # Make sure the files don't share the same last use time.
+    time.sleep(0.01)
+    return file_path
+
+
+def test_contains_indexes_existing_files(tmp_path):
+    cache = PartialMovieCache(tmp_path / "index.db")
+    file_path = tmp_path / "Scene" / "1234.mp4"
+    assert not cache.contains(file_path, "Scene")
+    # Files written before the index existed are indexed once found.
+    file_path.parent.mkdir()
+    file_path.write_bytes(b"0" * 10)
+    assert cache.contains(file_path, "Scene")
+    assert cache.stats()[0][:3] == ("Scene", 1, 10)
+
+    os.remove(file_path)
+    assert not cache.contains(file_path, "Scene")
+    assert cache.stats() == []
+
+
+def test_evict_least_recently_used_across_scenes(tmp_path):
+    cache = PartialMovieCache(tmp_path / "index.db")
+    first = write_partial_movie_file(cache, tmp_path / "SceneA", "a", 100)
+    second = write_partial_movie_file(cache, tmp_path / "SceneB", "b", 100)
+    third = write_partial_movie_file(cache, tmp_path / "SceneA", "c", 100)
+    cache.touch([first])
+
+    assert cache.evict(max_bytes=250) == [str(second)]
+    assert first.exists() and third.exists() and not second.exists()
+    assert sum(size for _, _, size, _ in cache.stats()) == 200
+
+
+def test_evict_files_per_directory(tmp_path):
+    cache = PartialMovieCache(tmp_path / "index.db")
+    old = write_partial_movie_file(cache, tmp_path / "SceneA", "a", 10)
+    write_partial_movie_file(cache, tmp_path / "SceneA", "b", 10)
+    write_partial_movie_file(cache, tmp_path / "SceneB", "c", 10)
+
+    assert cache.evict(max_files_per_directory=1) == [str(old)]
+
+
+def test_cache_gc_command(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path)}):
+        cache = PartialMovieCache()
+        write_partial_movie_file(cache, tmp_path / "Scene", "a", 100)
+        write_partial_movie_file(cache, tmp_path / "Scene", "b", 100)
+        missing = write_partial_movie_file(cache, tmp_path / "Scene", "c", 100)
+        os.remove(missing)
+
+        runner = CliRunner()
+        command = [
+            "cache",
+            "--media_dir",
+            str(tmp_path),
+            "gc",
+            "--max_cache_bytes",
+            "150",
+        ]
+        result = runner.invoke(main, command, prog_name="manim")
+        assert result.exit_code == 0, result.output
+        assert "Removed 1 cached file(s), and 1 missing file(s)" in result.output
+        assert cache.stats()[0][:3] == ("Scene", 1, 100)
+
+
+def test_existing_files_are_indexed(tmp_path):
+    directory = tmp_path / "videos" / "module" / "480p15" / "partial_movie_files"
+    (directory / "Scene").mkdir(parents=True)
+    old = directory / "Scene" / "a.mp4"
+    old.write_bytes(b"0" * 100)
+    os.utime(old, (0, 0))
+    (directory / "Scene" / "b.mp4").write_bytes(b"0" * 100)
+    (directory / "Scene" / "partial_movie_file_list.txt").write_text("")
+
+    with tempconfig({"media_dir": str(tmp_path)}):
+        # The files written before the index are found when it is created.
+        cache = PartialMovieCache()
+        assert cache.stats()[0][:3] == ("Scene", 2, 200)
+        assert cache.evict(max_bytes=150) == [str(old)]
+
+        # And by the garbage collection, when the index already exists.
+        (directory / "Other").mkdir()
+        (directory / "Other" / "c.mov").write_bytes(b"0" * 100)
+        assert cache.scan() == 1
+        assert cache.scan() == 0
+        assert sum(size for _, _, size, _ in cache.stats()) == 200
@@ -0,0 +1,148 @@
+import threading
+import time
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from manim import tempconfig
+from manim.scene import scene_file_writer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+
+class FakePipe:
+    """The input of a fake FFMPEG process, which can be held up or fail."""
+
+    def __init__(self):
+        self.frames = []
+        self.closed = False
+        self.error = None
+        self.open = threading.Event()
+        self.open.set()
+
+    def write(self, data):
+        self.open.wait()
+        if self.error is not None:
+            raise self.error
+        self.frames.append(bytes(data))
+
+    def close(self):
+        self.closed = True
+
+
+class FakeProcess:
+    def __init__(self, command, stdin):
+        self.command = command
+        self.stdin = FakePipe()
+        self.waited = False
+        # FFMPEG creates the movie file right away.
+        Path(command[-1]).write_bytes(b"movie")
+
+    def wait(self):
+        self.waited = True
+        return 0
+
+    def terminate(self):
+        pass
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    monkeypatch.setattr(scene_file_writer.subprocess, "Popen", FakeProcess)
+    with tempconfig(
+        {
+            "media_dir": str(tmp_path),
+            "write_to_movie": True,
+            "pixel_width": 4,
+            "pixel_height": 2,
+        }
+    ):
+        renderer = types.SimpleNamespace(num_plays=0)
+        yield SceneFileWriter(renderer, "FakeScene")
+
+
+def frame(value):
+    return np.full((2, 4, 4), value, dtype="uint8")
+
+
+def test_frames_are_written_in_order(writer, tmp_path):
+    file_path = str(tmp_path / "movie.mp4")
+    writer.open_movie_pipe(file_path=file_path)
+    source = frame(1)
+    writer.queue_frame(source)
+    # The frame was copied, the renderer can draw the next one in place.
+    source[:] = 2
+    writer.queue_frame(source, num_frames=2)
+    writer.queue_frame(frame(2))
+    writer.queue_frame(frame(3))
+    writer.close_movie_pipe()
+
+    pipe = writer.writing_process.stdin
+    assert pipe.frames == [frame(n).tobytes() for n in (1, 2, 2, 2, 3)]
+    assert pipe.closed and writer.writing_process.waited
+    assert writer.repeated_frames == 2
+
+
+def test_static_frames_are_sent_once(writer, tmp_path):
+    writer.open_movie_pipe(file_path=str(tmp_path / "movie.mp4"), static_frames=5)
+    for _ in range(5):
+        writer.queue_frame(frame(1))
+    writer.close_movie_pipe()
+
+    assert writer.writing_process.stdin.frames == [frame(1).tobytes()]
+    assert "tpad=stop_mode=clone:stop=4" in writer.writing_process.command
+    assert writer.repeated_frames == 4
+
+
+def test_queue_blocks_until_ffmpeg_catches_up(writer, tmp_path):
+    writer.open_movie_pipe(file_path=str(tmp_path / "movie.mp4"))
+    pipe = writer.writing_process.stdin
+    pipe.open.clear()
+    num_frames = 2 * writer.frame_queue_size
+    render_thread = threading.Thread(
+        target=lambda: [writer.queue_frame(frame(n)) for n in range(num_frames)]
+    )
+    render_thread.start()
+    time.sleep(0.2)
+    assert render_thread.is_alive()
+    assert writer.max_queued_frames <= writer.frame_queue_size
+
+    pipe.open.set()
+    render_thread.join(timeout=5)
+    assert not render_thread.is_alive()
+    writer.close_movie_pipe()
+    assert pipe.frames == [frame(n).tobytes() for n in range(num_frames)]
+
+
+def test_writer_errors_are_raised(writer, tmp_path):
+    file_path = tmp_path / "movie.mp4"
+    writer.open_movie_pipe(file_path=str(file_path))
+    writer.writing_process.stdin.error = BrokenPipeError()
+    writer.queue_frame(frame(1))
+    writer.queue_frame(frame(2))
+    with pytest.raises(BrokenPipeError):
+        writer.close_movie_pipe()
+
+    # FFMPEG was stopped, and the incomplete movie isn't left in the cache.
+    assert writer.writing_process.stdin.closed
+    assert writer.writing_process.waited
+    assert not file_path.exists()
+    assert not writer.writer_thread.is_alive()
+
+
+def test_cache_hits_are_marked_as_used(writer):
+    cache = writer.partial_movie_cache
+    cached_file = Path(writer.partial_movie_directory, "1234.mp4")
+    cached_file.write_bytes(b"0" * 100)
+    other_file = Path(writer.partial_movie_directory, "5678.mp4")
+    other_file.write_bytes(b"0" * 100)
+    cache.add(cached_file, "FakeScene")
+    time.sleep(0.01)
+    cache.add(other_file, "FakeScene")
+
+    # Another scene cleaning the cache after this one found its file evicts
+    # the other file instead.
+    assert writer.is_already_cached("1234")
+    assert cache.evict(max_bytes=150) == [str(other_file)]
+    assert cached_file.exists()
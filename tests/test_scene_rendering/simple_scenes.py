@@ -28,6 +28,12 @@ class SceneWithMultipleWaitCalls(Scene):
         self.wait(1)
 
 
+class SceneWithRandomSquares(Scene):
+    def construct(self):
+        for _ in range(4):
+            self.play(FadeIn(Square().shift(np.random.random(3))))
+
+
 class NoAnimations(Scene):
     def construct(self):
         dot = Dot().set_color(GREEN)
@@ -1,7 +1,9 @@
 import os
+import subprocess
 from unittest.mock import Mock, patch
 
 from manim import *
+from manim.constants import FFMPEG_BIN
 
 from ..assert_utils import assert_file_exists
 from .simple_scenes import *
@@ -74,3 +76,60 @@ def test_hash_logic_is_called_when_caching_is_enabled(using_temp_config):
         scene = SquareToCircle()
         scene.render()
         mocked.assert_called_once()
+
+
+def test_render_with_workers(using_temp_config):
+    config.workers = 2
+    scene = SceneWithMultipleWaitCalls()
+    scene.render()
+    assert len(scene.renderer.pending_segments) == scene.renderer.num_plays
+    for partial_movie_file in scene.renderer.file_writer.partial_movie_files:
+        assert_file_exists(partial_movie_file)
+    assert_file_exists(config["output_file"])
+
+    # A serial render of the same scene finds all its animations in the cache.
+    config.workers = 1
+    serial_scene = SceneWithMultipleWaitCalls()
+    serial_scene.render()
+    assert serial_scene.renderer.animations_hashes == scene.renderer.animations_hashes
+
+
+def get_frame_digests(movie_file):
+    result = subprocess.run(
+        [FFMPEG_BIN, "-v", "error", "-i", movie_file, "-f", "framemd5", "-"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [line for line in result.stdout.splitlines() if not line.startswith("#")]
+
+
+def test_render_with_workers_draws_the_planned_frames(using_temp_config, tmp_path):
+    config.workers = 2
+    scene = SceneWithRandomSquares()
+    scene.render()
+    # The workers drew the same random squares as the planning.
+    assert scene.random_seed is not None
+
+    # A serial render with the same seed writes the same frames under the
+    # same hashes.
+    config.workers = 1
+    config.media_dir = tmp_path / "serial"
+    serial_scene = SceneWithRandomSquares(random_seed=scene.random_seed)
+    serial_scene.render()
+    files = scene.renderer.file_writer.partial_movie_files
+    serial_files = serial_scene.renderer.file_writer.partial_movie_files
+    assert [os.path.basename(path) for path in serial_files] == [
+        os.path.basename(path) for path in files
+    ]
+    for path, serial_path in zip(files, serial_files):
+        assert get_frame_digests(path) == get_frame_digests(serial_path)
+
+
+def test_split_segments():
+    from manim.renderer.cairo_renderer import _split_segments
+
+    segments = [(i, f"hash_{i}", 1) for i in range(7)]
+    chunks = _split_segments(segments, 3)
+    assert len(chunks) == 3
+    assert [segment for chunk in chunks for segment in chunk] == segments
@@ -1,3 +1,4 @@
+import json
 import sys
 from pathlib import Path
 
@@ -177,6 +178,31 @@ def test_a_flag(tmp_path, manim_cfg_file, infallible_scenes_path):
     ), "running manim with -a flag did not render the second scene"
 
 
+@pytest.mark.slow
+def test_a_flag_with_workers(tmp_path, manim_cfg_file, infallible_scenes_path):
+    command = [
+        sys.executable,
+        "-m",
+        "manim",
+        "-ql",
+        "--media_dir",
+        str(tmp_path),
+        "-a",
+        "--workers",
+        "2",
+        infallible_scenes_path,
+    ]
+    out, err, exit_code = capture(command)
+    assert exit_code == 0, err
+
+    video_dir = tmp_path / "videos" / "infallible_scenes" / "480p15"
+    assert (video_dir / "Wait1.mp4").is_file()
+    assert (video_dir / "Wait2.mp4").is_file()
+    # The render times are recorded to start the longest scenes first next time.
+    render_times = json.loads((video_dir / "render_times.json").read_text())
+    assert set(render_times) == {"Wait1", "Wait2"}
+
+
 @pytest.mark.slow
 def test_custom_folders(tmp_path, manim_cfg_file, simple_scenes_path):
     scene_name = "SquareToCircle"
@@ -0,0 +1,109 @@
+import numpy as np
+
+from manim import Circle, Square, SVGMobject, VMobject, config, tempconfig
+from manim.mobject.svg import svg_mobject
+from manim.mobject.svg.svg_cache import (
+    ParsedSVGCache,
+    get_mobjects_size,
+    parsed_svg_cache,
+)
+
+SVG = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">
+<path d="M 1 1 L 9 1 L 9 9 Z"/>
+<rect x="2" y="2" width="4" height="3"/>
+</svg>
+"""
+
+
+def test_parsed_svg_cache_evicts_least_recently_used():
+    cache = ParsedSVGCache()
+    size = get_mobjects_size([Square()])
+    with tempconfig({"max_svg_cache_bytes": 2 * size}):
+        cache.put("a", [Square()])
+        cache.put("b", [Square()])
+        assert cache.get("a") is not None
+        cache.put("c", [Square()])
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        # Mobjects bigger than the cache aren't stored.
+        cache.put("d", [Circle(num_components=1000)])
+        assert cache.get("d") is None
+    assert (cache.hits, cache.misses) == (3, 2)
+    assert cache.size == 2 * size
+
+
+def test_parsed_svg_cache_returns_copies():
+    cache = ParsedSVGCache()
+    square = Square()
+    cache.put("square", [square])
+    square.shift([1, 0, 0])
+    first, second = cache.get("square")[0], cache.get("square")[0]
+    assert first is not second
+    np.testing.assert_array_equal(first.points, Square().points)
+
+
+def test_svg_mobject_is_parsed_once(tmp_path):
+    svg_file = tmp_path / "shape.svg"
+    svg_file.write_text(SVG)
+    misses = parsed_svg_cache.misses
+    first = SVGMobject(str(svg_file))
+    second = SVGMobject(str(svg_file))
+    assert parsed_svg_cache.misses == misses + 1
+    assert len(first.submobjects) == len(second.submobjects) == 2
+    for mobject, expected in zip(
+        second.family_members_with_points(), first.family_members_with_points()
+    ):
+        np.testing.assert_array_equal(mobject.points, expected.points)
+    assert first.submobjects[0] is not second.submobjects[0]
+
+
+def test_geometry_file_is_used_by_new_processes(tmp_path, monkeypatch):
+    with tempconfig({"media_dir": str(tmp_path)}):
+        tex_dir = config.get_dir("tex_dir")
+        tex_dir.mkdir(parents=True)
+        svg_file = tex_dir / "paths.svg"
+        svg_file.write_text(SVG.replace('<rect x="2" y="2" width="4" height="3"/>', ""))
+        shape_file = tex_dir / "shape.svg"
+        shape_file.write_text(SVG)
+        expected = SVGMobject(str(svg_file))
+        SVGMobject(str(shape_file))
+        # Only files made of paths get a geometry file.
+        assert len(list(tex_dir.glob("paths.svg.*.npz"))) == 1
+        assert len(list(tex_dir.glob("shape.svg.*.npz"))) == 0
+
+        parsed_svg_cache.clear()
+        monkeypatch.setattr(SVGMobject, "get_mobjects_from_file", None)
+        mobject = SVGMobject(str(svg_file))
+    assert len(mobject.submobjects) == len(expected.submobjects) == 1
+    np.testing.assert_array_equal(mobject[0].points, expected[0].points)
+    np.testing.assert_array_equal(mobject[0].fill_rgbas, expected[0].fill_rgbas)
+
+
+def test_path_styles_are_kept_by_mobject(tmp_path, monkeypatch):
+    saved = []
+    monkeypatch.setattr(
+        svg_mobject,
+        "save_geometry",
+        lambda geometry_file, file_path, mobjects, path_styles: saved.append(
+            (mobjects, path_styles)
+        ),
+    )
+    with tempconfig({"media_dir": str(tmp_path)}):
+        tex_dir = config.get_dir("tex_dir")
+        tex_dir.mkdir(parents=True)
+        svg_file = tex_dir / "defs.svg"
+        svg_file.write_text(
+            SVG.replace(
+                "<path",
+                '<defs><path id="unused" d="M 0 0 L 1 1 L 1 0 Z"/></defs><path',
+            )
+        )
+        SVGMobject(str(svg_file))
+    [(mobjects, path_styles)] = saved
+    # The path in <defs> is kept alive along with the other ones, and the
+    # rectangle isn't taken for a path.
+    assert len(path_styles) == 2
+    assert all(isinstance(mobject, VMobject) for mobject in path_styles)
+    rectangle = mobjects[-1]
+    assert rectangle not in path_styles
@@ -0,0 +1,81 @@
+import re
+from pathlib import Path
+
+from manim import tempconfig
+from manim.utils import tex_file_writing
+from manim.utils.tex_file_writing import (
+    prefetch_tex,
+    tex_to_svg_file,
+    tex_to_svg_file_async,
+)
+
+
+def fake_tex_commands(commands):
+    def fake_system(command):
+        commands.append(command)
+        if command.startswith("latex"):
+            tex_file = re.search(r'"([^"]*\.tex)"', command).group(1)
+            Path(tex_file).with_suffix(".dvi").write_text("dvi")
+        elif command.startswith("dvisvgm"):
+            output = re.search(r'-o "([^"]*)"', command).group(1)
+            if "%p" in output:
+                for page in (1, 2):
+                    Path(output.replace("%p", f"{page:02d}")).write_text(f"page {page}")
+            else:
+                Path(output).write_text("svg")
+        return 0
+
+    return fake_system
+
+
+def test_prefetch_tex_typesets_expressions_together(tmp_path, monkeypatch):
+    commands = []
+    monkeypatch.setattr(tex_file_writing.os, "system", fake_tex_commands(commands))
+    with tempconfig({"media_dir": str(tmp_path)}):
+        svg_files = prefetch_tex(["x^2", r"\frac{1}{2}", "x^2"])
+        assert len(commands) == 2
+        assert svg_files[0] == svg_files[2]
+        assert Path(svg_files[0]).read_text() == "page 1"
+        assert Path(svg_files[1]).read_text() == "page 2"
+        batch = re.search(r'"([^"]*\.tex)"', commands[0]).group(1)
+        assert Path(batch).read_text().count(r"\begin{manimpage}") == 2
+
+        # The expressions aren't typeset again.
+        assert tex_to_svg_file("x^2", environment="align*") == svg_files[0]
+        assert prefetch_tex(["x^2", r"\frac{1}{2}"]) == svg_files[:2]
+        assert len(commands) == 2
+
+
+def test_tex_to_svg_file_async(tmp_path, monkeypatch):
+    commands = []
+    monkeypatch.setattr(tex_file_writing.os, "system", fake_tex_commands(commands))
+    with tempconfig({"media_dir": str(tmp_path)}):
+        futures = [tex_to_svg_file_async(f"x^{n}", "align*") for n in (1, 2, 1)]
+        svg_files = [future.result() for future in futures]
+        assert svg_files[0] == svg_files[2] != svg_files[1]
+        assert all(Path(svg_file).exists() for svg_file in svg_files)
+        assert tex_to_svg_file_async("x^2", "align*").result() == svg_files[1]
+    # Each expression was compiled and converted once.
+    assert len(commands) == 4
+
+
+def test_cached_files_are_used_without_lock(tmp_path, monkeypatch):
+    commands = []
+    monkeypatch.setattr(tex_file_writing.os, "system", fake_tex_commands(commands))
+    with tempconfig({"media_dir": str(tmp_path)}):
+        svg_file = tex_to_svg_file("x^3", environment="align*")
+        # The lock files are kept apart from the cache files.
+        tex_dir = Path(svg_file).parent
+        assert sorted(path.name for path in tex_dir.iterdir()) == [
+            ".locks",
+            Path(svg_file).with_suffix(".dvi").name,
+            Path(svg_file).name,
+            Path(svg_file).with_suffix(".tex").name,
+        ]
+
+        def no_lock(file_path):
+            raise AssertionError(f"{file_path} is locked")
+
+        monkeypatch.setattr(tex_file_writing, "cache_file_lock", no_lock)
+        assert tex_to_svg_file("x^3", environment="align*") == svg_file
+    assert len(commands) == 2
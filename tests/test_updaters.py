@@ -0,0 +1,57 @@
+from manim import Mobject
+
+
+def test_updaters_dispatch():
+    """Check that updaters get ``dt`` only if they take it, in their order."""
+    mob = Mobject()
+    calls = []
+    mob.add_updater(lambda m: calls.append("plain"))
+    mob.add_updater(lambda m, dt: calls.append(dt), index=0)
+    mob.update(0.5)
+    assert calls == [0.5, "plain"]
+    assert mob.has_time_based_updater()
+    assert len(mob.get_time_based_updaters()) == 1
+
+    # The updaters are found however the list is changed.
+    calls.clear()
+    mob.updaters.reverse()
+    mob.updaters[0] = lambda m, dt: calls.append(-dt)
+    mob.update(1)
+    assert calls == [-1, 1]
+    mob.updaters[:] = [lambda m: None]
+    assert not mob.has_time_based_updater()
+
+    calls.clear()
+    mob.clear_updaters()
+    mob.add_updater(lambda m: calls.append("plain"), call_updater=True)
+    mob.copy().update(1)
+    assert calls == ["plain", "plain"]
+
+
+def test_family_updaters():
+    """Check that mobjects know whether their families have updaters."""
+    mob, child, gchild = Mobject(), Mobject(), Mobject()
+    mob.add(child)
+    assert not mob.has_family_updaters()
+
+    # Changes deep in the tree reach the ancestors.
+    gchild.add_updater(lambda m: None)
+    child.add(gchild)
+    assert mob.has_family_updaters()
+    gchild.updaters.clear()
+    assert not mob.has_family_updaters()
+    gchild.updaters = [lambda m: None]
+    assert mob.has_family_updaters()
+    child.remove(gchild)
+    assert not mob.has_family_updaters()
+
+    # Mobjects without updaters in their families aren't updated.
+    calls = []
+    child.add_updater(lambda m: calls.append(m))
+    copy = mob.copy()
+    copy.submobjects[0].updating_suspended = True
+    mob.add(Mobject().add(Mobject()))
+    mob.update()
+    copy.update()
+    assert calls == [child]
+    assert copy.has_family_updaters()
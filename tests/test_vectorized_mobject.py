@@ -141,6 +141,39 @@ def test_vmob_add_to_back():
     assert a.submobjects.pop() == o1
 
 
+def test_vgroup_pack_points():
+    """Test that packed VGroups are transformed like unpacked ones."""
+
+    def build():
+        return VGroup(VGroup(Square(), Circle()), Line(), VMobject())
+
+    packed, unpacked = build().pack_points(), build()
+    points = packed.get_packed_points()
+    assert packed.get_all_points() is points
+    assert all(m.points.base is points for m in packed.get_family())
+    assert np.array_equal(
+        packed.get_points_defining_boundary(), unpacked.get_points_defining_boundary()
+    )
+
+    square = packed[0][0]
+    version = square.version
+    for mob in (packed, unpacked):
+        mob.shift([1, 2, 0]).scale(2).rotate(1).stretch(0.5, 1)
+    assert packed.get_packed_points() is points
+    assert square.version != version
+    assert np.allclose(packed.get_all_points(), unpacked.get_all_points())
+
+    # Copies and changed families aren't packed.
+    assert packed.copy().get_packed_points() is None
+    square.points = square.points.copy()
+    assert packed.get_packed_points() is None
+    packed.pack_points()
+    packed.add(Square())
+    assert packed.get_packed_points() is None
+    packed.shift([1, 0, 0])
+    assert np.allclose(square.points, unpacked[0][0].points + [1, 0, 0])
+
+
 def test_vdict_init():
     """Test the VDict instantiation."""
     # Test empty VDict
@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from manim.utils.worker_pool import WorkerPool
+
+forked_pool = WorkerPool(max_workers=1)
+
+
+def submit_to_forked_pool(name):
+    return forked_pool.submit(f"{name}.svg", str.upper, name).result(timeout=10)
+
+
+def test_running_jobs_are_not_submitted_twice():
+    pool = WorkerPool(max_workers=2)
+    release = threading.Event()
+    calls = []
+
+    def job(name):
+        calls.append(name)
+        release.wait()
+        return name
+
+    first = pool.submit("a.svg", job, "a")
+    assert pool.submit("a.svg", job, "a") is first
+    assert pool.get("a.svg") is first
+    other = pool.submit("b.svg", job, "b")
+    release.set()
+    assert (first.result(), other.result()) == ("a", "b")
+    assert sorted(calls) == ["a", "b"]
+    assert pool.get("a.svg") is None
+    # Finished jobs run again, the caller checks whether the file exists.
+    assert pool.submit("a.svg", job, "a").result() == "a"
+    assert len(calls) == 3
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork")
+def test_pools_are_reset_in_forked_processes():
+    # The parent started the threads of the pool, and has a job in flight.
+    release = threading.Event()
+    running = forked_pool.submit("a.svg", release.wait)
+    context = multiprocessing.get_context("fork")
+    try:
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            assert executor.submit(submit_to_forked_pool, "a").result() == "A"
+    finally:
+        release.set()
+    assert running.result() is True